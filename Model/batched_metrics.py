@@ -0,0 +1,44 @@
+# batched_metrics.py
+import numpy as np
+
+def batched_confusion(y_true, preds, n_classes):
+    """
+    Confusion matrices for a batch of prediction vectors in one bincount.
+
+    y_true: (n_samples,) int labels in [0, n_classes).
+    preds: (n_batch, n_samples) int predictions.
+    Returns (n_batch, n_classes, n_classes) counts indexed [batch, true, pred].
+    """
+    preds = np.asarray(preds)
+    y_true = np.asarray(y_true)
+    n_batch = preds.shape[0]
+    offsets = np.arange(n_batch)[:, None] * n_classes * n_classes
+    flat = offsets + y_true[None, :] * n_classes + preds
+    counts = np.bincount(flat.ravel(), minlength=n_batch * n_classes * n_classes)
+    return counts.reshape(n_batch, n_classes, n_classes)
+
+def weighted_recall_f1(confusion):
+    """
+    Support-weighted recall and F1 per batch entry, matching sklearn's
+    average='weighted' with zero_division=0.
+    """
+    tp = np.diagonal(confusion, axis1=1, axis2=2).astype(float)
+    support = confusion.sum(axis=2)
+    predicted = confusion.sum(axis=1)
+    n_samples = support.sum(axis=1)
+
+    # Weighted recall reduces to accuracy: sum_c (support_c / n) * (tp_c / support_c)
+    recall = tp.sum(axis=1) / n_samples
+    with np.errstate(invalid='ignore', divide='ignore'):
+        f1 = np.where(support + predicted > 0, 2 * tp / (support + predicted), 0.0)
+    f1 = (f1 * support).sum(axis=1) / n_samples
+    return recall, f1
+
+def threshold_predictions(probas, thresholds):
+    """
+    Class predictions for many per-class threshold vectors at once.
+
+    probas: (n_samples, n_classes); thresholds: (n_batch, n_classes).
+    Returns (n_batch, n_samples) argmax of probas / thresholds.
+    """
+    return np.argmax(probas[None, :, :] / thresholds[:, None, :], axis=2)
@@ -1,3 +1,21 @@
+import os
+
 SEED = 42
 N_TRIALS = 100
-CSV_FILE = "results.csv"
\ No newline at end of file
+CSV_FILE = "results.csv"
+CSV_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "data", "final_processed_data.csv")
+# Total CPU cores the tuning orchestrator may use (processes x model threads)
+CPU_BUDGET = os.cpu_count() or 1
+# Optuna pruner used by the tuners: median | percentile | sha | hyperband | none
+PRUNER = "median"
+STUDY_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "optuna_studies")
+# Local model registry (tuned models, thresholds, encoder mappings, Optuna studies)
+REGISTRY_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "registry")
+# Encoder mappings written by the preprocessing step
+PREPROCESS_STATE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "data", "preprocess_state.json")
+
+# Cross-validated tuning: default folds (cv_engine) and parallel fold workers (1 = in-process)
+CV_FOLDS = 5
+CV_JOBS = 1
+# Cached learning-curve scores (see learning_curve_service.py)
+LEARNING_CURVE_DIR = os.path.join(STUDY_DIR, "learning_curves")
@@ -0,0 +1,154 @@
+# cv_engine.py
+import hashlib
+import os
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import contextmanager
+
+import numpy as np
+import optuna
+import pandas as pd
+from sklearn.base import clone
+from sklearn.metrics import f1_score
+from sklearn.model_selection import StratifiedKFold
+from config import SEED, STUDY_DIR, CV_FOLDS
+
+FOLD_CACHE_DIR = os.path.join(STUDY_DIR, "folds")
+
+def stratified_folds(y, n_splits=CV_FOLDS, random_state=SEED, cache_dir=FOLD_CACHE_DIR):
+    """
+    Stratified (train_idx, val_idx) pairs for `y`, computed once and cached on disk
+    under a hash of the labels and split settings.
+    """
+    y = np.asarray(y)
+    key = hashlib.sha256(y.tobytes() + str((y.dtype.str, n_splits, random_state)).encode()).hexdigest()[:16]
+    path = os.path.join(cache_dir, f"{key}.npz") if cache_dir else None
+    if path and os.path.exists(path):
+        cached = np.load(path)
+        return [(cached[f"train_{i}"], cached[f"val_{i}"]) for i in range(n_splits)]
+
+    splitter = StratifiedKFold(n_splits=n_splits, shuffle=True, random_state=random_state)
+    folds = list(splitter.split(np.zeros(len(y)), y))
+    if path:
+        os.makedirs(cache_dir, exist_ok=True)
+        arrays = {}
+        for i, (train_idx, val_idx) in enumerate(folds):
+            arrays[f"train_{i}"], arrays[f"val_{i}"] = train_idx, val_idx
+        np.savez(path, **arrays)
+    return folds
+
+def _share_dir():
+    # /dev/shm is RAM-backed on Linux; elsewhere fall back to the temp directory
+    return tempfile.mkdtemp(prefix="cv_", dir="/dev/shm" if os.path.isdir("/dev/shm") else None)
+
+# Per-worker state, set once by the pool initializer
+_X = _y = _folds = None
+
+def _init_worker(x_path, y_path, folds):
+    global _X, _y, _folds
+    # Copy-on-write maps: pages are shared with the parent, estimators may still write
+    _X = np.load(x_path, mmap_mode='c')
+    _y = np.load(y_path, mmap_mode='c')
+    _folds = folds
+
+def _fit_fold(model, fold, eval_set, fit_params, X=None, y=None, folds=None):
+    X = _X if X is None else X
+    y = _y if y is None else y
+    train_idx, val_idx = (_folds if folds is None else folds)[fold]
+    model = clone(model)
+    fit_params = dict(fit_params or {})
+    if eval_set:
+        fit_params['eval_set'] = [(X[val_idx], y[val_idx])]
+    model.fit(X[train_idx], y[train_idx], **fit_params)
+    return fold, f1_score(y[val_idx], model.predict(X[val_idx]), average='weighted')
+
+class CVEngine:
+    """
+    Stratified k-fold scoring for Optuna objectives.
+
+    Fold indices are computed once (and cached on disk). With `n_jobs > 1` the
+    feature matrix and labels are written once to RAM-backed memory-mapped files,
+    and a process pool that lives as long as the engine maps them in its
+    initializer. Each trial then only sends the unfitted estimator and a fold
+    number, and its folds are fitted in parallel. The running mean F1 is reported
+    to the trial after each fold so the study's pruner can stop it early.
+    Use as a context manager so the pool and shared files are cleaned up.
+    """
+
+    def __init__(self, X, y, n_splits=CV_FOLDS, n_jobs=1, random_state=SEED, cache_dir=FOLD_CACHE_DIR):
+        self.columns = list(X.columns) if isinstance(X, pd.DataFrame) else None
+        self.X = np.ascontiguousarray(X)
+        self.y = np.ascontiguousarray(y)
+        self.n_splits = n_splits
+        self.n_jobs = max(1, min(n_jobs, n_splits))
+        self.folds = stratified_folds(self.y, n_splits, random_state, cache_dir)
+        self._pool = None
+        self._share = None
+
+    def __enter__(self):
+        if self.n_jobs > 1:
+            self._share = _share_dir()
+            x_path = os.path.join(self._share, "X.npy")
+            y_path = os.path.join(self._share, "y.npy")
+            np.save(x_path, self.X)
+            np.save(y_path, self.y)
+            self._pool = ProcessPoolExecutor(max_workers=self.n_jobs, initializer=_init_worker,
+                                             initargs=(x_path, y_path, self.folds))
+        return self
+
+    def __exit__(self, *exc):
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
+        if self._share is not None:
+            shutil.rmtree(self._share, ignore_errors=True)
+            self._share = None
+
+    def _fold_scores(self, model, eval_set, fit_params):
+        if self._pool is None:
+            for fold in range(self.n_splits):
+                yield _fit_fold(model, fold, eval_set, fit_params, self.X, self.y, self.folds)
+            return
+        futures = [self._pool.submit(_fit_fold, model, fold, eval_set, fit_params) for fold in range(self.n_splits)]
+        try:
+            for future in as_completed(futures):
+                yield future.result()
+        finally:
+            for future in futures:
+                future.cancel()
+
+    def evaluate(self, model, trial=None, eval_set=False, fit_params=None):
+        """
+        Mean weighted F1 of an unfitted `model` over the folds.
+
+        eval_set: pass the fold's validation data as `eval_set` to fit (early stopping).
+        fit_params: extra keyword arguments for fit.
+        Raises optuna.TrialPruned when the trial's pruner stops it.
+        """
+        scores = []
+        for _, score in self._fold_scores(model, eval_set, fit_params):
+            scores.append(score)
+            if trial is not None:
+                trial.report(float(np.mean(scores)), len(scores) - 1)
+                if len(scores) < self.n_splits and trial.should_prune():
+                    raise optuna.TrialPruned()
+        return float(np.mean(scores))
+
+    def refit(self, model, fit_params=None):
+        """Fit a clone of `model` on all the engine's data (feature names preserved)."""
+        X = pd.DataFrame(self.X, columns=self.columns) if self.columns is not None else self.X
+        return clone(model).fit(X, self.y, **(fit_params or {}))
+
+@contextmanager
+def cv_engine(X_train, y_train, X_dev, y_dev, n_splits=None, n_jobs=1):
+    """
+    CVEngine over train + dev when `n_splits` is set, else None (hold-out dev scoring).
+    """
+    if not n_splits:
+        yield None
+        return
+    X = pd.concat([X_train, X_dev]) if isinstance(X_train, pd.DataFrame) else np.vstack([X_train, X_dev])
+    y = np.concatenate([np.asarray(y_train), np.asarray(y_dev)])
+    with CVEngine(X, y, n_splits, n_jobs) as engine:
+        yield engine
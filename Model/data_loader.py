@@ -1,10 +1,17 @@
 # data_loader.py
-import pandas as pd
+import os
+import sys
 from sklearn.model_selection import train_test_split
 from config import SEED, CSV_PATH
 
-def load_and_split_data():
-    df = pd.read_csv(CSV_PATH)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from src.preprocess.schema import FINAL_SCHEMA, read_dataset, memory_report
+
+def load_and_split_data(verbose=True):
+    # int8 codes, validated against the declared schema
+    df = read_dataset(CSV_PATH, FINAL_SCHEMA)
+    if verbose:
+        memory_report(df, os.path.basename(CSV_PATH))
     X = df.drop(columns=['target'])
     y = df['target']
 
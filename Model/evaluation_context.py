@@ -0,0 +1,59 @@
+# evaluation_context.py
+import os
+import sys
+import numpy as np
+import pandas as pd
+from thresholded_classifier import ThresholdedClassifier
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from src.preprocess.step_cache import hash_bytes, hash_frame
+
+def dataset_fingerprint(X):
+    """Content hash of a feature matrix (DataFrame or array)."""
+    if isinstance(X, pd.DataFrame):
+        return hash_frame(X)
+    X = np.ascontiguousarray(X)
+    return hash_bytes(X.tobytes(), list(X.shape), str(X.dtype))
+
+class EvaluationContext:
+    """
+    Memoized model outputs for one evaluation report.
+
+    Outputs are keyed by (model, dataset fingerprint), so every plot and metric
+    fed from the same context reuses a single inference pass per model and
+    dataset. Predictions of a ThresholdedClassifier are derived from its base
+    model's cached probabilities rather than running the model again. The
+    context holds a reference to each model it has seen, so keys stay valid for
+    its lifetime; `passes` counts the inference calls actually made.
+    """
+
+    def __init__(self):
+        self._outputs = {}
+        self.passes = 0
+
+    def _memoized(self, model, X, method):
+        key = (id(model), method, dataset_fingerprint(X))
+        if key not in self._outputs:
+            self.passes += 1
+            self._outputs[key] = (model, getattr(model, method)(X))
+        return self._outputs[key][1]
+
+    def predict_proba(self, model, X):
+        if isinstance(model, ThresholdedClassifier):
+            return model.adjust(self.predict_proba(model.model, X))
+        return self._memoized(model, X, 'predict_proba')
+
+    def predict(self, model, X):
+        if isinstance(model, ThresholdedClassifier):
+            probas = self.predict_proba(model.model, X)
+            return model.classes_[np.argmax(probas / model.thresholds, axis=1)]
+        return self._memoized(model, X, 'predict')
+
+    def __setstate__(self, state):
+        # Keys hold object ids, which change when the context is sent to another process
+        self.__dict__.update(state)
+        self._outputs = {(id(model), method, fingerprint): (model, output)
+                         for (_, method, fingerprint), (model, output) in self._outputs.items()}
+
+    def clear(self):
+        self._outputs.clear()
@@ -0,0 +1,200 @@
+# learning_curve_service.py
+import json
+import os
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+
+import joblib
+import numpy as np
+from sklearn.base import clone
+from sklearn.metrics import get_scorer
+from config import SEED, LEARNING_CURVE_DIR
+from cv_engine import stratified_folds, _share_dir
+from evaluation_context import dataset_fingerprint
+
+# Largest training subset fitted by default, and rows scored per point (0/None = all)
+MAX_TRAIN_SIZE = 200_000
+MAX_EVAL_ROWS = 50_000
+
+def train_size_schedule(n_train, train_sizes=np.linspace(0.1, 1.0, 5), max_train_size=MAX_TRAIN_SIZE):
+    """
+    Absolute, increasing training-subset sizes.
+
+    `train_sizes` are fractions of the fold's training rows (floats <= 1) or
+    absolute counts, as in sklearn's learning_curve. When the largest size would
+    exceed `max_train_size`, the whole schedule is scaled down so that it ends at
+    the cap: million-row datasets keep the same number of points and the same
+    relative spacing without fitting on all rows.
+    """
+    sizes = np.asarray(train_sizes)
+    if np.issubdtype(sizes.dtype, np.floating) and sizes.max() <= 1.0:
+        sizes = np.floor(sizes * n_train)
+    sizes = np.clip(sizes.astype(np.int64), 1, n_train)
+    if max_train_size and sizes.max() > max_train_size:
+        sizes = np.maximum(1, np.floor(sizes * (max_train_size / sizes.max()))).astype(np.int64)
+    return np.unique(sizes)
+
+def _subsample(rng, idx, max_rows):
+    return idx if not max_rows or len(idx) <= max_rows else np.sort(rng.choice(idx, max_rows, replace=False))
+
+def _warm_fit(model, previous, X, y, warm_start_rounds):
+    """Continue boosting from `previous` (fitted on a smaller nested subset) for a few rounds."""
+    name = type(model).__name__
+    if name == 'LGBMClassifier':
+        return model.set_params(n_estimators=warm_start_rounds).fit(X, y, init_model=previous.booster_)
+    if name == 'CatBoostClassifier':
+        return model.set_params(iterations=warm_start_rounds).fit(X, y, init_model=previous)
+    raise ValueError(f"Warm start is only supported for LightGBM and CatBoost, not {name}")
+
+# Per-worker data, mapped once by the pool initializer
+_X = _y = None
+
+def _init_worker(x_path, y_path):
+    global _X, _y
+    _X = np.load(x_path, mmap_mode='c')
+    _y = np.load(y_path, mmap_mode='c')
+
+def _fold_curve(estimator, scoring, train_idx, val_idx, sizes, random_state, max_eval_rows,
+                warm_start_rounds=None, X=None, y=None):
+    """
+    Train/validation scores of one fold at every size. Subsets are nested (prefixes
+    of one shuffle of the fold's training rows), which is what makes warm start valid.
+    """
+    X = _X if X is None else X
+    y = _y if y is None else y
+    rng = np.random.default_rng(random_state)
+    order = rng.permutation(train_idx)
+    scorer = get_scorer(scoring)
+    val_idx = _subsample(rng, val_idx, max_eval_rows)
+
+    scores, previous = [], None
+    for size in sizes:
+        subset = np.sort(order[:size])
+        model = clone(estimator)
+        # Boosters can only be continued when the smaller subset already saw every class
+        if warm_start_rounds and previous is not None and np.array_equal(previous.classes_, np.unique(y[subset])):
+            model = _warm_fit(model, previous, X[subset], y[subset], warm_start_rounds)
+        else:
+            model.fit(X[subset], y[subset])
+        scored_train = _subsample(rng, subset, max_eval_rows)
+        scores.append((float(scorer(model, X[scored_train], y[scored_train])),
+                       float(scorer(model, X[val_idx], y[val_idx]))))
+        previous = model
+    return scores
+
+class LearningCurveService:
+    """
+    Learning curves with an on-disk score cache and a bounded process pool.
+
+    Every (estimator params, dataset, fold, size, scoring) point is cached as a
+    small JSON file under `cache_dir`, so repeated plots only fit the points that
+    are missing. Folds come from cv_engine.stratified_folds (also cached); the
+    missing folds are fitted on at most `n_jobs` processes that memory-map one
+    shared copy of the data. Sizes follow train_size_schedule, and training and
+    validation scores use at most `max_eval_rows` rows each.
+
+    With `warm_start=True`, LightGBM/CatBoost fits at each size continue from the
+    model of the previous (smaller, nested) subset and add `warm_start_rounds`
+    (default a quarter of the model's rounds) instead of training from scratch.
+    The previous model first has to score the new subset, so the saving comes
+    from the rounds not trained; the result approximates a cold fit, hence it is
+    off by default and part of the cache key. Sizes whose smaller subset missed
+    a class are fitted cold.
+    """
+
+    def __init__(self, cache_dir=LEARNING_CURVE_DIR, n_jobs=1, max_train_size=MAX_TRAIN_SIZE,
+                 max_eval_rows=MAX_EVAL_ROWS, warm_start=False, warm_start_rounds=None, random_state=SEED):
+        self.cache_dir = cache_dir
+        self.n_jobs = n_jobs if n_jobs and n_jobs > 0 else (os.cpu_count() or 1)
+        self.max_train_size = max_train_size
+        self.max_eval_rows = max_eval_rows
+        self.warm_start = warm_start
+        self.warm_start_rounds = warm_start_rounds
+        self.random_state = random_state
+
+    def _rounds(self, estimator):
+        if not self.warm_start:
+            return None
+        if self.warm_start_rounds:
+            return self.warm_start_rounds
+        params = estimator.get_params()
+        total = params.get('n_estimators') or params.get('iterations') or 100
+        return max(1, total // 4)
+
+    def _path(self, *parts):
+        return os.path.join(self.cache_dir, f"{joblib.hash(parts)}.json")
+
+    def _load(self, path):
+        if not path or not os.path.exists(path):
+            return None
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+
+    def _store(self, path, train_score, test_score):
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'train': train_score, 'test': test_score}, f)
+        os.replace(tmp_path, path)
+
+    def compute(self, estimator, X, y, train_sizes=np.linspace(0.1, 1.0, 5), cv=5, scoring='f1_weighted'):
+        """
+        Same outputs as sklearn's learning_curve: (train_sizes_abs, train_scores,
+        test_scores), the scores shaped (n_sizes, n_folds). `cv` is a number of
+        stratified folds or a splitter object.
+        """
+        data_key = (dataset_fingerprint(X), dataset_fingerprint(np.asarray(y)))
+        X = np.ascontiguousarray(X)
+        y = np.ascontiguousarray(y)
+        if isinstance(cv, int):
+            folds = stratified_folds(y, n_splits=cv, random_state=self.random_state)
+        else:
+            folds = list(cv.split(X, y))
+        sizes = train_size_schedule(min(len(train) for train, _ in folds), train_sizes, self.max_train_size)
+        rounds = self._rounds(estimator)
+
+        params = {name: repr(value) for name, value in estimator.get_params().items()}
+        base_key = (type(estimator).__name__, params, data_key, scoring, rounds,
+                    self.max_eval_rows, self.random_state)
+        if self.cache_dir:
+            os.makedirs(self.cache_dir, exist_ok=True)
+        paths, scores, missing = {}, {}, []
+        for fold, (train_idx, _) in enumerate(folds):
+            fold_key = joblib.hash(train_idx)
+            for size in sizes:
+                paths[fold, size] = self._path(base_key, fold_key, int(size)) if self.cache_dir else None
+                cached = self._load(paths[fold, size])
+                if cached is not None:
+                    scores[fold, size] = (cached['train'], cached['test'])
+            # Nested subsets: a fold with any missing point is refitted along its whole schedule
+            if any((fold, size) not in scores for size in sizes):
+                missing.append(fold)
+
+        def job_args(fold):
+            train_idx, val_idx = folds[fold]
+            return (estimator, scoring, train_idx, val_idx, sizes, self.random_state + fold,
+                    self.max_eval_rows, rounds)
+
+        n_workers = min(self.n_jobs, len(missing))
+        if n_workers <= 1:
+            results = [_fold_curve(*job_args(fold), X=X, y=y) for fold in missing]
+        else:
+            share = _share_dir()
+            try:
+                x_path, y_path = os.path.join(share, "X.npy"), os.path.join(share, "y.npy")
+                np.save(x_path, X)
+                np.save(y_path, y)
+                with ProcessPoolExecutor(max_workers=n_workers, initializer=_init_worker,
+                                         initargs=(x_path, y_path)) as pool:
+                    results = list(pool.map(_fold_curve, *zip(*[job_args(fold) for fold in missing])))
+            finally:
+                shutil.rmtree(share, ignore_errors=True)
+
+        for fold, fold_scores in zip(missing, results):
+            for size, (train_score, test_score) in zip(sizes, fold_scores):
+                scores[fold, size] = (train_score, test_score)
+                if paths[fold, size]:
+                    self._store(paths[fold, size], train_score, test_score)
+
+        train_scores = np.array([[scores[fold, size][0] for fold in range(len(folds))] for size in sizes])
+        test_scores = np.array([[scores[fold, size][1] for fold in range(len(folds))] for size in sizes])
+        return sizes, train_scores, test_scores
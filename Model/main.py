@@ -1,28 +1,56 @@
 # main.py
+import os
 from data_loader import load_and_split_data
 from tuning_models import optimize_svc
 from threshold_tuning import optimize_svm_threshold_recall
+from thresholded_classifier import ThresholdedClassifier
+from model_registry import ModelRegistry, load_encoder_mappings
+from evaluation_context import EvaluationContext
 from visualization import plot_log_loss_vs_threshold_multiclass_all_in_one, plot_multiclass_roc_auc, plot_multiclass_det, plot_learning_curve
 from sklearn.metrics import recall_score, f1_score
 
 X_train, X_dev, X_test, y_train, y_dev, y_test, df = load_and_split_data()
 
-model, thresholds, recall = optimize_svm_threshold_recall(X_train, y_train, X_dev, y_dev)
+MODEL_NAME = 'svc_threshold_recall'
+registry = ModelRegistry()
 
-# Apply to test set
-probas = model.predict_proba(X_test)
-adjusted_preds = []
-for row in probas:
-    adjusted = row / thresholds
-    adjusted = adjusted / sum(adjusted)
-    pred = np.argmax(adjusted)
-    adjusted_preds.append(pred)
+# Reuse the latest registered model unless RETUNE=1; retuning resumes the stored study
+if registry.latest_version(MODEL_NAME) is not None and os.getenv('RETUNE') != '1':
+    classifier, metadata = registry.load(MODEL_NAME)
+    model = classifier.model
+    print(f"📦 Loaded {MODEL_NAME} v{metadata['version']} from the registry")
+else:
+    model, thresholds, recall = optimize_svm_threshold_recall(X_train, y_train, X_dev, y_dev,
+                                                              storage=registry.study_storage(MODEL_NAME),
+                                                              study_name=MODEL_NAME)
+    classifier = ThresholdedClassifier(model, thresholds)
+    registry.save(MODEL_NAME, classifier, encoder_mappings=load_encoder_mappings(),
+                  metrics={'dev_recall': float(recall)}, study_name=MODEL_NAME)
+
+# One SVC probability pass on the test set, shared by the metrics and every plot
+context = EvaluationContext()
+adjusted_preds = context.predict(classifier, X_test)
 
 print("📌 Recall (test):", recall_score(y_test, adjusted_preds, average='weighted'))
 print("📌 F1-score (test):", f1_score(y_test, adjusted_preds, average='weighted'))
 
-# Visualization
-plot_log_loss_vs_threshold_multiclass_all_in_one(model, X_test, y_test)
-plot_multiclass_roc_auc(model, X_test, y_test, sorted(df['target'].unique()))
-plot_multiclass_det(model, X_test, y_test, sorted(df['target'].unique()))
-plot_learning_curve(model, df.drop(columns=['target']), df['target'], scoring='f1_weighted')
+# Visualization: interactive by default, headless PNG/HTML artifacts when REPORT_DIR is set
+class_names = sorted(df['target'].unique())
+report_dir = os.getenv('REPORT_DIR')
+if report_dir:
+    from utils.report_renderer import ReportRenderer
+    # The context already holds the test probabilities, so the workers do not run the SVC again
+    renderer = ReportRenderer(os.path.join(report_dir, 'model'))
+    (renderer
+     .add('log_loss_vs_threshold', plot_log_loss_vs_threshold_multiclass_all_in_one, model, X_test, y_test,
+          context=context)
+     .add('roc_auc', plot_multiclass_roc_auc, model, X_test, y_test, class_names, context=context)
+     .add('det', plot_multiclass_det, model, X_test, y_test, class_names, context=context)
+     .add('learning_curve', plot_learning_curve, model, df.drop(columns=['target']), df['target'],
+          scoring='f1_weighted', n_jobs=renderer.jobs_per_figure)
+     .render())
+else:
+    plot_log_loss_vs_threshold_multiclass_all_in_one(model, X_test, y_test, context=context)
+    plot_multiclass_roc_auc(model, X_test, y_test, class_names, context=context)
+    plot_multiclass_det(model, X_test, y_test, class_names, context=context)
+    plot_learning_curve(model, df.drop(columns=['target']), df['target'], scoring='f1_weighted')
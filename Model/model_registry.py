@@ -0,0 +1,96 @@
+# model_registry.py
+import json
+import os
+import time
+import joblib
+from config import REGISTRY_DIR, PREPROCESS_STATE_PATH
+from study_storage import journal_storage
+
+def load_encoder_mappings(state_path=PREPROCESS_STATE_PATH):
+    """Gender/major mappings saved by the preprocessing step, or None if it has not run."""
+    if not os.path.exists(state_path):
+        return None
+    with open(state_path, encoding='utf-8') as f:
+        state = json.load(f)
+    return {'gender_mapping': state['gender_mapping'], 'major_mapping': state['major_mapping']}
+
+class ModelRegistry:
+    """
+    Versioned local store of tuned models.
+
+    Each version lives in `<root>/<name>/v<N>/` with the estimator as an
+    uncompressed joblib file (its NumPy arrays are memory-mapped copy-on-write on
+    load, so a scoring process starts without reading them) and a `metadata.json` with the
+    thresholds, encoder mappings and metrics. The Optuna study of a model name is
+    kept in a journal file shared by all its versions so tuning can be resumed.
+    """
+
+    MODEL_FILE = 'model.joblib'
+    METADATA_FILE = 'metadata.json'
+
+    def __init__(self, root=REGISTRY_DIR):
+        self.root = root
+
+    def _model_dir(self, name):
+        return os.path.join(self.root, name)
+
+    def versions(self, name):
+        model_dir = self._model_dir(name)
+        if not os.path.isdir(model_dir):
+            return []
+        return sorted(int(entry[1:]) for entry in os.listdir(model_dir)
+                      if entry.startswith('v') and entry[1:].isdigit()
+                      and os.path.exists(os.path.join(model_dir, entry, self.METADATA_FILE)))
+
+    def latest_version(self, name):
+        versions = self.versions(name)
+        return versions[-1] if versions else None
+
+    def study_storage(self, name):
+        """Journal storage for the model's Optuna study (pass with `study_name=name`)."""
+        os.makedirs(self._model_dir(name), exist_ok=True)
+        return journal_storage(os.path.join(self._model_dir(name), 'study.log'))
+
+    def save(self, name, classifier, encoder_mappings=None, metrics=None, study_name=None):
+        """
+        Store a ThresholdedClassifier as a new version and return its number.
+
+        Parameters:
+        name (str): Model name in the registry.
+        classifier (ThresholdedClassifier): Fitted model with its thresholds.
+        encoder_mappings (dict): gender/major mappings used to encode the features.
+        metrics (dict): Scores to keep alongside the model.
+        study_name (str): Name of the Optuna study in `study_storage(name)`.
+        """
+        version = (self.latest_version(name) or 0) + 1
+        version_dir = os.path.join(self._model_dir(name), f"v{version}")
+        os.makedirs(version_dir, exist_ok=True)
+
+        joblib.dump(classifier, os.path.join(version_dir, self.MODEL_FILE))
+        metadata = {
+            'name': name,
+            'version': version,
+            'created_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'model_class': type(classifier.model).__name__,
+            'classes': [int(c) for c in classifier.classes_],
+            'thresholds': [float(t) for t in classifier.thresholds],
+            'encoder_mappings': encoder_mappings,
+            'metrics': metrics or {},
+            'study_name': study_name,
+        }
+        # Metadata last: a version only becomes visible once it is complete
+        with open(os.path.join(version_dir, self.METADATA_FILE), 'w', encoding='utf-8') as f:
+            json.dump(metadata, f, ensure_ascii=False, indent=2)
+        print(f"💾 Saved {name} v{version} to {version_dir}")
+        return version
+
+    def load(self, name, version=None, mmap_mode='c'):
+        """Return (classifier, metadata) of `version` (latest by default)."""
+        version = version or self.latest_version(name)
+        if version is None:
+            raise FileNotFoundError(f"No saved versions of '{name}' in {self.root}")
+        version_dir = os.path.join(self._model_dir(name), f"v{version}")
+        with open(os.path.join(version_dir, self.METADATA_FILE), encoding='utf-8') as f:
+            metadata = json.load(f)
+        classifier = joblib.load(os.path.join(version_dir, self.MODEL_FILE), mmap_mode=mmap_mode)
+        return classifier, metadata
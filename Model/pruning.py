@@ -0,0 +1,98 @@
+# pruning.py
+import optuna
+from sklearn.model_selection import train_test_split
+from config import SEED, PRUNER
+
+# Training-set fractions for successive halving of SVC/KNN/Tree trials
+SUBSET_FRACTIONS = (0.25, 0.5, 1.0)
+
+PRUNERS = {
+    'median': lambda: optuna.pruners.MedianPruner(n_startup_trials=5, n_warmup_steps=0),
+    'percentile': lambda: optuna.pruners.PercentilePruner(25.0, n_startup_trials=5),
+    'sha': lambda: optuna.pruners.SuccessiveHalvingPruner(),
+    'hyperband': lambda: optuna.pruners.HyperbandPruner(),
+    'none': lambda: optuna.pruners.NopPruner(),
+}
+
+def make_pruner(pruner=None):
+    """Return an Optuna pruner from a name in PRUNERS (default: config.PRUNER) or pass one through."""
+    if pruner is None:
+        pruner = PRUNER
+    if isinstance(pruner, str):
+        if pruner not in PRUNERS:
+            raise ValueError(f"Unknown pruner '{pruner}'. Use one of: {', '.join(PRUNERS)}")
+        return PRUNERS[pruner]()
+    return pruner
+
+def _subset(X, y, fraction):
+    if fraction >= 1.0:
+        return X, y
+    try:
+        X_sub, _, y_sub, _ = train_test_split(X, y, train_size=fraction, stratify=y, random_state=SEED)
+    except ValueError:
+        # Too few samples of some class to stratify
+        X_sub, _, y_sub, _ = train_test_split(X, y, train_size=fraction, random_state=SEED)
+    return X_sub, y_sub
+
+def fit_with_subset_halving(trial, make_model, X_train, y_train, X_dev, y_dev, score,
+                            fractions=SUBSET_FRACTIONS):
+    """
+    Fit on growing training subsets, reporting the dev score after each one.
+
+    `make_model(final)` builds a fresh estimator; `final` is True only for the full
+    training set, so expensive extras (e.g. SVC probability calibration) can be
+    skipped on the intermediate rungs. `score(model)` returns the dev metric.
+    Raises optuna.TrialPruned as soon as the pruner rejects the trial.
+
+    Returns:
+        (model, value) for the full training set.
+    """
+    if isinstance(trial.study.pruner, optuna.pruners.NopPruner):
+        # Nothing can be pruned: skip the intermediate rungs
+        fractions = fractions[-1:]
+    for step, fraction in enumerate(fractions):
+        final = step == len(fractions) - 1
+        X_sub, y_sub = _subset(X_train, y_train, fraction)
+        model = make_model(final)
+        model.fit(X_sub, y_sub)
+        value = score(model)
+        trial.report(value, step)
+        if not final and trial.should_prune():
+            raise optuna.TrialPruned()
+    return model, value
+
+class LightGBMPruningCallback:
+    """LightGBM callback reporting the (negated) validation loss every `report_every` iterations."""
+
+    def __init__(self, trial, report_every=10):
+        self.trial = trial
+        self.report_every = report_every
+
+    def __call__(self, env):
+        if (env.iteration + 1) % self.report_every:
+            return
+        _, _, value, is_higher_better = env.evaluation_result_list[0]
+        self.trial.report(value if is_higher_better else -value, env.iteration)
+        if self.trial.should_prune():
+            raise optuna.TrialPruned()
+
+class CatBoostPruningCallback:
+    """CatBoost callback; stops training when pruned, call `check_pruned()` after fit."""
+
+    def __init__(self, trial, metric='MultiClass', report_every=10):
+        self.trial = trial
+        self.metric = metric
+        self.report_every = report_every
+        self.pruned = False
+
+    def after_iteration(self, info):
+        if (info.iteration + 1) % self.report_every:
+            return True
+        value = info.metrics['validation'][self.metric][-1]
+        self.trial.report(-value, info.iteration)
+        self.pruned = self.trial.should_prune()
+        return not self.pruned
+
+    def check_pruned(self):
+        if self.pruned:
+            raise optuna.TrialPruned()
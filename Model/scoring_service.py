@@ -0,0 +1,163 @@
+# scoring_service.py
+# Usage: python scoring_service.py --port 8000
+import argparse
+import asyncio
+import json
+import os
+import sys
+import warnings
+import joblib
+import numpy as np
+from model_registry import ModelRegistry
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from src.preprocess.online import featurize_response
+from src.preprocess.encode_data import FeatureEncoder
+
+MODEL_NAME = 'svc_threshold_recall'
+MAX_BATCH = 64
+MAX_WAIT_MS = 0.0
+
+class ScoringService:
+    """
+    Scores single survey responses with a model loaded once from the registry.
+
+    Concurrent requests are micro-batched: each request's feature vector is queued
+    and a single batcher task scores up to `max_batch` queued vectors with one
+    `predict_proba` call. With the default `max_wait_ms=0` it takes whatever queued
+    up while the previous batch was scored; a positive value waits that long for a
+    batch to fill, trading latency for throughput.
+    """
+
+    def __init__(self, classifier, encoder_mappings, imputer=None, max_batch=MAX_BATCH, max_wait_ms=MAX_WAIT_MS):
+        self.classifier = classifier
+        self.encoder = FeatureEncoder.from_dict(encoder_mappings)
+        self.imputer = imputer
+        self.feature_columns = list(classifier.model.feature_names_in_)
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000
+        self.queue = None
+
+    @classmethod
+    def from_registry(cls, name=MODEL_NAME, registry=None, imputer_path=None, **kwargs):
+        classifier, metadata = (registry or ModelRegistry()).load(name)
+        if not metadata.get('encoder_mappings'):
+            raise ValueError(f"{name} v{metadata['version']} was saved without encoder mappings")
+        imputer = joblib.load(imputer_path) if imputer_path else None
+        return cls(classifier, metadata['encoder_mappings'], imputer, **kwargs)
+
+    def featurize(self, response):
+        return featurize_response(response, self.feature_columns, self.encoder, imputer=self.imputer)
+
+    async def score(self, response):
+        """Return (stress class, adjusted probabilities) of one response."""
+        features = self.featurize(response)
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((features, future))
+        return await future
+
+    async def _batcher(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self.queue.get()]
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.max_batch:
+                if self.queue.empty():
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self.queue.get(), remaining))
+                    except asyncio.TimeoutError:
+                        break
+                else:
+                    batch.append(self.queue.get_nowait())
+
+            X = np.array([features for features, _ in batch])
+            try:
+                with warnings.catch_warnings():
+                    # Fitted on a DataFrame; the feature order is guaranteed by featurize
+                    warnings.simplefilter('ignore', UserWarning)
+                    probas = self.classifier.adjust(self.classifier.model.predict_proba(X))
+            except Exception as exc:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(exc)
+                continue
+            classes = self.classifier.classes_[np.argmax(probas, axis=1)]
+            for (_, future), label, row in zip(batch, classes, probas):
+                if not future.done():
+                    future.set_result((int(label), row.tolist()))
+
+    async def _handle(self, reader, writer):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, path, _ = request_line.decode('latin-1').split(' ', 2)
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+                    key, _, value = line.decode('latin-1').partition(':')
+                    headers[key.strip().lower()] = value.strip()
+                body = await reader.readexactly(int(headers.get('content-length', 0)))
+
+                status, payload = await self._route(method, path, body)
+                data = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+                writer.write(f"HTTP/1.1 {status}\r\nContent-Type: application/json\r\n"
+                             f"Content-Length: {len(data)}\r\n\r\n".encode('latin-1') + data)
+                await writer.drain()
+                if headers.get('connection', '').lower() == 'close':
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def _route(self, method, path, body):
+        if method == 'GET' and path == '/health':
+            return '200 OK', {'status': 'ok'}
+        if method != 'POST' or path != '/predict':
+            return '404 Not Found', {'error': f"{method} {path} not found"}
+        try:
+            request = json.loads(body)
+            # One response (dict or raw row), or {"responses": [...]} for several
+            batch = isinstance(request, dict) and 'responses' in request
+            responses = request['responses'] if batch else [request]
+            results = await asyncio.gather(*(self.score(response) for response in responses))
+        except (ValueError, TypeError) as exc:
+            return '400 Bad Request', {'error': str(exc)}
+        except Exception as exc:
+            return '500 Internal Server Error', {'error': str(exc)}
+        predictions = [{'stress_class': label, 'probabilities': probas} for label, probas in results]
+        return '200 OK', predictions if batch else predictions[0]
+
+    async def start(self, host='127.0.0.1', port=8000):
+        self.queue = asyncio.Queue()
+        self._batcher_task = asyncio.create_task(self._batcher())
+        return await asyncio.start_server(self._handle, host, port)
+
+    async def serve_forever(self, host='127.0.0.1', port=8000):
+        server = await self.start(host, port)
+        print(f"🚀 Scoring service listening on http://{host}:{port} (POST /predict)")
+        async with server:
+            await server.serve_forever()
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--model', default=MODEL_NAME)
+    parser.add_argument('--registry', default=None, help='Registry directory (default: config.REGISTRY_DIR)')
+    parser.add_argument('--imputer', default=None, help='Imputer saved by preprocessing (e.g. ../data/imputer.joblib)')
+    parser.add_argument('--max-batch', type=int, default=MAX_BATCH)
+    parser.add_argument('--max-wait-ms', type=float, default=MAX_WAIT_MS)
+    args = parser.parse_args()
+
+    service = ScoringService.from_registry(args.model, ModelRegistry(args.registry) if args.registry else None,
+                                           imputer_path=args.imputer,
+                                           max_batch=args.max_batch, max_wait_ms=args.max_wait_ms)
+    asyncio.run(service.serve_forever(args.host, args.port))
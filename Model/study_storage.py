@@ -0,0 +1,16 @@
+# study_storage.py
+
+def journal_storage(path):
+    """
+    File-based Optuna storage that several local processes can share safely.
+
+    Optuna is imported here rather than at module level, so modules that only
+    locate studies (e.g. model_registry, used by the scoring service) do not
+    load it.
+    """
+    import optuna
+    try:
+        from optuna.storages.journal import JournalFileBackend
+        return optuna.storages.JournalStorage(JournalFileBackend(path))
+    except ImportError:
+        return optuna.storages.JournalStorage(optuna.storages.JournalFileStorage(path))
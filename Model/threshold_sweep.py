@@ -0,0 +1,86 @@
+# threshold_sweep.py
+import numpy as np
+from batched_metrics import batched_confusion, weighted_recall_f1, threshold_predictions
+
+DEFAULT_THRESHOLDS = np.linspace(0.01, 1.0, 50)
+SWEEP_METRICS = ('log_loss', 'recall', 'f1')
+LOG_LOSS_EPS = 1e-15
+
+def _chunks(n_thresholds, per_threshold, max_elements):
+    step = max(1, max_elements // max(1, per_threshold))
+    for start in range(0, n_thresholds, step):
+        yield slice(start, start + step)
+
+def log_loss_surface(probas, y_true, thresholds, max_elements=2 ** 22):
+    """
+    Log loss after dividing class c's probability by t and renormalizing, for
+    every class c and threshold t at once. Returns (n_classes, n_thresholds).
+
+    Only the true-class probability enters the loss, so nothing of shape
+    (..., n_classes) is built: with row sums S and scale s = 1/t,
+    p'_true = p_true * (s if y == c else 1) / (S + p_c * (s - 1)).
+    Probabilities are clipped to [1e-15, 1 - 1e-15] as before.
+    """
+    probas = np.asarray(probas, dtype=float)
+    y_true = np.asarray(y_true)
+    thresholds = np.asarray(thresholds, dtype=float)
+    n_samples, n_classes = probas.shape
+
+    row_sums = probas.sum(axis=1)
+    p_true = probas[np.arange(n_samples), y_true]
+    is_class = y_true[None, :] == np.arange(n_classes)[:, None]           # (C, N)
+    per_class = probas.T[:, None, :]                                      # (C, 1, N)
+
+    surface = np.empty((n_classes, len(thresholds)))
+    for part in _chunks(len(thresholds), n_classes * n_samples, max_elements):
+        scale = (1.0 / thresholds[part])[None, :, None] - 1.0             # (1, T, 1)
+        adjusted = p_true * (1.0 + is_class[:, None, :] * scale)          # (C, T, N)
+        adjusted /= row_sums + per_class * scale
+        np.clip(adjusted, LOG_LOSS_EPS, 1 - LOG_LOSS_EPS, out=adjusted)
+        surface[:, part] = -np.log(adjusted).mean(axis=2)
+    return surface
+
+def recall_f1_surface(probas, y_true, thresholds, max_elements=2 ** 22):
+    """
+    Weighted recall and F1 of argmax predictions after dividing class c's
+    probability by t, for every (class, threshold). Each chunk of thresholds is
+    one batch of threshold vectors for batched_metrics. Returns two
+    (n_classes, n_thresholds) arrays.
+    """
+    probas = np.asarray(probas, dtype=float)
+    y_true = np.asarray(y_true)
+    thresholds = np.asarray(thresholds, dtype=float)
+    n_samples, n_classes = probas.shape
+
+    recall = np.empty((n_classes, len(thresholds)))
+    f1 = np.empty_like(recall)
+    for part in _chunks(len(thresholds), n_classes * n_classes * n_samples, max_elements):
+        chunk = thresholds[part]
+        # One threshold vector per (class, t): ones everywhere except t at the class
+        vectors = np.ones((n_classes, len(chunk), n_classes))
+        vectors[np.arange(n_classes), :, np.arange(n_classes)] = chunk
+        preds = threshold_predictions(probas, vectors.reshape(-1, n_classes))
+        chunk_recall, chunk_f1 = weighted_recall_f1(batched_confusion(y_true, preds, n_classes))
+        recall[:, part] = chunk_recall.reshape(n_classes, len(chunk))
+        f1[:, part] = chunk_f1.reshape(n_classes, len(chunk))
+    return recall, f1
+
+def sweep_thresholds(probas, y_true, thresholds=DEFAULT_THRESHOLDS, metrics=SWEEP_METRICS,
+                     max_elements=2 ** 22):
+    """
+    (class, threshold) surfaces of the requested `metrics` ('log_loss', 'recall',
+    'f1') for labels `y_true` in [0, n_classes). Intermediate tensors are capped
+    at `max_elements` floats, so grids of thousands of thresholds are fine.
+    Returns {metric: (n_classes, n_thresholds) array}.
+    """
+    unknown = set(metrics) - set(SWEEP_METRICS)
+    if unknown:
+        raise ValueError(f"Unknown sweep metrics {sorted(unknown)}. Available: {', '.join(SWEEP_METRICS)}")
+
+    surfaces = {}
+    if 'log_loss' in metrics:
+        surfaces['log_loss'] = log_loss_surface(probas, y_true, thresholds, max_elements)
+    if 'recall' in metrics or 'f1' in metrics:
+        recall, f1 = recall_f1_surface(probas, y_true, thresholds, max_elements)
+        surfaces.update({name: value for name, value in [('recall', recall), ('f1', f1)] if name in metrics})
+    return surfaces
@@ -1,44 +1,111 @@
 # threshold_tuning.py
 import optuna
 import numpy as np
-from sklearn.metrics import recall_score, f1_score
 from sklearn.svm import SVC
 from config import SEED
+from pruning import make_pruner, fit_with_subset_halving
+from batched_metrics import batched_confusion, weighted_recall_f1, threshold_predictions
 
-def optimize_svm_threshold_recall(X_train, y_train, X_dev, y_dev, n_trials=200):
-    n_classes = len(np.unique(y_train))
-    best_model, best_thresholds = None, None
-    best_recall, best_f1 = -1.0, -1.0
+def optimize_thresholds(probas, y_dev, n_samples=5000, low=0.1, high=1.0, batch_size=1000, random_state=SEED):
+    """
+    Search per-class thresholds against a fixed probability matrix.
 
-    def objective(trial):
-        nonlocal best_model, best_thresholds, best_recall, best_f1
+    Samples `n_samples` threshold vectors uniformly in [low, high] (plus the
+    no-adjustment vector of ones) and scores all of them with batched NumPy
+    operations, `batch_size` vectors at a time.
+
+    Returns:
+        (thresholds, recall, f1) of the vector with the best weighted recall,
+        ties broken by weighted F1.
+    """
+    n_classes = probas.shape[1]
+    rng = np.random.default_rng(random_state)
+    candidates = np.vstack([np.ones((1, n_classes)), rng.uniform(low, high, size=(n_samples, n_classes))])
+
+    best = (-1.0, -1.0, None)
+    for start in range(0, len(candidates), batch_size):
+        batch = candidates[start:start + batch_size]
+        preds = threshold_predictions(probas, batch)
+        recall, f1 = weighted_recall_f1(batched_confusion(y_dev, preds, n_classes))
+        i = np.lexsort((f1, recall))[-1]
+        if (recall[i], f1[i]) > best[:2]:
+            best = (recall[i], f1[i], batch[i])
+
+    recall, f1, thresholds = best
+    return thresholds, recall, f1
+
+def _params_key(params):
+    """Cache key with only the SVC parameters that affect the chosen kernel."""
+    key = {'C': params['C'], 'kernel': params['kernel']}
+    if params['kernel'] != 'linear':
+        key['gamma'] = params['gamma']
+    if params['kernel'] == 'poly':
+        key['degree'] = params['degree']
+    return tuple(sorted(key.items()))
+
+def optimize_svm_threshold_recall(X_train, y_train, X_dev, y_dev, n_trials=50, pruner=None,
+                                  n_threshold_samples=5000, storage=None, study_name=None):
+    """
+    Two-level search for a recall-oriented SVC.
+
+    The outer Optuna study only explores SVC hyperparameters; every fitted model's
+    dev `predict_proba` matrix is cached per parameter set. The inner
+    `optimize_thresholds` then evaluates thousands of per-class threshold vectors
+    against the cached probabilities, so no SVC is refitted to try thresholds.
 
+    With a persistent `storage` and `study_name` the study is resumed: `n_trials`
+    is the total, only the missing trials run, and a best trial from an earlier
+    run is refitted from its stored parameters and thresholds. Raises RuntimeError
+    if no trial of the study completed.
+    """
+    classes = np.unique(y_train)
+    n_classes = len(classes)
+    y_dev_codes = np.searchsorted(classes, np.asarray(y_dev))
+    fitted = {}
+
+    def dev_probas(model):
+        # Subset fits may miss a class; its probability column is then 0
+        probas = np.zeros((len(X_dev), n_classes))
+        probas[:, np.searchsorted(classes, model.classes_)] = model.predict_proba(X_dev)
+        return probas
+
+    def objective(trial):
         params = {
             'C': trial.suggest_float('C', 1e-3, 1e3, log=True),
             'kernel': trial.suggest_categorical('kernel', ['linear', 'rbf', 'poly']),
             'degree': trial.suggest_int('degree', 2, 5),
             'gamma': trial.suggest_categorical('gamma', ['scale', 'auto']),
             'probability': True,
-            'class_weight': 'balanced'
+            'class_weight': 'balanced',
+            'random_state': SEED
         }
-        model = SVC(**params)
-        model.fit(X_train, y_train)
-        probas = model.predict_proba(X_dev)
 
-        thresholds = [trial.suggest_float(f"thresh_{i}", 0.1, 1.0) for i in range(n_classes)]
-        adjusted_preds = np.argmax(probas / thresholds, axis=1)
-
-        recall = recall_score(y_dev, adjusted_preds, average='weighted')
-        f1 = f1_score(y_dev, adjusted_preds, average='weighted')
-
-        if recall > best_recall:
-            best_model = model
-            best_thresholds = thresholds
-            best_recall = recall
-            best_f1 = f1
+        key = _params_key(params)
+        if key not in fitted:
+            model, _ = fit_with_subset_halving(
+                trial, lambda final: SVC(**params), X_train, y_train, X_dev, y_dev,
+                lambda model: optimize_thresholds(dev_probas(model), y_dev_codes, n_threshold_samples)[1])
+            fitted[key] = (model, dev_probas(model))
+        model, probas = fitted[key]
 
+        thresholds, recall, f1 = optimize_thresholds(probas, y_dev_codes, n_threshold_samples)
+        trial.set_user_attr('thresholds', thresholds.tolist())
+        trial.set_user_attr('f1', float(f1))
         return recall
 
-    study = optuna.create_study(direction='maximize')
-    study.optimize(objective, n_trials=n_trials)
-    return best_model, best_thresholds, best_recall
+    study = optuna.create_study(direction='maximize', storage=storage, pruner=make_pruner(pruner),
+                                study_name=study_name, load_if_exists=study_name is not None)
+    finished = study.get_trials(deepcopy=False, states=(optuna.trial.TrialState.COMPLETE,
+                                                        optuna.trial.TrialState.PRUNED))
+    if n_trials > len(finished):
+        study.optimize(objective, n_trials=n_trials - len(finished))
+
+    completed = study.get_trials(deepcopy=False, states=(optuna.trial.TrialState.COMPLETE,))
+    if not completed:
+        raise RuntimeError(f"No completed trials in study '{study.study_name}' "
+                           f"({len(study.trials)} trials, all pruned or failed)")
+    best = max(completed, key=lambda trial: (trial.value, trial.user_attrs.get('f1', -1.0)))
+    params = dict(best.params, probability=True, class_weight='balanced', random_state=SEED)
+    key = _params_key(params)
+    model = fitted[key][0] if key in fitted else SVC(**params).fit(X_train, y_train)
+    return model, np.asarray(best.user_attrs['thresholds']), best.value
@@ -0,0 +1,52 @@
+# thresholded_classifier.py
+import joblib
+import numpy as np
+
+class ThresholdedClassifier:
+    """
+    Wraps a fitted probabilistic classifier and applies per-class thresholds.
+
+    Probabilities are divided by the thresholds and renormalized in one broadcast
+    operation per chunk of `chunk_size` rows, and the predicted class is the argmax
+    of the adjusted probabilities. The wrapper pickles together with its base model.
+    """
+
+    def __init__(self, model, thresholds, chunk_size=65536):
+        self.model = model
+        self.thresholds = np.asarray(thresholds, dtype=float)
+        self.chunk_size = chunk_size
+        if self.thresholds.shape != (len(model.classes_),):
+            raise ValueError(f"Expected {len(model.classes_)} thresholds, got shape {self.thresholds.shape}")
+
+    @property
+    def classes_(self):
+        return self.model.classes_
+
+    def _chunks(self, X):
+        for start in range(0, len(X), self.chunk_size):
+            yield X.iloc[start:start + self.chunk_size] if hasattr(X, 'iloc') else X[start:start + self.chunk_size]
+
+    def adjust(self, probas):
+        """Apply the thresholds to a (n_samples, n_classes) probability matrix."""
+        adjusted = probas / self.thresholds
+        adjusted /= adjusted.sum(axis=1, keepdims=True)
+        return adjusted
+
+    def predict_proba(self, X):
+        if len(X) == 0:
+            # Estimators reject empty input; nothing to score
+            return np.empty((0, len(self.classes_)))
+        return np.vstack([self.adjust(self.model.predict_proba(chunk)) for chunk in self._chunks(X)])
+
+    def predict(self, X):
+        if len(X) == 0:
+            return self.classes_[:0]
+        return np.concatenate([self.classes_[np.argmax(self.model.predict_proba(chunk) / self.thresholds, axis=1)]
+                               for chunk in self._chunks(X)])
+
+    def save(self, path):
+        joblib.dump(self, path)
+
+    @staticmethod
+    def load(path):
+        return joblib.load(path)
@@ -5,9 +5,49 @@ from sklearn.tree import DecisionTreeClassifier
 from sklearn.neighbors import KNeighborsClassifier
 from lightgbm import LGBMClassifier
 from catboost import CatBoostClassifier
-from config import SEED
-
-def optimize_svc(X_train, y_train, X_dev, y_dev, n_trials=100, random_state=42):
+from config import SEED, CV_JOBS
+from pruning import make_pruner, fit_with_subset_halving, LightGBMPruningCallback, CatBoostPruningCallback
+from cv_engine import cv_engine
+
+def create_study(storage=None, study_name=None, pruner=None):
+    """
+    Maximize-F1 study. With a shared `storage` (RDB URL or JournalStorage) several
+    processes can run trials of the same `study_name` in parallel. `pruner` is a
+    name from pruning.PRUNERS or an Optuna pruner (default: config.PRUNER).
+
+    The optimize_* functions score trials on the dev set by default. With
+    `cv_folds=k` they score stratified k-fold CV over train + dev instead (folds
+    evaluated by `cv_jobs` processes, see cv_engine.CVEngine), and the returned
+    model is refitted on train + dev.
+    """
+    return optuna.create_study(direction='maximize', storage=storage, pruner=make_pruner(pruner),
+                               study_name=study_name, load_if_exists=study_name is not None)
+
+def build_model(family, params, n_threads=None):
+    """
+    Unfitted estimator of `family` ('svc', 'knn', 'tree', 'lightgbm', 'catboost')
+    with tuned `params` (e.g. a study's best_params) and the fixed settings its
+    optimize_* function uses.
+    """
+    threads = n_threads if n_threads is not None else -1
+    if family == 'svc':
+        return SVC(**params, probability=True)
+    if family == 'knn':
+        return KNeighborsClassifier(**params, n_jobs=n_threads)
+    if family == 'tree':
+        return DecisionTreeClassifier(**params, class_weight='balanced')
+    if family == 'lightgbm':
+        return LGBMClassifier(**params, verbosity=-1, class_weight='balanced', n_jobs=threads)
+    if family == 'catboost':
+        return CatBoostClassifier(**params, verbose=0, auto_class_weights='Balanced', thread_count=threads)
+    raise ValueError(f"Unknown model family '{family}'")
+
+def dev_f1(X_dev, y_dev):
+    """Scorer for fit_with_subset_halving: weighted F1 on the dev set."""
+    return lambda model: f1_score(y_dev, model.predict(X_dev), average='weighted')
+
+def optimize_svc(X_train, y_train, X_dev, y_dev, n_trials=100, random_state=42,
+                 storage=None, study_name=None, n_threads=None, pruner=None, cv_folds=None, cv_jobs=CV_JOBS):
     best_model = None
     best_f1 = -1.0
 
@@ -16,8 +56,7 @@ def optimize_svc(X_train, y_train, X_dev, y_dev, n_trials=100, random_state=42):
 
         params = {
             'C': trial.suggest_loguniform('C', 1e-3, 1e2),
-            'kernel': trial.suggest_categorical('kernel', ['linear', 'rbf', 'poly']),
-            'probability': True
+            'kernel': trial.suggest_categorical('kernel', ['linear', 'rbf', 'poly'])
         }
 
         if params['kernel'] in ['rbf', 'poly']:
@@ -26,23 +65,27 @@ def optimize_svc(X_train, y_train, X_dev, y_dev, n_trials=100, random_state=42):
         if params['kernel'] == 'poly':
             params['degree'] = trial.suggest_int('degree', 2, 5)
 
-        model = SVC(**params)
-        model.fit(X_train, y_train)
-        y_pred = model.predict(X_dev)
-        f1 = f1_score(y_dev, y_pred, average='weighted')
+        # Platt calibration (probability=True) only for the full-data fit; predict() does not use it
+        if cv is not None:
+            model, f1 = None, cv.evaluate(SVC(**params), trial)
+        else:
+            model, f1 = fit_with_subset_halving(trial, lambda final: SVC(**params, probability=final),
+                                                X_train, y_train, X_dev, y_dev, dev_f1(X_dev, y_dev))
 
         if f1 > best_f1:
             best_f1 = f1
-            best_model = model
+            best_model = model if model is not None else cv.refit(SVC(**params, probability=True))
 
         return f1
 
-    study = optuna.create_study(direction='maximize')
-    study.optimize(objective, n_trials=n_trials)
+    study = create_study(storage, study_name, pruner)
+    with cv_engine(X_train, y_train, X_dev, y_dev, cv_folds, cv_jobs) as cv:
+        study.optimize(objective, n_trials=n_trials)
 
     return best_model
 
-def optimize_knn(X_train, y_train, X_dev, y_dev, n_trials=100, random_state=42):
+def optimize_knn(X_train, y_train, X_dev, y_dev, n_trials=100, random_state=42,
+                 storage=None, study_name=None, n_threads=None, pruner=None, cv_folds=None, cv_jobs=CV_JOBS):
     best_model = None
     best_f1 = -1.0
 
@@ -52,26 +95,30 @@ def optimize_knn(X_train, y_train, X_dev, y_dev, n_trials=100, random_state=42):
         params = {
             'n_neighbors': trial.suggest_int('n_neighbors', 1, 30),
             'weights': trial.suggest_categorical('weights', ['uniform', 'distance']),
-            'p': trial.suggest_int('p', 1, 2)
+            'p': trial.suggest_int('p', 1, 2),
+            'n_jobs': n_threads
         }
 
-        model = KNeighborsClassifier(**params)
-        model.fit(X_train, y_train)
-        y_pred = model.predict(X_dev)
-        f1 = f1_score(y_dev, y_pred, average='weighted')
+        if cv is not None:
+            model, f1 = None, cv.evaluate(KNeighborsClassifier(**params), trial)
+        else:
+            model, f1 = fit_with_subset_halving(trial, lambda final: KNeighborsClassifier(**params),
+                                                X_train, y_train, X_dev, y_dev, dev_f1(X_dev, y_dev))
 
         if f1 > best_f1:
             best_f1 = f1
-            best_model = model
+            best_model = model if model is not None else cv.refit(KNeighborsClassifier(**params))
 
         return f1
 
-    study = optuna.create_study(direction='maximize')
-    study.optimize(objective, n_trials=n_trials)
+    study = create_study(storage, study_name, pruner)
+    with cv_engine(X_train, y_train, X_dev, y_dev, cv_folds, cv_jobs) as cv:
+        study.optimize(objective, n_trials=n_trials)
 
     return best_model
 
-def optimize_tree(X_train, y_train, X_dev, y_dev, n_trials=100, random_state=42):
+def optimize_tree(X_train, y_train, X_dev, y_dev, n_trials=100, random_state=42,
+                  storage=None, study_name=None, n_threads=None, pruner=None, cv_folds=None, cv_jobs=CV_JOBS):
     best_model = None
     best_f1 = -1.0
 
@@ -86,24 +133,27 @@ def optimize_tree(X_train, y_train, X_dev, y_dev, n_trials=100, random_state=42)
             'class_weight': 'balanced'
         }
 
-        model = DecisionTreeClassifier(**params)
-        model.fit(X_train, y_train)
-        y_pred = model.predict(X_dev)
-        f1 = f1_score(y_dev, y_pred, average='weighted')
+        if cv is not None:
+            model, f1 = None, cv.evaluate(DecisionTreeClassifier(**params), trial)
+        else:
+            model, f1 = fit_with_subset_halving(trial, lambda final: DecisionTreeClassifier(**params),
+                                                X_train, y_train, X_dev, y_dev, dev_f1(X_dev, y_dev))
 
         # Lưu lại mô hình tốt nhất
         if f1 > best_f1:
             best_f1 = f1
-            best_model = model
+            best_model = model if model is not None else cv.refit(DecisionTreeClassifier(**params))
 
         return f1
 
-    study = optuna.create_study(direction='maximize')
-    study.optimize(objective, n_trials=n_trials)
+    study = create_study(storage, study_name, pruner)
+    with cv_engine(X_train, y_train, X_dev, y_dev, cv_folds, cv_jobs) as cv:
+        study.optimize(objective, n_trials=n_trials)
 
     return best_model
 
-def optimize_lightgbm(X_train, y_train, X_dev, y_dev, n_trials=100, random_state=42):
+def optimize_lightgbm(X_train, y_train, X_dev, y_dev, n_trials=100, random_state=42,
+                      storage=None, study_name=None, n_threads=None, pruner=None, cv_folds=None, cv_jobs=CV_JOBS):
     best_model = None
     best_f1 = -1.0
     def objective(trial):
@@ -119,25 +169,32 @@ def optimize_lightgbm(X_train, y_train, X_dev, y_dev, n_trials=100, random_state
           'colsample_bytree': trial.suggest_float('colsample_bytree', 0.1, 1.0),
           'reg_alpha': trial.suggest_float('reg_alpha', 0.0, 1.0),
           'reg_lambda': trial.suggest_float('reg_lambda', 0.0, 1.0),
-          'class_weight': 'balanced'
+          'class_weight': 'balanced',
+          'n_jobs': n_threads if n_threads is not None else -1
       }
-      model = LGBMClassifier(**params)
-      model.fit(X_train, y_train)
-      y_pred = model.predict(X_dev)
-      f1 = f1_score(y_dev, y_pred, average='weighted')
+      if cv is not None:
+        model, f1 = None, cv.evaluate(LGBMClassifier(**params), trial)
+      else:
+        model = LGBMClassifier(**params)
+        model.fit(X_train, y_train, eval_set=[(X_dev, y_dev)],
+                  callbacks=[LightGBMPruningCallback(trial)])
+        y_pred = model.predict(X_dev)
+        f1 = f1_score(y_dev, y_pred, average='weighted')
 
       if f1 > best_f1:
         best_f1 = f1
-        best_model = model
+        best_model = model if model is not None else cv.refit(LGBMClassifier(**params))
 
-        return f1
+      return f1
 
-    study = optuna.create_study(direction='maximize')
-    study.optimize(objective, n_trials=n_trials)
+    study = create_study(storage, study_name, pruner)
+    with cv_engine(X_train, y_train, X_dev, y_dev, cv_folds, cv_jobs) as cv:
+        study.optimize(objective, n_trials=n_trials)
 
     return best_model
 
-def optimize_catboost(X_train, y_train, X_dev, y_dev, n_trials=100, random_state=42):
+def optimize_catboost(X_train, y_train, X_dev, y_dev, n_trials=100, random_state=42,
+                      storage=None, study_name=None, n_threads=None, pruner=None, cv_folds=None, cv_jobs=CV_JOBS):
     best_model = None
     best_f1 = -1.0
 
@@ -151,22 +208,32 @@ def optimize_catboost(X_train, y_train, X_dev, y_dev, n_trials=100, random_state
             'l2_leaf_reg': trial.suggest_float('l2_leaf_reg', 1e-8, 100, log=True),
             'border_count': trial.suggest_int('border_count', 32, 255),
             'verbose': 0,
-            'auto_class_weights': 'Balanced'
+            'auto_class_weights': 'Balanced',
+            'thread_count': n_threads if n_threads is not None else -1
         }
 
-        model = CatBoostClassifier(**params)
-        model.fit(X_train, y_train, eval_set=[(X_dev, y_dev)], early_stopping_rounds=10, verbose=0)
-        y_pred = model.predict(X_dev)
-        f1 = f1_score(y_dev, y_pred, average='weighted')
+        if cv is not None:
+            # Early stopping on each fold's validation part; pruning happens between folds
+            model, f1 = None, cv.evaluate(CatBoostClassifier(**params), trial, eval_set=True,
+                                          fit_params={'early_stopping_rounds': 10, 'verbose': 0})
+        else:
+            model = CatBoostClassifier(**params)
+            pruning_callback = CatBoostPruningCallback(trial)
+            model.fit(X_train, y_train, eval_set=[(X_dev, y_dev)], early_stopping_rounds=10, verbose=0,
+                      callbacks=[pruning_callback])
+            pruning_callback.check_pruned()
+            y_pred = model.predict(X_dev)
+            f1 = f1_score(y_dev, y_pred, average='weighted')
 
         if f1 > best_f1:
             best_f1 = f1
-            best_model = model
+            best_model = model if model is not None else cv.refit(CatBoostClassifier(**params))
 
         return f1
 
-    study = optuna.create_study(direction='maximize')
-    study.optimize(objective, n_trials=n_trials)
+    study = create_study(storage, study_name, pruner)
+    with cv_engine(X_train, y_train, X_dev, y_dev, cv_folds, cv_jobs) as cv:
+        study.optimize(objective, n_trials=n_trials)
 
     return best_model
 
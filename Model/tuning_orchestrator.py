@@ -0,0 +1,117 @@
+# tuning_orchestrator.py
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import optuna
+import pandas as pd
+
+from config import N_TRIALS, CPU_BUDGET, STUDY_DIR
+from study_storage import journal_storage
+from tuning_models import (optimize_svc, optimize_knn, optimize_tree,
+                           optimize_lightgbm, optimize_catboost, build_model)
+
+MODEL_FAMILIES = {
+    'svc': optimize_svc,
+    'knn': optimize_knn,
+    'tree': optimize_tree,
+    'lightgbm': optimize_lightgbm,
+    'catboost': optimize_catboost,
+}
+
+
+def _run_study_worker(family, X_train, y_train, X_dev, y_dev, n_trials, storage_path, n_threads, pruner,
+                      cv_folds=None, cv_jobs=1):
+    """Run `n_trials` of the family's shared study in this process and return its local best model."""
+    optuna.logging.set_verbosity(optuna.logging.WARNING)
+    optimize = MODEL_FAMILIES[family]
+    model = optimize(X_train, y_train, X_dev, y_dev, n_trials=n_trials,
+                     storage=journal_storage(storage_path), study_name=family, n_threads=n_threads, pruner=pruner,
+                     cv_folds=cv_folds, cv_jobs=cv_jobs)
+    return family, model
+
+
+def _matches(model, params):
+    model_params = model.get_params()
+    return all(model_params.get(name) == value for name, value in params.items())
+
+
+def _refit_best(family, params, X_train, y_train, X_dev, y_dev, n_threads, cv_folds):
+    """Fit `params` of `family` on train (train + dev with CV), as the tuners fit their returned model."""
+    model = build_model(family, params, n_threads)
+    if not cv_folds:
+        return model.fit(X_train, y_train)
+    X = pd.concat([X_train, X_dev]) if isinstance(X_train, pd.DataFrame) else np.vstack([X_train, X_dev])
+    return model.fit(X, np.concatenate([np.asarray(y_train), np.asarray(y_dev)]))
+
+
+def tune_all_models(X_train, y_train, X_dev, y_dev, families=None, n_trials=N_TRIALS,
+                    workers_per_study=1, cpu_budget=CPU_BUDGET, storage_dir=STUDY_DIR, pruner=None,
+                    cv_folds=None, cv_jobs=1):
+    """
+    Tune several model families concurrently on a process pool.
+
+    Each family has one Optuna study in a journal file under `storage_dir`; its
+    `n_trials` are split over `workers_per_study` processes that share that study.
+    At most `cpu_budget` processes run at once and every process gets
+    `cpu_budget // processes` threads for LightGBM/CatBoost/KNN, so the total never
+    oversubscribes the machine. Studies are resumed if their journal already exists.
+    `pruner` is a pruner name from pruning.PRUNERS (default: config.PRUNER).
+    A family's model is the one a worker returned for the study's best trial; when
+    that trial came from an earlier run, its parameters are refitted.
+    With `cv_folds` trials are scored by k-fold CV over train + dev, each worker
+    fitting folds on `cv_jobs` processes (counted against `cpu_budget`).
+
+    Returns:
+        best_models (dict): family -> best fitted model.
+        leaderboard (DataFrame): best dev (or CV) F1, params and trial count per family.
+    """
+    families = list(families or MODEL_FAMILIES)
+    os.makedirs(storage_dir, exist_ok=True)
+
+    n_processes = len(families) * workers_per_study
+    fold_jobs = cv_jobs if cv_folds else 1
+    max_workers = max(1, min(n_processes, cpu_budget // fold_jobs))
+    n_threads = max(1, cpu_budget // (max_workers * fold_jobs))
+    trials_per_worker = math.ceil(n_trials / workers_per_study)
+
+    best_models, candidates = {}, {}
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        futures = [
+            pool.submit(_run_study_worker, family, X_train, y_train, X_dev, y_dev,
+                        trials_per_worker, os.path.join(storage_dir, f"{family}.log"), n_threads, pruner,
+                        cv_folds, cv_jobs)
+            for family in families
+            for _ in range(workers_per_study)
+        ]
+        for future in futures:
+            family, model = future.result()
+            candidates.setdefault(family, []).append(model)
+
+    rows = []
+    for family in families:
+        study = optuna.load_study(study_name=family,
+                                  storage=journal_storage(os.path.join(storage_dir, f"{family}.log")))
+        # The worker that ran the best trial returned the model with its params
+        matching = [model for model in candidates[family]
+                    if model is not None and _matches(model, study.best_params)]
+        best_models[family] = matching[0] if matching else _refit_best(
+            family, study.best_params, X_train, y_train, X_dev, y_dev, cpu_budget, cv_folds)
+        rows.append({
+            'family': family,
+            'best_f1': study.best_value,
+            'n_trials': len(study.trials),
+            'best_params': study.best_params,
+        })
+    leaderboard = pd.DataFrame(rows).sort_values('best_f1', ascending=False).reset_index(drop=True)
+
+    return best_models, leaderboard
+
+
+if __name__ == "__main__":
+    from data_loader import load_and_split_data
+
+    X_train, X_dev, X_test, y_train, y_dev, y_test, df = load_and_split_data()
+    best_models, leaderboard = tune_all_models(X_train, y_train, X_dev, y_dev)
+    print(leaderboard.to_string(index=False))
@@ -1,36 +1,41 @@
 # visualization.py
 import matplotlib.pyplot as plt
 import numpy as np
-from sklearn.metrics import log_loss, roc_curve, auc, det_curve
+from sklearn.metrics import roc_curve, auc, det_curve
 from sklearn.preprocessing import label_binarize
-from sklearn.model_selection import learning_curve, StratifiedKFold
+from threshold_sweep import sweep_thresholds, DEFAULT_THRESHOLDS
+from evaluation_context import EvaluationContext
+from learning_curve_service import LearningCurveService, MAX_TRAIN_SIZE
 
-def plot_log_loss_vs_threshold_multiclass_all_in_one(model, X_test, y_test):
-    y_prob = model.predict_proba(X_test)
+METRIC_LABELS = {'log_loss': 'Log Loss', 'recall': 'Recall', 'f1': 'F1-score'}
+
+def plot_log_loss_vs_threshold_multiclass_all_in_one(model, X_test, y_test, thresholds=DEFAULT_THRESHOLDS,
+                                                      metric='log_loss', context=None, show=True):
+    """
+    Plot `metric` ('log_loss', 'recall' or 'f1') against the threshold that class
+    probabilities are divided by, one line per class. The whole surface comes
+    from a single threshold_sweep call, so fine `thresholds` grids are cheap.
+    Probabilities come from `context` (an EvaluationContext) when one is shared.
+    With show=False the figure is only returned (for headless rendering).
+    """
+    y_prob = (context or EvaluationContext()).predict_proba(model, X_test)
     n_classes = y_prob.shape[1]
-    thresholds = np.linspace(0.01, 1.0, 50)
+    surface = sweep_thresholds(y_prob, np.asarray(y_test), thresholds, metrics=(metric,))[metric]
 
-    plt.figure(figsize=(8, 6))
+    fig = plt.figure(figsize=(8, 6))
     for class_index in range(n_classes):
-        log_losses = []
-        for thresh in thresholds:
-            adjusted_prob = y_prob.copy()
-            adjusted_prob[:, class_index] = y_prob[:, class_index] / thresh
-            adjusted_prob /= adjusted_prob.sum(axis=1, keepdims=True)
-            adjusted_prob = np.clip(adjusted_prob, 1e-15, 1 - 1e-15)
-            loss = log_loss(y_test, adjusted_prob, labels=np.arange(n_classes))
-            log_losses.append(loss)
-
-        plt.plot(thresholds, log_losses, label=f'Class {class_index}')
+        plt.plot(thresholds, surface[class_index], label=f'Class {class_index}')
     plt.xlabel('Threshold (probability adjustment)')
-    plt.ylabel('Log Loss')
-    plt.title('Log Loss vs. Threshold per class')
+    plt.ylabel(METRIC_LABELS[metric])
+    plt.title(f'{METRIC_LABELS[metric]} vs. Threshold per class')
     plt.legend()
     plt.grid(True)
-    plt.show()
+    if show:
+        plt.show()
+    return fig
 
-def plot_multiclass_roc_auc(model, X_test, y_test, class_names):
-    y_score = model.predict_proba(X_test)
+def plot_multiclass_roc_auc(model, X_test, y_test, class_names, context=None, show=True):
+    y_score = (context or EvaluationContext()).predict_proba(model, X_test)
     y_bin = label_binarize(y_test, classes=class_names)
 
     fpr, tpr, roc_auc = {}, {}, {}
@@ -38,7 +43,7 @@ def plot_multiclass_roc_auc(model, X_test, y_test, class_names):
         fpr[i], tpr[i], _ = roc_curve(y_bin[:, i], y_score[:, i])
         roc_auc[i] = auc(fpr[i], tpr[i])
 
-    plt.figure(figsize=(8, 6))
+    fig = plt.figure(figsize=(8, 6))
     for i in range(len(class_names)):
         plt.plot(fpr[i], tpr[i], label=f'Class {class_names[i]} (AUC = {roc_auc[i]:.2f})')
     plt.plot([0, 1], [0, 1], 'k--')
@@ -47,13 +52,15 @@ def plot_multiclass_roc_auc(model, X_test, y_test, class_names):
     plt.title('ROC Curve (Multi-class)')
     plt.legend()
     plt.grid(True)
-    plt.show()
+    if show:
+        plt.show()
+    return fig
 
-def plot_multiclass_det(model, X_test, y_test, class_names):
-    y_score = model.predict_proba(X_test)
+def plot_multiclass_det(model, X_test, y_test, class_names, context=None, show=True):
+    y_score = (context or EvaluationContext()).predict_proba(model, X_test)
     y_bin = label_binarize(y_test, classes=class_names)
 
-    plt.figure(figsize=(8, 6))
+    fig = plt.figure(figsize=(8, 6))
     for i in range(len(class_names)):
         fpr, fnr, _ = det_curve(y_bin[:, i], y_score[:, i])
         plt.plot(fpr, fnr, label=f'Class {class_names[i]}')
@@ -63,12 +70,15 @@ def plot_multiclass_det(model, X_test, y_test, class_names):
     plt.title('DET Curve (Multi-class)')
     plt.legend()
     plt.grid(True)
-    plt.show()
+    if show:
+        plt.show()
+    return fig
 
 def plot_learning_curve(estimator, X, y, title="Learning Curve",
                         scoring='f1_weighted', cv=5,
                         train_sizes=np.linspace(0.1, 1.0, 5),
-                        n_jobs=-1, random_state=42):
+                        n_jobs=-1, random_state=42, show=True, max_train_size=MAX_TRAIN_SIZE,
+                        warm_start=False, service=None):
     """
     Hàm vẽ learning curve cho một estimator.
 
@@ -80,22 +90,19 @@ def plot_learning_curve(estimator, X, y, title="Learning Curve",
         scoring: độ đo đánh giá (accuracy, f1_macro, ...)
         cv: số fold hoặc object chia tập cross-validation
         train_sizes: danh sách tỷ lệ dữ liệu huấn luyện dùng để vẽ (mặc định: từ 10% đến 100%)
-        n_jobs: số lượng CPU để chạy song song (mặc định -1: dùng tất cả)
+        n_jobs: số tiến trình tối đa để fit các fold song song (mặc định -1: dùng tất cả)
         random_state: để tái hiện được kết quả
+        show: hiển thị đồ thị (False: chỉ trả về figure, dùng khi render không giao diện)
+        max_train_size: số mẫu huấn luyện tối đa; dữ liệu lớn hơn dùng lịch lấy mẫu con
+        warm_start: fit tiếp từ mô hình của kích thước trước (chỉ LightGBM/CatBoost)
+        service: LearningCurveService dùng chung (mặc định: cache điểm số trên đĩa)
     """
 
-    if isinstance(cv, int):
-        cv = StratifiedKFold(n_splits=cv, shuffle=True, random_state=random_state)
-
-    train_sizes_abs, train_scores, test_scores = learning_curve(
-        estimator, X, y,
-        train_sizes=train_sizes,
-        cv=cv,
-        scoring=scoring,
-        n_jobs=n_jobs,
-        shuffle=True,
-        random_state=random_state
-    )
+    if service is None:
+        service = LearningCurveService(n_jobs=n_jobs, max_train_size=max_train_size,
+                                       warm_start=warm_start, random_state=random_state)
+    train_sizes_abs, train_scores, test_scores = service.compute(estimator, X, y, train_sizes=train_sizes,
+                                                                 cv=cv, scoring=scoring)
 
     train_scores_mean = train_scores.mean(axis=1)
     train_scores_std = train_scores.std(axis=1)
@@ -103,11 +110,10 @@ def plot_learning_curve(estimator, X, y, title="Learning Curve",
     test_scores_mean = test_scores.mean(axis=1)
     test_scores_std = test_scores.std(axis=1)
 
-    plt.figure(figsize=(8, 6))
+    fig = plt.figure(figsize=(8, 6))
     plt.title(title)
     plt.xlabel("Số mẫu huấn luyện")
     plt.ylabel(f"Score ({scoring})")
-    plt.xlim(0, 225)
     plt.ylim(0.2, 1.25)
     plt.grid(True)
     plt.fill_between(train_sizes_abs,
@@ -123,4 +129,6 @@ def plot_learning_curve(estimator, X, y, title="Learning Curve",
 
     plt.legend(loc="best")
     plt.tight_layout()
-    plt.show()
+    if show:
+        plt.show()
+    return fig
@@ -0,0 +1,57 @@
+# bench_encode_data.py
+# Usage: python benchmarks/bench_encode_data.py --rows 1000000
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+from sklearn.preprocessing import LabelEncoder
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from src.preprocess.encode_data import encode_data, VALUE_MAPPINGS
+
+
+def legacy_encode_data(df):
+    """LabelEncoder + DataFrame.replace implementation encode_data used to run."""
+    df = df.copy()
+    le_gender = LabelEncoder()
+    le_major = LabelEncoder()
+    df['gender'] = le_gender.fit_transform(df['gender'])
+    df['major'] = le_major.fit_transform(df['major'])
+    for col, mapping in VALUE_MAPPINGS.items():
+        df[col] = df[col].replace(mapping)
+    df = df.infer_objects(copy=False)
+    for col in df.columns:
+        df[col] = df[col].astype('int64')
+    return df
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    sample = pd.read_csv(os.path.join(os.path.dirname(__file__), '..', 'data', 'processed_data.csv'))
+    df = sample.sample(args.rows, replace=True, random_state=0).reset_index(drop=True)
+    df = df.astype({col: object for col in df.select_dtypes('float64').columns})
+
+    legacy, legacy_time = timed(legacy_encode_data, df)
+    (encoded, _, _), new_time = timed(encode_data, df)
+
+    assert np.array_equal(legacy.to_numpy(), encoded.to_numpy())
+    print(f"rows={args.rows:,}")
+    print(f"legacy:  {legacy_time:.3f}s  {legacy.memory_usage(deep=True).sum() / 2**20:,.1f} MiB")
+    print(f"encoder: {new_time:.3f}s  {encoded.memory_usage(deep=True).sum() / 2**20:,.1f} MiB")
+    print(f"speedup: {legacy_time / new_time:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
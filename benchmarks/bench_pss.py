@@ -0,0 +1,67 @@
+# bench_pss.py
+# Usage: python benchmarks/bench_pss.py --rows 1000000
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from src.preprocess.pss_caculate import PSSCalculator, PSS_ITEMS
+
+
+def legacy_calculate(df):
+    """Per-column / per-row implementation PSSCalculator.calculate used to run."""
+    df = df.copy()
+    for col in PSS_ITEMS:
+        df[col] = df[col].astype(int)
+    for col in ['4', '5', '7', '8']:
+        df[col] = df[col].apply(lambda x: 4 - x)
+
+    def convert_target(val):
+        if 0 <= val < 9:
+            return 0
+        elif 9 <= val < 17:
+            return 1
+        elif 17 <= val < 25:
+            return 2
+        elif 25 <= val < 33:
+            return 3
+        else:
+            return 4
+
+    df['target'] = df[PSS_ITEMS].sum(axis=1).apply(convert_target)
+    return df.drop(columns=PSS_ITEMS)
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark vectorized vs apply-based PSS scoring.")
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(42)
+    items = rng.integers(0, 5, size=(args.rows, len(PSS_ITEMS)), dtype=np.int8)
+    df = pd.DataFrame(items.astype(np.int64), columns=PSS_ITEMS)
+
+    legacy, legacy_time = timed(legacy_calculate, df)
+    frame, frame_time = timed(lambda d: PSSCalculator(d).calculate(), df)
+    batch, batch_time = timed(PSSCalculator.score_items, items)
+
+    assert (legacy['target'].to_numpy() == frame['target'].to_numpy()).all()
+    assert (legacy['target'].to_numpy() == batch).all()
+    print(f"rows={args.rows:,}")
+    print(f"legacy apply        : {legacy_time:8.3f}s")
+    print(f"calculate (frame)   : {frame_time:8.3f}s  ({legacy_time / frame_time:6.1f}x)")
+    print(f"score_items (array) : {batch_time:8.3f}s  ({legacy_time / batch_time:6.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
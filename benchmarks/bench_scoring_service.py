@@ -0,0 +1,68 @@
+# bench_scoring_service.py
+# Usage: python benchmarks/bench_scoring_service.py --clients 32 --requests 200
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, os.path.join(ROOT, 'Model'))
+sys.path.insert(0, ROOT)
+from model_registry import ModelRegistry
+from scoring_service import ScoringService, MODEL_NAME
+
+
+async def client(port, responses, latencies):
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    for response in responses:
+        body = json.dumps(response, ensure_ascii=False).encode('utf-8')
+        start = time.perf_counter()
+        writer.write(f"POST /predict HTTP/1.1\r\nContent-Length: {len(body)}\r\n\r\n".encode('latin-1') + body)
+        await writer.drain()
+        await reader.readline()
+        length = 0
+        while (line := await reader.readline()) not in (b'\r\n', b''):
+            if line.lower().startswith(b'content-length'):
+                length = int(line.split(b':')[1])
+        await reader.readexactly(length)
+        latencies.append(time.perf_counter() - start)
+    writer.close()
+
+
+async def run(args):
+    registry = ModelRegistry(args.registry) if args.registry else None
+    service = ScoringService.from_registry(args.model, registry, max_batch=args.max_batch,
+                                           max_wait_ms=args.max_wait_ms)
+    server = await service.start(port=args.port)
+
+    records = pd.read_csv(os.path.join(ROOT, 'data', 'processed_data.csv'), dtype=str).to_dict('records')
+    rng = np.random.default_rng(0)
+    latencies = []
+    start = time.perf_counter()
+    await asyncio.gather(*(client(args.port, [records[i] for i in rng.integers(0, len(records), args.requests)],
+                                  latencies) for _ in range(args.clients)))
+    elapsed = time.perf_counter() - start
+    server.close()
+
+    latencies = np.array(latencies) * 1000
+    print(f"{len(latencies)} requests from {args.clients} clients in {elapsed:.2f}s "
+          f"({len(latencies) / elapsed:,.0f} req/s)")
+    print(f"latency ms: p50={np.percentile(latencies, 50):.2f} p90={np.percentile(latencies, 90):.2f} "
+          f"p99={np.percentile(latencies, 99):.2f}")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--clients', type=int, default=32)
+    parser.add_argument('--requests', type=int, default=200, help='Requests per client')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--model', default=MODEL_NAME)
+    parser.add_argument('--registry', default=None)
+    parser.add_argument('--max-batch', type=int, default=64)
+    parser.add_argument('--max-wait-ms', type=float, default=0.0)
+    asyncio.run(run(parser.parse_args()))
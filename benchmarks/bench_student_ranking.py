@@ -0,0 +1,68 @@
+# bench_student_ranking.py
+# Usage: python benchmarks/bench_student_ranking.py --rows 1000000
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from src.preprocess.student_ranking import StudentRankingEngine, GPA_BUCKETS, CONDUCT_BUCKETS
+
+
+def legacy_classify(df, gpa_col='last_semester_GPA', conduct_col='conduct_score'):
+    """Row-by-row implementation that GeneralChecker.classify_student_ranking used to run."""
+    rankings = []
+    for i in range(len(df)):
+        gpa = df.at[i, gpa_col]
+        conduct = df.at[i, conduct_col]
+
+        if gpa == '9-10' and conduct == '90-100':
+            rankings.append('Xuất sắc')
+        elif (gpa == '8-9' and conduct in ['80-89', '90-100']) or (gpa == '9-10' and conduct == '80-89'):
+            rankings.append('Giỏi')
+        elif (gpa == '7-8' and conduct in ['65-79', '80-89', '90-100']) or \
+             (gpa == '8-9' and conduct == '65-79') or \
+             (gpa == '9-10' and conduct == '65-79') or \
+             (gpa == '6-7' and conduct == '80-89'):
+            rankings.append('Khá')
+        else:
+            rankings.append('Trung bình')
+    return np.array(rankings, dtype=object)
+
+
+def make_synthetic(n_rows, seed=42):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'last_semester_GPA': rng.choice(GPA_BUCKETS + ['Unknown'], size=n_rows),
+        'conduct_score': rng.choice(CONDUCT_BUCKETS, size=n_rows),
+    })
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark vectorized vs row-loop student ranking.")
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    df = make_synthetic(args.rows)
+    engine = StudentRankingEngine()
+
+    start = time.perf_counter()
+    fast = engine.rank(df['last_semester_GPA'], df['conduct_score'])
+    fast_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    slow = legacy_classify(df)
+    slow_time = time.perf_counter() - start
+
+    assert (fast == slow).all(), "Vectorized ranking differs from the legacy loop"
+    print(f"rows={args.rows:,}")
+    print(f"legacy loop : {slow_time:8.3f}s")
+    print(f"vectorized  : {fast_time:8.3f}s")
+    print(f"speedup     : {slow_time / fast_time:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
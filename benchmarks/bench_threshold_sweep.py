@@ -0,0 +1,62 @@
+# bench_threshold_sweep.py
+# Usage: python benchmarks/bench_threshold_sweep.py --rows 1000 --thresholds 50
+import argparse
+import os
+import sys
+import time
+import warnings
+
+import numpy as np
+from sklearn.metrics import log_loss
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'Model'))
+from threshold_sweep import sweep_thresholds
+
+
+def legacy_log_loss_surface(y_prob, y_true, thresholds):
+    """Per-(class, threshold) copy + sklearn log_loss loop the plot used to run."""
+    n_classes = y_prob.shape[1]
+    surface = np.zeros((n_classes, len(thresholds)))
+    for class_index in range(n_classes):
+        for j, thresh in enumerate(thresholds):
+            adjusted_prob = y_prob.copy()
+            adjusted_prob[:, class_index] = y_prob[:, class_index] / thresh
+            adjusted_prob /= adjusted_prob.sum(axis=1, keepdims=True)
+            adjusted_prob = np.clip(adjusted_prob, 1e-15, 1 - 1e-15)
+            surface[class_index, j] = log_loss(y_true, adjusted_prob, labels=np.arange(n_classes))
+    return surface
+
+
+def timed(func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=1000)
+    parser.add_argument('--classes', type=int, default=5)
+    parser.add_argument('--thresholds', type=int, default=50)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    y_prob = rng.dirichlet(np.ones(args.classes), size=args.rows)
+    y_true = rng.integers(0, args.classes, args.rows)
+    thresholds = np.linspace(0.01, 1.0, args.thresholds)
+
+    surfaces, new_time = timed(sweep_thresholds, y_prob, y_true, thresholds, metrics=('log_loss',))
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        legacy, legacy_time = timed(legacy_log_loss_surface, y_prob, y_true, thresholds)
+    _, all_time = timed(sweep_thresholds, y_prob, y_true, thresholds)
+
+    print(f"rows={args.rows:,} classes={args.classes} thresholds={args.thresholds}")
+    print(f"legacy log loss loop: {legacy_time:.3f}s")
+    print(f"sweep (log loss):     {new_time:.4f}s  max diff={np.abs(surfaces['log_loss'] - legacy).max():.2e}")
+    print(f"sweep (+recall, f1):  {all_time:.4f}s")
+    print(f"speedup: {legacy_time / new_time:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
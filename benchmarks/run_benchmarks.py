@@ -0,0 +1,271 @@
+# run_benchmarks.py
+# Usage: python benchmarks/run_benchmarks.py [--sizes 1000,10000,100000] [--steps pss,mcar] [--compare <sha|file>]
+import argparse
+import gc
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+import warnings
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'Model'))
+from synthetic_survey import generate_survey
+from src.preprocess.rename_columns import rename_column
+from src.preprocess.pss_caculate import PSSCalculator
+from src.preprocess.general_checking import GeneralChecker
+from src.preprocess.missing_data_dealing import run_little_mcar_test, drop_missing_columns
+from src.preprocess.encode_data import encode_data
+
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'results')
+DEFAULT_SIZES = [1_000, 10_000, 100_000, 1_000_000, 10_000_000]
+
+
+def _tuner(family, n_trials):
+    def run(df):
+        import optuna
+        from sklearn.model_selection import train_test_split
+        from tuning_orchestrator import MODEL_FAMILIES
+
+        optuna.logging.set_verbosity(optuna.logging.WARNING)
+        warnings.simplefilter('ignore')
+        X, y = df.drop(columns='target'), df['target']
+        X_train, X_dev, y_train, y_dev = train_test_split(X, y, test_size=0.2, random_state=0, stratify=y)
+        return MODEL_FAMILIES[family](X_train, y_train, X_dev, y_dev, n_trials=n_trials, n_threads=1)
+    return run
+
+
+def _encode(df):
+    df, _, _ = encode_data(df)
+    return df.drop(columns='conduct_score')
+
+
+# name -> (function timed on the previous step's output, whether its result feeds the next step)
+PREPROCESS_STEPS = {
+    'pss': (lambda df: PSSCalculator(df).calculate(), True),
+    'general_checker': (lambda df: GeneralChecker(df).transform(), True),
+    'mcar': (run_little_mcar_test, False),
+    'drop_missing': (drop_missing_columns, True),
+    'encode': (_encode, True),
+}
+TUNERS = ['tree', 'lightgbm']
+
+
+def git_revision():
+    try:
+        sha = subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT, text=True).strip()
+        dirty = subprocess.check_output(['git', 'status', '--porcelain', '--untracked-files=no'],
+                                        cwd=ROOT, text=True).strip()
+        return f"{sha}-dirty" if dirty else sha
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+
+def measure(func, df, repeat, memory, max_repeat_seconds=10.0):
+    """
+    Best-of-`repeat` wall time of `func(df)` and, when `memory` is set, the peak
+    traced allocation (Python and NumPy buffers) of one extra traced run. Timings
+    never run under tracemalloc. Repeats stop early once a run exceeds
+    `max_repeat_seconds`, so the 10M-row sizes are only timed once.
+    """
+    best, result = float('inf'), None
+    for _ in range(repeat):
+        result = None
+        gc.collect()
+        start = time.perf_counter()
+        result = func(df)
+        elapsed = time.perf_counter() - start
+        best = min(best, elapsed)
+        if elapsed > max_repeat_seconds:
+            break
+
+    peak = None
+    if memory:
+        gc.collect()
+        tracemalloc.start()
+        func(df)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return result, best, peak
+
+
+def run_size(rows, steps, repeat, memory, tuner_trials, tuner_max_rows, seed=0):
+    records = []
+
+    def record(step, seconds, peak):
+        records.append({'step': step, 'rows': rows, 'seconds': seconds, 'rows_per_s': rows / seconds,
+                        'peak_mb': None if peak is None else peak / 2 ** 20})
+        peak_text = '' if peak is None else f"  peak {peak / 2 ** 20:9.1f} MB"
+        print(f"  {step:<16} {seconds:9.4f}s  {rows / seconds:14,.0f} rows/s{peak_text}", flush=True)
+
+    start = time.perf_counter()
+    df = rename_column(generate_survey(rows, seed))
+    print(f"rows={rows:,} (generated in {time.perf_counter() - start:.1f}s, "
+          f"{df.memory_usage(deep=False).sum() / 2 ** 20:.0f} MB)", flush=True)
+
+    # Each step is timed on the real output of the previous one; earlier frames are released
+    for step, (func, feeds_next) in PREPROCESS_STEPS.items():
+        if step not in steps and not feeds_next:
+            continue
+        if step in steps:
+            result, seconds, peak = measure(func, df, repeat, memory)
+            record(step, seconds, peak)
+        else:
+            result = func(df)
+        if feeds_next:
+            df = result
+        del result
+
+    for family in TUNERS:
+        step = f"tune_{family}"
+        if step not in steps:
+            continue
+        if rows > tuner_max_rows:
+            print(f"  {step:<16} skipped (> --tuner-max-rows)")
+            continue
+        _, seconds, peak = measure(_tuner(family, tuner_trials), df, 1, memory)
+        record(step, seconds, peak)
+    return records
+
+
+def scaling_exponents(records):
+    """Slope of log(time) against log(rows) per step: ~1 is linear, >1 superlinear."""
+    frame = pd.DataFrame(records)
+    exponents = {}
+    for step, group in frame.groupby('step', sort=False):
+        group = group[group['seconds'] > 1e-3]
+        if len(group) >= 2:
+            exponents[step] = float(np.polyfit(np.log(group['rows']), np.log(group['seconds']), 1)[0])
+    return exponents
+
+
+def resolve_results(name):
+    if os.path.isfile(name):
+        return name
+    path = os.path.join(RESULTS_DIR, f"{name}.json")
+    if os.path.isfile(path):
+        return path
+    raise FileNotFoundError(f"No benchmark results '{name}' (looked for {path})")
+
+
+def compare(current, baseline, tolerance):
+    """Print per-(step, rows) time ratios against `baseline`; return the regressions."""
+    old = {(r['step'], r['rows']): r for r in baseline['results']}
+    regressions = []
+    print(f"\nComparison with {baseline['revision']} (ratio = new / old time):")
+    for r in current['results']:
+        before = old.get((r['step'], r['rows']))
+        if before is None:
+            continue
+        ratio = r['seconds'] / before['seconds']
+        flag = ''
+        if ratio > 1 + tolerance:
+            flag = '  ⚠️ slower'
+            regressions.append((r['step'], r['rows'], ratio))
+        elif ratio < 1 - tolerance:
+            flag = '  ✅ faster'
+        mem = ''
+        if r['peak_mb'] is not None and before.get('peak_mb'):
+            mem = f"  mem x{r['peak_mb'] / before['peak_mb']:.2f}"
+        print(f"  {r['step']:<16} {r['rows']:>12,}  x{ratio:.2f}{mem}{flag}")
+    return regressions
+
+
+def plot_scaling(records, path):
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+
+    frame = pd.DataFrame(records)
+    fig, (ax_time, ax_mem) = plt.subplots(1, 2, figsize=(12, 5))
+    for step, group in frame.groupby('step', sort=False):
+        ax_time.plot(group['rows'], group['seconds'], marker='o', label=step)
+        if group['peak_mb'].notna().any():
+            ax_mem.plot(group['rows'], group['peak_mb'], marker='o', label=step)
+    for ax, label in [(ax_time, 'Seconds'), (ax_mem, 'Peak traced memory (MB)')]:
+        ax.set_xscale('log')
+        ax.set_yscale('log')
+        ax.set_xlabel('Rows')
+        ax.set_ylabel(label)
+        ax.grid(True, which='both', alpha=0.3)
+        ax.legend()
+    fig.tight_layout()
+    fig.savefig(path)
+    plt.close(fig)
+
+
+def main():
+    all_steps = list(PREPROCESS_STEPS) + [f"tune_{family}" for family in TUNERS]
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--sizes', default=','.join(map(str, DEFAULT_SIZES)),
+                        help='Comma-separated row counts (default 1k to 10M)')
+    parser.add_argument('--steps', default=','.join(all_steps), help=f"Subset of {', '.join(all_steps)}")
+    parser.add_argument('--repeat', type=int, default=3, help='Timing runs per step (best is kept)')
+    parser.add_argument('--no-memory', action='store_true', help='Skip the traced peak-memory run')
+    parser.add_argument('--tuner-trials', type=int, default=3)
+    parser.add_argument('--tuner-max-rows', type=int, default=100_000,
+                        help='Largest size the tuners are run on')
+    parser.add_argument('--output', help='Results file (default benchmarks/results/<git revision>.json)')
+    parser.add_argument('--compare', help='Baseline results file or revision to compare with')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='Relative slowdown reported as a regression')
+    parser.add_argument('--fail-on-regression', action='store_true')
+    parser.add_argument('--plot', help='Write scaling curves to this PNG')
+    args = parser.parse_args()
+
+    sizes = [int(float(size)) for size in args.sizes.split(',')]
+    steps = [step.strip() for step in args.steps.split(',')]
+    unknown = set(steps) - set(all_steps)
+    if unknown:
+        parser.error(f"Unknown steps: {', '.join(sorted(unknown))}")
+
+    records = []
+    for rows in sizes:
+        records.extend(run_size(rows, steps, args.repeat, not args.no_memory,
+                                args.tuner_trials, args.tuner_max_rows))
+        gc.collect()
+
+    exponents = scaling_exponents(records)
+    if exponents:
+        print("\nScaling exponent (time ~ rows^k):")
+        for step, k in exponents.items():
+            print(f"  {step:<16} k={k:.2f}")
+
+    revision = git_revision()
+    current = {
+        'revision': revision,
+        'date': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'machine': {'python': platform.python_version(), 'platform': platform.platform(),
+                    'cpus': os.cpu_count(), 'numpy': np.__version__, 'pandas': pd.__version__},
+        'settings': {'repeat': args.repeat, 'tuner_trials': args.tuner_trials},
+        'results': records,
+        'scaling_exponents': exponents,
+    }
+    output = args.output or os.path.join(RESULTS_DIR, f"{revision}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(current, f, indent=2)
+    print(f"\n💾 Results saved to {output}")
+
+    if args.plot:
+        plot_scaling(records, args.plot)
+        print(f"📈 Scaling curves saved to {args.plot}")
+
+    if args.compare:
+        with open(resolve_results(args.compare), encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare(current, baseline, args.tolerance)
+        if regressions and args.fail_on_regression:
+            sys.exit(f"{len(regressions)} benchmark(s) slower than {baseline['revision']} "
+                     f"by more than {args.tolerance:.0%}")
+
+
+if __name__ == '__main__':
+    main()
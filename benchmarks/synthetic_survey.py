@@ -0,0 +1,91 @@
+# synthetic_survey.py
+# Usage: python benchmarks/synthetic_survey.py --rows 100000 --out data/synthetic_survey.csv
+import argparse
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from src.preprocess.rename_columns import new_columns_name
+from src.preprocess.general_checking import GPA_RANGE_MAPPING
+from src.preprocess.pss_caculate import PSS_ITEMS, REVERSE_ITEMS
+
+# Raw answer labels as they appear in the survey export, with rough frequencies
+GENDERS = (['Nữ', 'Nam'], [0.45, 0.55])
+MAJORS = (['An toàn Thông tin', 'Công nghệ Thông tin', 'Hệ thống Thông tin', 'Khoa học Dữ liệu',
+           'Khoa học Máy tính', 'Kỹ thuật Máy tính', 'Kỹ thuật Phần mềm', 'Mạng Máy tính',
+           'Thiết kế Vi mạch', 'Thương mại Điện tử', 'Trí tuệ Nhân tạo'], None)
+ATTENDANCE = (['80 - 100', '50 - 80', '20 - 50', '< 20%'], [0.6, 0.28, 0.09, 0.03])
+GPA = (list(GPA_RANGE_MAPPING), [0.08, 0.32, 0.35, 0.17, 0.06, 0.02])
+CONDUCT = (['90 - 100', '80 - 89', '65 - 79', '50 - 64', '< 50'], [0.3, 0.45, 0.18, 0.05, 0.02])
+RANKING = (['Xuất sắc', 'Giỏi', 'Khá', 'Trung bình'], [0.05, 0.3, 0.45, 0.2])
+STUDY_HOURS = (['< 1', '1 - 2', '2 - 3', '3 - 4', '> 4'], [0.2, 0.35, 0.25, 0.12, 0.08])
+SOCIAL_MEDIA = (['< 2h', '2 - 5h', '5 - 7h', '> 7h'], [0.15, 0.5, 0.22, 0.13])
+SLEEP = (['< 5', '5 - 6.9', '7 - 9', '> 9'], [0.08, 0.45, 0.43, 0.04])
+
+CATEGORICAL = {
+    'gender': GENDERS, 'major': MAJORS, 'class_attendance_percent': ATTENDANCE,
+    'last_semester_GPA': GPA, 'conduct_score': CONDUCT, 'last_semester_student_ranking': RANKING,
+    'self_study_hours': STUDY_HOURS, 'amount_hours_spent_on_social_media': SOCIAL_MEDIA,
+    'average_time_spent_sleeping': SLEEP,
+}
+LIKERT = ['activity_engagement_level', 'internet_adaptation', 'workout_rate', 'peer_pressure_rate',
+          'sharing_frequency', 'family_affects', 'family_allowance_sufficiency', 'family_major_support']
+
+
+def _labels(rng, n_rows, labels, p):
+    # Index into one object array so every cell shares the same string objects
+    return np.asarray(labels, dtype=object)[rng.choice(len(labels), size=n_rows, p=p)]
+
+
+def generate_survey(n_rows: int, seed: int = 0, missing_rate: float = 0.01,
+                    start='2025-04-17 19:00') -> pd.DataFrame:
+    """
+    Synthetic raw survey export with the column layout of rename_columns.py.
+
+    Categorical answers use the survey's Vietnamese labels, Likert answers are
+    1-5 integers, and the ten PSS items (0-4) share a latent stress level so the
+    target classes are not uniform. `family_educational_level` is the optional
+    question: a `missing_rate` share of it is left empty, as in the real export.
+    """
+    rng = np.random.default_rng(seed)
+    columns = {}
+    columns['time_stamp'] = pd.Timestamp(start) + pd.to_timedelta(np.sort(rng.integers(0, 90 * 86400, n_rows)), unit='s')
+    columns['gender'] = _labels(rng, n_rows, *GENDERS)
+    columns['academic_year'] = rng.choice(np.arange(1, 7), size=n_rows, p=[0.3, 0.3, 0.2, 0.15, 0.04, 0.01])
+    columns['major'] = _labels(rng, n_rows, *MAJORS)
+    for col in ['class_attendance_percent', 'last_semester_GPA', 'conduct_score',
+                'last_semester_student_ranking', 'self_study_hours']:
+        columns[col] = _labels(rng, n_rows, *CATEGORICAL[col])
+    for col in ['activity_engagement_level', 'internet_adaptation']:
+        columns[col] = rng.integers(1, 6, n_rows)
+    for col in ['amount_hours_spent_on_social_media', 'average_time_spent_sleeping']:
+        columns[col] = _labels(rng, n_rows, *CATEGORICAL[col])
+    for col in ['workout_rate', 'peer_pressure_rate', 'sharing_frequency', 'family_affects',
+                'family_allowance_sufficiency']:
+        columns[col] = rng.integers(1, 6, n_rows)
+    education = rng.integers(1, 6, n_rows).astype(float)
+    education[rng.random(n_rows) < missing_rate] = np.nan
+    columns['family_educational_level'] = education
+    columns['family_major_support'] = rng.integers(1, 6, n_rows)
+
+    stress = rng.normal(2.0, 0.8, n_rows)
+    for item in PSS_ITEMS:
+        answer = np.clip(np.rint(stress + rng.normal(0, 0.9, n_rows)), 0, 4).astype(np.int64)
+        columns[item] = 4 - answer if item in REVERSE_ITEMS else answer
+
+    df = pd.DataFrame(columns)
+    assert list(df.columns) == new_columns_name
+    return df
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=100_000)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--out', default='data/synthetic_survey.csv')
+    args = parser.parse_args()
+    generate_survey(args.rows, args.seed).to_csv(args.out, index=False)
+    print(f"Saved {args.rows:,} synthetic responses to {args.out}")
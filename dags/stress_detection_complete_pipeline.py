@@ -8,6 +8,22 @@ import pandas as pd
 # Add the src directory to Python path for imports
 sys.path.append('/opt/airflow/src')
 
+DATA_DIR = '/opt/airflow/data'
+# Intermediate hand-offs between tasks, removed by cleanup_temp_files
+TEMP_ARTIFACTS = [
+    'temp_raw_data',
+    'temp_renamed_data',
+    'temp_pss_data',
+    'temp_checked_data',
+    'temp_processed_data',
+]
+
+def get_store():
+    """Artifact store used for temp_* hand-offs (format set by ARTIFACT_FORMAT, default Parquet)"""
+    sys.path.insert(0, '/opt/airflow')
+    from src.preprocess.artifact_store import get_artifact_store
+    return get_artifact_store(DATA_DIR)
+
 def load_environment_variables():
     """Load environment variables"""
     from dotenv import load_dotenv
@@ -17,20 +33,22 @@ def load_environment_variables():
 
 def retrieve_data_from_drive():
     """Retrieve data from local Excel file"""
-    import pandas as pd
+    sys.path.insert(0, '/opt/airflow')
+    from src.preprocess.raw_loader import load_raw_data
     
     print("📥 Loading data from local file...")
     # Use the existing raw data file instead of trying to download from Google Drive
     data_path = '/opt/airflow/data/raw_data.xlsx'
     
     try:
-        data = pd.read_excel(data_path, header=0)
+        # Parsed once, then served from a Parquet cache until the workbook changes
+        data = load_raw_data(data_path)
         print(f"✅ Data loaded successfully. Shape: {data.shape}")
         
         # Save to temporary location for next task
-        data.to_csv('/opt/airflow/data/temp_raw_data.csv', index=False)
-        print("📄 Data saved to temporary CSV file.")
-        return '/opt/airflow/data/temp_raw_data.csv'
+        path = get_store().save(data, 'temp_raw_data')
+        print(f"📄 Data saved to temporary artifact {path}.")
+        return path
         
     except Exception as e:
         print(f"❌ Error loading data: {e}")
@@ -43,12 +61,13 @@ def rename_columns():
     
     print("🔧 Renaming columns...")
     # Load data from previous task
-    data = pd.read_csv('/opt/airflow/data/temp_raw_data.csv')
+    store = get_store()
+    data = store.load('temp_raw_data')
     data = rename_column(data)
     print("✅ Columns renamed.")
     
     # Save for next task
-    data.to_csv('/opt/airflow/data/temp_renamed_data.csv', index=False)
+    store.save(data, 'temp_renamed_data')
 
 def calculate_pss_score():
     """Calculate PSS score"""
@@ -57,13 +76,14 @@ def calculate_pss_score():
     
     print("🧠 Calculating PSS score...")
     # Load data from previous task
-    data = pd.read_csv('/opt/airflow/data/temp_renamed_data.csv')
+    store = get_store()
+    data = store.load('temp_renamed_data')
     pss_calculator = PSSCalculator(data)
     data = pss_calculator.calculate()
     print("✅ PSS score calculated.")
     
     # Save for next task
-    data.to_csv('/opt/airflow/data/temp_pss_data.csv', index=False)
+    store.save(data, 'temp_pss_data')
 
 def check_data_integrity():
     """Check general data integrity"""
@@ -72,23 +92,26 @@ def check_data_integrity():
     
     print("🧪 Checking general data integrity...")
     # Load data from previous task
-    data = pd.read_csv('/opt/airflow/data/temp_pss_data.csv')
+    store = get_store()
+    data = store.load('temp_pss_data')
     general_checker = GeneralChecker(data)
     data = general_checker.do_all_checks()
     print("✅ Data integrity check completed.")
     
     # Save for next task
-    data.to_csv('/opt/airflow/data/temp_checked_data.csv', index=False)
+    store.save(data, 'temp_checked_data')
 
 def run_mcar_test():
     """Run MCAR test"""
     sys.path.insert(0, '/opt/airflow')
-    from src.preprocess.missing_data_dealing import run_little_mcar_test
+    from src.preprocess.missing_data_dealing import run_little_mcar_test, drop_missing_columns
     
     print("🔎 Running MCAR test...")
     # Load data from previous task
-    data = pd.read_csv('/opt/airflow/data/temp_checked_data.csv')
+    store = get_store()
+    data = store.load('temp_checked_data')
     result = run_little_mcar_test(data)
+    data = drop_missing_columns(data)
     print("✅ MCAR test finished.")
     print(f"📊 MCAR Test Result: Chi2={result['chi2']}, df={result['df']}, p-value={result['p']}")
     
@@ -98,7 +121,9 @@ def run_mcar_test():
     # Save processed data
     sys.path.insert(0, '/opt/airflow')
     from src.preprocess.fetch_and_store import save_data
-    save_data(data, file_name='/opt/airflow/data/processed_data.csv')
+    from src.preprocess.schema import PROCESSED_SCHEMA
+    save_data(data, file_name='/opt/airflow/data/processed_data.csv', schema=PROCESSED_SCHEMA)
+    store.save(data, 'temp_processed_data')
     print("✅ Data saved successfully.")
 
 def encode_categorical_data():
@@ -106,10 +131,11 @@ def encode_categorical_data():
     sys.path.insert(0, '/opt/airflow')
     from src.preprocess.encode_data import encode_data
     from src.preprocess.fetch_and_store import save_data
+    from src.preprocess.schema import FINAL_SCHEMA
     
     print("🔄 Encoding categorical data...")
     # Load processed data
-    data = pd.read_csv('/opt/airflow/data/processed_data.csv')
+    data = get_store().load('temp_processed_data')
     data, gender_map, major_map = encode_data(data)
     print("✅ Categorical data encoded.")
     
@@ -119,7 +145,7 @@ def encode_categorical_data():
     print(data.dtypes)
     
     # Save final dataset
-    save_data(data, file_name='/opt/airflow/data/final_processed_data.csv')
+    save_data(data, file_name='/opt/airflow/data/final_processed_data.csv', schema=FINAL_SCHEMA)
     print("✅ Final processed data saved.")
     
     return {
@@ -130,18 +156,8 @@ def encode_categorical_data():
 
 def cleanup_temp_files():
     """Clean up temporary files"""
-    import os
-    temp_files = [
-        '/opt/airflow/data/temp_raw_data.csv',
-        '/opt/airflow/data/temp_renamed_data.csv',
-        '/opt/airflow/data/temp_pss_data.csv',
-        '/opt/airflow/data/temp_checked_data.csv'
-    ]
-    
-    for file_path in temp_files:
-        if os.path.exists(file_path):
-            os.remove(file_path)
-            print(f"🗑️ Removed temp file: {file_path}")
+    for file_path in get_store().cleanup(TEMP_ARTIFACTS):
+        print(f"🗑️ Removed temp file: {file_path}")
     
     print("✅ Cleanup completed.")
 
@@ -179,6 +195,10 @@ with DAG(
     7. **Encode Data**: Encode categorical variables
     8. **Cleanup**: Remove temporary files
     
+    Intermediate `temp_*` artifacts are exchanged through the artifact store in
+    src/preprocess/artifact_store.py (Parquet by default, `ARTIFACT_FORMAT=arrow|csv`
+    to switch), so dtypes survive between tasks without CSV re-parsing.
+    
     ## Outputs:
     - `processed_data.csv`: Intermediate processed data
     - `final_processed_data.csv`: Final encoded dataset ready for ML
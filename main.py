@@ -4,6 +4,8 @@ from dotenv import load_dotenv
 import os
 
 from src.preprocess import main_preprocess
+from src.preprocess.streaming import stream_preprocess
+from src.preprocess.incremental import run_incremental
 from src.eda import main_eda
 
 def run(config):
@@ -13,16 +15,24 @@ def run(config):
         print("🔧 Running Preprocessing...")
         main_preprocess()
         print("✅ Preprocessing done.")
+    elif config == "preprocess_stream":
+        print("🔧 Running streaming Preprocessing...")
+        stream_preprocess(os.getenv("FILE_ID"), chunksize=int(os.getenv("CHUNK_SIZE", 10000)))
+        print("✅ Preprocessing done.")
+    elif config == "preprocess_incremental":
+        print("🔧 Running incremental Preprocessing...")
+        run_incremental(os.getenv("FILE_ID"))
+        print("✅ Preprocessing done.")
     elif config == "eda":
         print("📊 Running EDA...")
         main_eda()
         print("✅ EDA done.")
     else:
-        print("❌ Unknown config. Use 'preprocess' or 'eda'.")
+        print("❌ Unknown config. Use 'preprocess', 'preprocess_stream', 'preprocess_incremental' or 'eda'.")
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Run different flows in the project.")
-    parser.add_argument('--config', type=str, required=True, help="Specify flow to run: preprocess | eda")
+    parser.add_argument('--config', type=str, required=True, help="Specify flow to run: preprocess | preprocess_stream | preprocess_incremental | eda")
 
     args = parser.parse_args()
     run(args.config)
\ No newline at end of file
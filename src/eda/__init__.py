@@ -1,3 +1,4 @@
 from .main_eda import main_eda
 from .bar_chart import plot_categorical_distributions_plotly
-from .count_and_KDE import plot_discrete_distribution_by_target_combined
\ No newline at end of file
+from .count_and_KDE import plot_discrete_distribution_by_target_combined
+from .aggregation import CountTable
\ No newline at end of file
@@ -0,0 +1,101 @@
+import numpy as np
+import pandas as pd
+
+# dtypes the EDA plots treat as discrete (same selection the plotting functions used on the raw frame)
+DISCRETE_DTYPES = ['object', 'category', 'integer', 'float64']
+
+
+def _codes(series: pd.Series):
+    """Integer codes (-1 for missing) and the values they stand for, sorted when possible."""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return series.cat.codes.to_numpy(), series.cat.categories
+    try:
+        return pd.factorize(series, sort=True)
+    except TypeError:
+        # Mixed types that cannot be ordered: keep order of appearance
+        return pd.factorize(series)
+
+
+class CountTable:
+    """
+    (column, value, target) counts of a DataFrame, computed once.
+
+    Every discrete column is factorized to int codes and counted with one
+    np.bincount over `code * n_targets + target_code`; the blocks of all
+    columns form a single (values, targets) matrix. The frame is read once per
+    column and never copied. The plotting functions in src/eda only read these
+    small tables, so drawing no longer depends on the row count. Missing values
+    (in the column or the target) are not counted, like value_counts / groupby.
+    With `target_col=None` all rows fall in a single target bucket.
+    """
+
+    def __init__(self, df: pd.DataFrame, target_col='target', columns=None):
+        self.source_columns = list(df.columns)
+        self.target_col = target_col if target_col in df.columns else None
+        if columns is None:
+            columns = df.select_dtypes(include=DISCRETE_DTYPES).columns
+        self.frame_columns = list(columns)
+        self.columns = [col for col in self.frame_columns if col != self.target_col]
+
+        if self.target_col is not None:
+            target_codes, self.targets = _codes(df[self.target_col])
+        else:
+            target_codes, self.targets = np.zeros(len(df), dtype=np.int64), pd.Index([0])
+        n_targets = len(self.targets)
+        target_valid = target_codes >= 0
+
+        self.values, self.offsets = {}, {}
+        blocks = []
+        total = 0
+        for col in self.columns:
+            codes, self.values[col] = _codes(df[col])
+            valid = target_valid & (codes >= 0)
+            keys = codes[valid].astype(np.int64) * n_targets + target_codes[valid]
+            blocks.append(np.bincount(keys, minlength=len(self.values[col]) * n_targets))
+            self.offsets[col] = total
+            total += len(self.values[col])
+
+        self.counts = (np.concatenate(blocks) if blocks else np.zeros(0, dtype=np.int64)).reshape(total, n_targets)
+        self.target_counts = np.bincount(target_codes[target_valid], minlength=n_targets)
+
+    @classmethod
+    def from_frame(cls, df, target_col='target', columns=None):
+        """
+        Return `df` unchanged if it already is a CountTable, else aggregate it.
+        A prebuilt table must have been counted against the same `target_col`.
+        """
+        if not isinstance(df, cls):
+            return cls(df, target_col, columns)
+        expected = target_col if target_col in df.source_columns else None
+        if df.target_col != expected:
+            raise ValueError(f"CountTable was built with target_col={df.target_col!r}, "
+                             f"not {target_col!r}; build it with that target")
+        return df
+
+    def table(self, col, order=None) -> pd.DataFrame:
+        """Value × target count matrix of `col`, optionally reindexed to `order` (missing values → 0)."""
+        if col == self.target_col:
+            table = pd.DataFrame(np.diag(self.target_counts), index=self.targets, columns=self.targets)
+        else:
+            start = self.offsets[col]
+            table = pd.DataFrame(self.counts[start:start + len(self.values[col])],
+                                 index=self.values[col], columns=self.targets)
+        table.index.name = col
+        table.columns.name = self.target_col or 'target'
+        if order is not None:
+            table = table.reindex(order, fill_value=0)
+        return table
+
+    def long(self, col, order=None) -> pd.DataFrame:
+        """Counts of `col` in long form: one row per (value, target) with columns [col, target, 'count']."""
+        return self.table(col, order).stack().rename('count').reset_index()
+
+    def shares(self, col, order=None) -> pd.Series:
+        """Percentage of rows taking each value of `col` (like value_counts(normalize=True) * 100)."""
+        counts = self.table(col).sum(axis=1)
+        counts = counts[counts > 0]
+        shares = counts / counts.sum() * 100
+        return shares.reindex(order).fillna(0) if order is not None else shares
+
+    def nunique(self, col) -> int:
+        return int((self.table(col).sum(axis=1) > 0).sum())
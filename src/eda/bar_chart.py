@@ -1,8 +1,10 @@
 import pandas as pd
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
+from .aggregation import CountTable
 
-def plot_categorical_distributions_plotly(df: pd.DataFrame, custom_orders: dict = None, n_cols: int = 3):
+def plot_categorical_distributions_plotly(df: pd.DataFrame, custom_orders: dict = None, n_cols: int = 3, show: bool = True):
+    """df: survey DataFrame or a CountTable already aggregated from it."""
     if custom_orders is None:
         custom_orders = {
             'last_semester_student_ranking': ['Trung bình', 'Khá', 'Giỏi', 'Xuất sắc'],
@@ -22,7 +24,8 @@ def plot_categorical_distributions_plotly(df: pd.DataFrame, custom_orders: dict
             'family_major_support': [1,2,3,4,5]
         }
 
-    categorical_cols = df.select_dtypes(include=['object', 'category', 'int64', 'float64']).columns.tolist()
+    counts = CountTable.from_frame(df)
+    categorical_cols = counts.frame_columns
     n_charts = len(categorical_cols)
     n_rows = -(-n_charts // n_cols)  # ceil division
 
@@ -35,7 +38,7 @@ def plot_categorical_distributions_plotly(df: pd.DataFrame, custom_orders: dict
         row = idx // n_cols + 1
         col_pos = idx % n_cols + 1
 
-        value_counts = df[col].value_counts(normalize=True) * 100
+        value_counts = counts.shares(col)
 
         # Reorder if needed
         if col in custom_orders:
@@ -85,4 +88,6 @@ def plot_categorical_distributions_plotly(df: pd.DataFrame, custom_orders: dict
 
     for annotation in fig['layout']['annotations']:
         annotation['y'] += 0.002  # tăng 0.05 đơn vị normalized (tùy chỉnh thêm nếu cần)
-    fig.show()
+    if show:
+        fig.show()
+    return fig
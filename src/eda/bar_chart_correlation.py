@@ -2,8 +2,10 @@ import plotly.express as px
 import plotly.subplots as sp
 import plotly.graph_objects as go
 import pandas as pd
+from .aggregation import CountTable
 
-def plot_discrete_countplots_plotly(df, target_col='target', custom_orders=None, n_cols=3, figsize_per_plot=(300, 300)):
+def plot_discrete_countplots_plotly(df, target_col='target', custom_orders=None, n_cols=3, figsize_per_plot=(300, 300), show=True):
+    """df: survey DataFrame or a CountTable already aggregated from it."""
     custom_orders = {
         'academic_year': [1, 2, 3, 4, 5, 6],
         'last_semester_student_ranking': ['Trung bình', 'Khá', 'Giỏi', 'Xuất sắc'],
@@ -30,10 +32,9 @@ def plot_discrete_countplots_plotly(df, target_col='target', custom_orders=None,
         }
     }
 
-    discrete_cols = df.select_dtypes(include=['object', 'category', 'int64', 'float64']) \
-                      .drop(columns=[target_col], errors='ignore') \
-                      .columns
-    discrete_cols = [col for col in discrete_cols if df[col].nunique() <= 20]
+    # Small (value, target) count tables; nothing below touches the rows again
+    counts = CountTable.from_frame(df, target_col)
+    discrete_cols = [col for col in counts.columns if counts.nunique(col) <= 20]
 
     num_plots = len(discrete_cols)
     num_rows = -(-num_plots // n_cols)
@@ -52,11 +53,7 @@ def plot_discrete_countplots_plotly(df, target_col='target', custom_orders=None,
         col_pos = i % n_cols + 1
 
         order = custom_orders.get(col)
-        df_plot = df.copy()
-        if order:
-            df_plot[col] = pd.Categorical(df_plot[col], categories=order, ordered=True)
-
-        count_data = df_plot.groupby([col, target_col]).size().reset_index(name='count')
+        count_data = counts.long(col, order)
 
         for tgt in sorted(count_data[target_col].unique()):
             df_tgt = count_data[count_data[target_col] == tgt]
@@ -90,4 +87,6 @@ def plot_discrete_countplots_plotly(df, target_col='target', custom_orders=None,
 
     fig.update_xaxes(tickangle=45 )
 
-    fig.show()
+    if show:
+        fig.show()
+    return fig
@@ -1,23 +1,27 @@
 import seaborn as sns
 import matplotlib.pyplot as plt
 import math
+from .aggregation import CountTable
 
-def plot_discrete_distribution_by_target_combined(df, target_col='target', custom_orders=None, max_cols=2):
+def plot_discrete_distribution_by_target_combined(df, target_col='target', custom_orders=None, max_cols=2, show=True):
     """
     Vẽ biểu đồ countplot cho các cột rời rạc trong DataFrame trong 1 figure duy nhất (nhiều subplot).
     
     Parameters:
-    - df: DataFrame
+    - df: DataFrame hoặc CountTable đã tổng hợp từ DataFrame đó
     - target_col: tên cột target
     - custom_orders: dict ánh xạ tên cột -> thứ tự giá trị hiển thị (order)
     - max_cols: số lượng cột tối đa trong layout subplot
+    - show: hiển thị figure (False: chỉ trả về figure, dùng khi render không giao diện)
     """
     if custom_orders is None:
         custom_orders = {}
 
-    discrete_cols = df.select_dtypes(include=['object', 'category', 'int64', 'float64']).columns.drop(target_col, errors='ignore')
+    # Đếm (giá trị, target) một lần; các subplot chỉ đọc bảng đếm nhỏ này
+    counts = CountTable.from_frame(df, target_col)
+    discrete_cols = counts.columns
     num_cols = len(discrete_cols)
-    num_targets = df[target_col].nunique()
+    num_targets = len(counts.targets)
 
     # Tạo grid subplot
     rows = math.ceil(num_cols / max_cols)
@@ -27,7 +31,8 @@ def plot_discrete_distribution_by_target_combined(df, target_col='target', custo
     for i, col in enumerate(discrete_cols):
         order = custom_orders.get(col)
         try:
-            sns.countplot(data=df, x=col, hue=target_col, order=order, ax=axes[i])
+            sns.barplot(data=counts.long(col, order), x=col, y='count', hue=target_col,
+                        order=order, errorbar=None, ax=axes[i])
             axes[i].set_title(f'Phân phối {col} theo {target_col}')
             axes[i].tick_params(axis='x', rotation=45)
         except Exception as e:
@@ -39,4 +44,6 @@ def plot_discrete_distribution_by_target_combined(df, target_col='target', custo
         axes[j].set_visible(False)
 
     plt.tight_layout()
-    plt.show()
+    if show:
+        plt.show()
+    return fig
@@ -1,12 +1,33 @@
+import os
 from .bar_chart import plot_categorical_distributions_plotly
 from .bar_chart_correlation import plot_discrete_countplots_plotly
 from .count_and_KDE import plot_discrete_distribution_by_target_combined
+from .aggregation import CountTable
 import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
-def main_eda():
+from ..preprocess.schema import FINAL_SCHEMA, read_dataset, memory_report
+def main_eda(report_dir=None):
+    """
+    report_dir: render the EDA figures headless into `<report_dir>/eda` (defaults
+    to the REPORT_DIR env var) instead of showing them interactively.
+    """
     print("📊 Exploratory Data Analysis (EDA) started...")
-    df = pd.read_csv('./data/final_processed_data.csv')
+    df = read_dataset('./data/final_processed_data.csv', FINAL_SCHEMA)
+    memory_report(df, 'final_processed_data')
 
-    plot_discrete_distribution_by_target_combined(df, target_col='target')
+    # One aggregation pass feeds every figure
+    counts = CountTable(df, target_col='target')
+
+    report_dir = report_dir or os.getenv('REPORT_DIR')
+    if report_dir:
+        from utils.report_renderer import ReportRenderer
+        (ReportRenderer(os.path.join(report_dir, 'eda'))
+         .add('categorical_distributions', plot_categorical_distributions_plotly, counts)
+         .add('discrete_countplots', plot_discrete_countplots_plotly, counts, target_col='target')
+         .add('discrete_distribution_by_target', plot_discrete_distribution_by_target_combined, counts,
+              target_col='target')
+         .render())
+    else:
+        plot_discrete_distribution_by_target_combined(counts, target_col='target')
     print("✅ EDA completed successfully.")
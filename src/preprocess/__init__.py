@@ -1,6 +1,10 @@
 from .rename_columns import rename_column
 from .pss_caculate import PSSCalculator
 from .general_checking import GeneralChecker
+from .student_ranking import StudentRankingEngine, RANKING_RULES
 from .missing_data_dealing import run_little_mcar_test
+from .pipeline import PreprocessPipeline, build_preprocess_pipeline
 from .main_preprocess import main_preprocess
-from .encode_data import encode_data
\ No newline at end of file
+from .encode_data import encode_data, FeatureEncoder
+from .artifact_store import get_artifact_store
+from .imputers import get_imputer
\ No newline at end of file
@@ -0,0 +1,156 @@
+import os
+from abc import ABC, abstractmethod
+
+import pandas as pd
+
+
+class ArtifactStore(ABC):
+    """
+    Base class for intermediate artifacts handed off between pipeline steps.
+
+    Artifacts are addressed by name (e.g. 'temp_raw_data'); each store decides the
+    file format and extension under `root`.
+    """
+
+    extension = ''
+
+    def __init__(self, root: str):
+        self.root = root
+        os.makedirs(self.root, exist_ok=True)
+
+    def path(self, name: str) -> str:
+        """Return the file path backing the artifact `name`."""
+        return os.path.join(self.root, f"{name}{self.extension}")
+
+    def exists(self, name: str) -> bool:
+        return os.path.exists(self.path(name))
+
+    @abstractmethod
+    def save(self, df: pd.DataFrame, name: str) -> str:
+        """Write `df` as the artifact `name` and return its path."""
+
+    @abstractmethod
+    def load(self, name: str, columns: list = None) -> pd.DataFrame:
+        """Read the artifact `name` (only `columns` when given)."""
+
+    def remove(self, name: str) -> bool:
+        """Remove the artifact `name`. Returns True if a file was deleted."""
+        file_path = self.path(name)
+        if os.path.exists(file_path):
+            os.remove(file_path)
+            return True
+        return False
+
+    def cleanup(self, names: list) -> list:
+        """Remove several artifacts and return the paths that were deleted."""
+        removed = []
+        for name in names:
+            file_path = self.path(name)
+            if self.remove(name):
+                removed.append(file_path)
+        return removed
+
+
+class CSVArtifactStore(ArtifactStore):
+    """Plain CSV hand-off. Dtypes are re-inferred on every load."""
+
+    extension = '.csv'
+
+    def save(self, df: pd.DataFrame, name: str) -> str:
+        file_path = self.path(name)
+        df.to_csv(file_path, index=False)
+        return file_path
+
+    def load(self, name: str, columns: list = None) -> pd.DataFrame:
+        return pd.read_csv(self.path(name), usecols=columns)
+
+
+class _ArrowArtifactStore(ArtifactStore):
+    """Shared Arrow conversion with an explicit schema derived from the frame."""
+
+    @staticmethod
+    def _to_table(df: pd.DataFrame):
+        import pyarrow as pa
+
+        schema = pa.Schema.from_pandas(df, preserve_index=False)
+        return pa.Table.from_pandas(df, schema=schema, preserve_index=False)
+
+
+class ParquetArtifactStore(_ArrowArtifactStore):
+    """Compressed columnar hand-off. Categorical columns round-trip as categoricals."""
+
+    extension = '.parquet'
+
+    def __init__(self, root: str, compression: str = 'snappy'):
+        super().__init__(root)
+        self.compression = compression
+
+    def save(self, df: pd.DataFrame, name: str) -> str:
+        import pyarrow.parquet as pq
+
+        file_path = self.path(name)
+        pq.write_table(self._to_table(df), file_path, compression=self.compression)
+        return file_path
+
+    def load(self, name: str, columns: list = None) -> pd.DataFrame:
+        import pyarrow.parquet as pq
+
+        return pq.read_table(self.path(name), columns=columns).to_pandas()
+
+
+class ArrowIPCArtifactStore(_ArrowArtifactStore):
+    """
+    Arrow IPC (Feather v2) hand-off.
+
+    Files are written uncompressed so they can be memory-mapped on load; with
+    `memory_map=True` numeric columns are read straight from the page cache.
+    """
+
+    extension = '.arrow'
+
+    def __init__(self, root: str, memory_map: bool = True):
+        super().__init__(root)
+        self.memory_map = memory_map
+
+    def save(self, df: pd.DataFrame, name: str) -> str:
+        import pyarrow as pa
+
+        file_path = self.path(name)
+        table = self._to_table(df)
+        with pa.OSFile(file_path, 'wb') as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        return file_path
+
+    def load(self, name: str, columns: list = None) -> pd.DataFrame:
+        import pyarrow as pa
+
+        file_path = self.path(name)
+        source = pa.memory_map(file_path, 'r') if self.memory_map else pa.OSFile(file_path, 'rb')
+        with source:
+            table = pa.ipc.open_file(source).read_all()
+            if columns is not None:
+                table = table.select(columns)
+            return table.to_pandas()
+
+
+ARTIFACT_STORES = {
+    'csv': CSVArtifactStore,
+    'parquet': ParquetArtifactStore,
+    'arrow': ArrowIPCArtifactStore,
+}
+
+
+def get_artifact_store(root: str, kind: str = None, **kwargs) -> ArtifactStore:
+    """
+    Build an artifact store for `root`.
+
+    Parameters:
+    root (str): Directory holding the artifacts.
+    kind (str): 'parquet', 'arrow' or 'csv'. Defaults to the ARTIFACT_FORMAT
+        environment variable, then 'parquet'.
+    """
+    kind = (kind or os.getenv('ARTIFACT_FORMAT') or 'parquet').lower()
+    if kind not in ARTIFACT_STORES:
+        raise ValueError(f"Unknown artifact store '{kind}'. Use one of: {', '.join(ARTIFACT_STORES)}")
+    return ARTIFACT_STORES[kind](root, **kwargs)
@@ -1,36 +1,165 @@
-from sklearn.preprocessing import LabelEncoder
+import numpy as np
+import pandas as pd
 
-def encode_data(df):
-    df = df.copy()
+# Các mapping giá trị rời rạc
+VALUE_MAPPINGS = {
+    'conduct_score': {'<50': 0, '50-64': 1, '65-79': 2, '80-89': 3, '90-100': 4},
+    'last_semester_GPA': {'<5': 0, '5-6': 1, '6-7': 2, '7-8': 3, '8-9': 4, '9-10': 5},
+    'last_semester_student_ranking': {'Trung bình': 0, 'Khá': 1, 'Giỏi': 2, 'Xuất sắc': 3},
+    'self_study_hours': {'< 1': 0, '1 - 2': 1, '2 - 3': 2, '3 - 4': 3, '> 4': 4},
+    'amount_hours_spent_on_social_media': {'< 2h': 0, '2 - 5h': 1, '5 - 7h': 2, '> 7h': 3},
+    'average_time_spent_sleeping': {'< 5': 0, '5 - 6.9': 1, '7 - 9': 2, '> 9': 3},
+    'class_attendance_percent': {'< 20%': 0, '20 - 50': 1, '50 - 80': 2, '80 - 100': 3}
+}
 
-    # Label Encoding cho 'gender' và 'major'
-    encoder_gender = LabelEncoder()
-    encoder_major = LabelEncoder()
+CODE_DTYPE = np.int8
 
-    df['gender'] = encoder_gender.fit_transform(df['gender'])
-    df['major'] = encoder_major.fit_transform(df['major'])
+def to_int_codes(col, values, dtype=CODE_DTYPE):
+    """
+    Cast numeric `values` to the integer `dtype`.
 
-    # Các mapping giá trị rời rạc
-    replacements = {
-        'conduct_score': {'<50': 0, '50-64': 1, '65-79': 2, '80-89': 3, '90-100': 4},
-        'last_semester_GPA': {'<5': 0, '5-6': 1, '6-7': 2, '7-8': 3, '8-9': 4, '9-10': 5},
-        'last_semester_student_ranking': {'Trung bình': 0, 'Khá': 1, 'Giỏi': 2, 'Xuất sắc': 3},
-        'self_study_hours': {'< 1': 0, '1 - 2': 1, '2 - 3': 2, '3 - 4': 3, '> 4': 4},
-        'amount_hours_spent_on_social_media': {'< 2h': 0, '2 - 5h': 1, '5 - 7h': 2, '> 7h': 3},
-        'average_time_spent_sleeping': {'< 5': 0, '5 - 6.9': 1, '7 - 9': 2, '> 9': 3},
-        'class_attendance_percent': {'< 20%': 0, '20 - 50': 1, '50 - 80': 2, '80 - 100': 3}
-    }
+    Raises ValueError instead of silently corrupting data: missing or
+    non-numeric values, fractions, and values outside the dtype's range.
+    """
+    try:
+        numeric = pd.to_numeric(pd.Series(np.asarray(values, dtype=object).ravel()))
+    except (ValueError, TypeError):
+        raise ValueError(f"'{col}' has non-numeric values") from None
+    info = np.iinfo(dtype)
+    if numeric.isna().any() or (numeric % 1 != 0).any() \
+            or numeric.min() < info.min or numeric.max() > info.max:
+        raise ValueError(f"'{col}' does not fit in {np.dtype(dtype).name}")
+    return numeric.to_numpy().astype(dtype).reshape(np.shape(values))
 
-    for col, mapping in replacements.items():
-        df[col] = df[col].replace(mapping)
+def fit_label_mapping(values):
+    """Return the {label: code} mapping LabelEncoder would fit on `values` (sorted labels)."""
+    return {label: code for code, label in enumerate(sorted(pd.unique(np.asarray(values, dtype=object))))}
 
-    df = df.infer_objects(copy=False)
+def extend_label_mapping(mapping, values):
+    """
+    Return a copy of `mapping` with codes appended for labels it has not seen yet.
 
-    # Trả lại thêm cả encoder mapping
-    gender_mapping = dict(zip(encoder_gender.classes_, encoder_gender.transform(encoder_gender.classes_)))
-    major_mapping = dict(zip(encoder_major.classes_, encoder_major.transform(encoder_major.classes_)))
+    Existing codes never change, so data encoded earlier stays valid; new labels get
+    the next free codes in sorted order.
+    """
+    mapping = dict(mapping)
+    next_code = max(mapping.values(), default=-1) + 1
+    for label in sorted(set(values) - set(mapping)):
+        mapping[label] = next_code
+        next_code += 1
+    return mapping
+
+class FeatureEncoder:
+    """
+    Fitted encoder for the survey's categorical columns.
+
+    Every {label: code} mapping (gender, major and VALUE_MAPPINGS) is compiled once
+    into a category list plus a code lookup array. Frames are encoded column by
+    column through categorical codes into a single int8 matrix; single records and
+    NumPy rows use plain dict lookups. Columns without a mapping are already
+    numeric and are only cast. The encoder pickles as-is and round-trips through
+    `to_dict` / `from_dict` for JSON state files.
+    """
+
+    def __init__(self, gender_mapping=None, major_mapping=None, value_mappings=None):
+        self.gender_mapping = gender_mapping
+        self.major_mapping = major_mapping
+        self.value_mappings = dict(VALUE_MAPPINGS if value_mappings is None else value_mappings)
+        if gender_mapping is not None and major_mapping is not None:
+            self._compile()
+
+    def fit(self, df):
+        """Fit the gender/major mappings that were not given, on `df`."""
+        if self.gender_mapping is None:
+            self.gender_mapping = fit_label_mapping(df['gender'])
+        if self.major_mapping is None:
+            self.major_mapping = fit_label_mapping(df['major'])
+        self._compile()
+        return self
+
+    def _compile(self):
+        self.mappings = dict(self.value_mappings, gender=self.gender_mapping, major=self.major_mapping)
+        info = np.iinfo(CODE_DTYPE)
+        self._categories = {}
+        self._lookups = {}
+        for col, mapping in self.mappings.items():
+            codes = np.array(list(mapping.values()), dtype=np.int64)
+            if len(codes) and (codes.min() < info.min or codes.max() > info.max):
+                raise ValueError(f"Codes of '{col}' do not fit in {np.dtype(CODE_DTYPE).name}")
+            self._categories[col] = pd.Index(list(mapping.keys()))
+            self._lookups[col] = codes.astype(CODE_DTYPE)
+
+    def _check_fitted(self):
+        if not hasattr(self, 'mappings'):
+            raise ValueError("FeatureEncoder is not fitted; call fit() or pass both mappings")
+
+    def _encode_column(self, col, values):
+        if col not in self._lookups:
+            return to_int_codes(col, values)
+        codes = pd.Categorical(values, categories=self._categories[col]).codes
+        if (codes < 0).any():
+            unknown = pd.unique(np.asarray(values, dtype=object)[codes < 0])
+            raise ValueError(f"Unknown values for '{col}': {list(unknown)}")
+        return self._lookups[col][codes]
 
-    for col in df.columns:
-        df[col] = df[col].astype('int64')
+    def transform(self, df):
+        """Encode every column of `df` into a new int8 DataFrame."""
+        self._check_fitted()
+        encoded = np.empty((len(df), len(df.columns)), dtype=CODE_DTYPE)
+        for i, col in enumerate(df.columns):
+            encoded[:, i] = self._encode_column(col, df[col].to_numpy())
+        return pd.DataFrame(encoded, index=df.index, columns=df.columns)
 
-    return df, gender_mapping, major_mapping
+    def fit_transform(self, df):
+        return self.fit(df).transform(df)
+
+    def transform_record(self, record, columns):
+        """Encode one record (a dict keyed by column) into an int8 vector in `columns` order."""
+        self._check_fitted()
+        encoded = np.empty(len(columns), dtype=CODE_DTYPE)
+        for i, col in enumerate(columns):
+            if col not in record:
+                raise ValueError(f"Missing value for '{col}'")
+            value = record[col]
+            if col not in self.mappings:
+                encoded[i] = to_int_codes(col, [value])[0]
+                continue
+            try:
+                encoded[i] = self.mappings[col][value]
+            except (KeyError, TypeError):
+                raise ValueError(f"Unknown value {value!r} for '{col}'") from None
+        return encoded
+
+    def transform_array(self, values, columns):
+        """Encode a (n_rows, len(columns)) array of raw values into an int8 matrix."""
+        self._check_fitted()
+        values = np.asarray(values, dtype=object)
+        encoded = np.empty(values.shape, dtype=CODE_DTYPE)
+        for i, col in enumerate(columns):
+            encoded[:, i] = self._encode_column(col, values[:, i])
+        return encoded
+
+    def to_dict(self):
+        self._check_fitted()
+        return {
+            'gender_mapping': {str(k): int(v) for k, v in self.gender_mapping.items()},
+            'major_mapping': {str(k): int(v) for k, v in self.major_mapping.items()},
+            'value_mappings': self.value_mappings,
+        }
+
+    @classmethod
+    def from_dict(cls, state):
+        return cls(state['gender_mapping'], state['major_mapping'], state.get('value_mappings'))
+
+def encode_data(df, copy=True, gender_mapping=None, major_mapping=None):
+    """
+    Encode categorical columns to int8 codes with a FeatureEncoder.
+
+    gender_mapping / major_mapping: pre-fitted {label: code} mappings (e.g. from a
+    streaming first pass). When omitted they are fitted on `df`.
+    The input frame is never modified, so `copy` is only kept for compatibility.
+    """
+    encoder = FeatureEncoder(gender_mapping, major_mapping).fit(df)
+
+    # Trả lại thêm cả encoder mapping
+    return encoder.transform(df), encoder.gender_mapping, encoder.major_mapping
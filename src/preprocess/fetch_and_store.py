@@ -1,6 +1,8 @@
 from dotenv import load_dotenv
 import os
 import pandas as pd
+from .raw_loader import load_raw_data, is_local_workbook
+from .schema import apply_schema
 
 load_dotenv()
 file_id = os.getenv("FILE_ID")
@@ -11,22 +13,29 @@ def retrieve_data(file_id = file_id):
 
     Parameters:
     url (str): The URL of the Google Sheets document in CSV format.
+    Local workbooks are read through the Parquet cache of `load_raw_data`.
     """
     try:
+        if is_local_workbook(file_id):
+            return load_raw_data(file_id)
         df = pd.read_excel(file_id, header=0)
         return df
     except Exception as e:
         print(f"An error occurred while retrieving data: {e}")
         return None
 
-def save_data(data, file_name='./data/raw_data.csv'):
+def save_data(data, file_name='./data/raw_data.csv', schema=None):
     """
     Save the given DataFrame to a CSV file.
 
     Parameters:
     data (DataFrame): The DataFrame to save.
     file_name (str): The name of the file to save the data to.
+    schema (dict): Optional dtype schema (see schema.py) the data is validated against;
+        a violation raises ValueError and nothing is written.
     """
+    if schema is not None:
+        data = apply_schema(data, schema)
     try:
         data.to_csv(file_name, index=False)
         print(f"Data saved to {file_name}")
@@ -0,0 +1,177 @@
+from abc import ABC, abstractmethod
+
+import numpy as np
+import pandas as pd
+
+
+def _is_missing(value) -> bool:
+    return value is None or (isinstance(value, float) and np.isnan(value))
+
+
+def _column_modes(df: pd.DataFrame) -> dict:
+    """Most frequent non-null value per column (smallest value on ties)."""
+    modes = {}
+    for col in df.columns:
+        mode = df[col].mode(dropna=True)
+        modes[col] = mode.iloc[0] if len(mode) else np.nan
+    return modes
+
+
+class Imputer(ABC):
+    """
+    Base class of the fitted imputers.
+
+    `fit` learns fill values from a frame once; `transform` returns a new frame
+    (the input is never modified) and `transform_record` fills a single response
+    dict for the serving path. `columns=None` imputes every column that has
+    missing values at fit time. Imputers are plain objects and pickle as-is.
+    """
+
+    def __init__(self, columns=None):
+        self.columns = columns
+
+    def _fit_columns(self, df):
+        columns = self.columns if self.columns is not None else df.columns[df.isnull().any()]
+        self.columns_ = [col for col in columns if col in df.columns]
+
+    @abstractmethod
+    def fit(self, df: pd.DataFrame):
+        """Learn the fill values from `df` and return self."""
+
+    @abstractmethod
+    def transform(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Return a copy of `df` with the fitted columns filled."""
+
+    def fit_transform(self, df: pd.DataFrame) -> pd.DataFrame:
+        return self.fit(df).transform(df)
+
+    def transform_record(self, record: dict) -> dict:
+        """Return a copy of `record` with its missing answers filled."""
+        filled = self.transform(pd.DataFrame([record]))
+        return dict(record, **{col: filled.at[0, col] for col in self.columns_})
+
+
+class ModeImputer(Imputer):
+    """Fill each column with its most frequent answer."""
+
+    def fit(self, df):
+        self._fit_columns(df)
+        self.modes_ = _column_modes(df[self.columns_])
+        return self
+
+    def transform(self, df):
+        return df.fillna({col: mode for col, mode in self.modes_.items() if col in df.columns})
+
+    def transform_record(self, record):
+        record = dict(record)
+        for col, mode in self.modes_.items():
+            if _is_missing(record.get(col)):
+                record[col] = mode
+        return record
+
+
+class GroupModeImputer(Imputer):
+    """
+    Fill each column with its most frequent answer within the row's `group_col`
+    group (e.g. the same major), falling back to the overall mode for groups that
+    were not seen or never answered the question.
+    """
+
+    def __init__(self, group_col='major', columns=None):
+        super().__init__(columns)
+        self.group_col = group_col
+
+    def fit(self, df):
+        self._fit_columns(df)
+        self.columns_ = [col for col in self.columns_ if col != self.group_col]
+        self.modes_ = _column_modes(df[self.columns_])
+        self.group_modes_ = {}
+        for col in self.columns_:
+            counts = df.groupby([self.group_col, col], observed=True, dropna=True).size()
+            if counts.empty:
+                self.group_modes_[col] = {}
+                continue
+            # Highest count per group; sort by value first so ties pick the smallest one
+            counts = counts.reset_index(name='n').sort_values([col])
+            best = counts.loc[counts.groupby(self.group_col, observed=True)['n'].idxmax()]
+            self.group_modes_[col] = dict(zip(best[self.group_col], best[col]))
+        return self
+
+    def transform(self, df):
+        fills = {}
+        for col in self.columns_:
+            if col not in df.columns or not df[col].isnull().any():
+                continue
+            by_group = df[self.group_col].map(self.group_modes_[col])
+            fills[col] = df[col].fillna(by_group.fillna(self.modes_[col]).infer_objects())
+        return df.assign(**fills) if fills else df
+
+    def transform_record(self, record):
+        record = dict(record)
+        for col in self.columns_:
+            if _is_missing(record.get(col)):
+                record[col] = self.group_modes_[col].get(record.get(self.group_col), self.modes_[col])
+        return record
+
+
+class IterativeImputer(Imputer):
+    """
+    Round-robin regression imputation of ordinal answers.
+
+    Wraps scikit-learn's IterativeImputer on the numeric columns: each incomplete
+    column is regressed on the others for `max_iter` rounds. Imputed values are
+    rounded and clipped to the answers observed at fit time, so they stay valid
+    ordinal codes.
+    """
+
+    def __init__(self, columns=None, max_iter=10, random_state=42):
+        super().__init__(columns)
+        self.max_iter = max_iter
+        self.random_state = random_state
+
+    def _numeric(self, df):
+        return df[self.features_].apply(pd.to_numeric, errors='coerce')
+
+    def fit(self, df):
+        from sklearn.experimental import enable_iterative_imputer  # noqa: F401
+        from sklearn.impute import IterativeImputer as SklearnIterativeImputer
+
+        self._fit_columns(df)
+        numeric = df.infer_objects().select_dtypes(include='number').columns
+        candidates = list(dict.fromkeys([*numeric, *self.columns_]))
+        # Text columns cannot enter the regression
+        self.features_ = [col for col in candidates if pd.to_numeric(df[col], errors='coerce').notna().any()]
+        self.columns_ = [col for col in self.columns_ if col in self.features_]
+        values = self._numeric(df)
+        self.low_ = values[self.columns_].min().to_dict()
+        self.high_ = values[self.columns_].max().to_dict()
+        self.imputer_ = SklearnIterativeImputer(max_iter=self.max_iter, random_state=self.random_state)
+        self.imputer_.fit(values.to_numpy(dtype=float))
+        return self
+
+    def transform(self, df):
+        values = self._numeric(df)
+        missing = values[self.columns_].isnull()
+        if not missing.any().any():
+            return df
+        imputed = pd.DataFrame(self.imputer_.transform(values.to_numpy(dtype=float)),
+                               index=df.index, columns=self.features_)
+        fills = {}
+        for col in self.columns_:
+            estimate = imputed[col].round().clip(self.low_[col], self.high_[col])
+            fills[col] = values[col].where(~missing[col], estimate)
+        return df.assign(**fills)
+
+
+IMPUTERS = {
+    'mode': ModeImputer,
+    'group_mode': GroupModeImputer,
+    'iterative': IterativeImputer,
+}
+
+
+def get_imputer(name: str, **kwargs) -> Imputer:
+    """Imputer registered under `name` in IMPUTERS."""
+    if name not in IMPUTERS:
+        raise ValueError(f"Unknown imputer '{name}'. Available: {', '.join(IMPUTERS)}")
+    return IMPUTERS[name](**kwargs)
@@ -0,0 +1,158 @@
+import json
+import os
+import joblib
+import pandas as pd
+
+from .rename_columns import rename_column, max_timestamp, row_keys, watermark_keys
+from .missing_data_dealing import run_little_mcar_test
+from .encode_data import extend_label_mapping
+from .pipeline import build_preprocess_pipeline
+from .fetch_and_store import retrieve_data, save_data
+from .schema import PROCESSED_SCHEMA, FINAL_SCHEMA, write_dataset
+
+TIMESTAMP_COL = 'time_stamp'
+STATE_PATH = './data/preprocess_state.json'
+IMPUTER_PATH = './data/imputer.joblib'
+
+
+def load_state(state_path: str = STATE_PATH):
+    """Return the saved incremental state, or None before the first run."""
+    if not os.path.exists(state_path):
+        return None
+    with open(state_path, encoding='utf-8') as f:
+        state = json.load(f)
+    if state.get('watermark'):
+        state['watermark'] = pd.Timestamp(state['watermark'])
+    return state
+
+
+def save_state(watermark, gender_mapping, major_mapping, columns, final_columns,
+               state_path: str = STATE_PATH, watermark_keys=None):
+    """
+    Persist the high-water mark of processed `time_stamp` values together with
+    everything needed to append new rows consistently: encoder mappings and the
+    column layout of processed_data / final_processed_data. `watermark_keys` are
+    the row keys of the processed rows at the watermark (all of them without one),
+    so responses that arrive later with the same timestamp are still picked up.
+    """
+    state = {
+        'watermark': watermark.isoformat() if watermark is not None else None,
+        'watermark_keys': list(watermark_keys or []),
+        'gender_mapping': {str(k): int(v) for k, v in gender_mapping.items()},
+        'major_mapping': {str(k): int(v) for k, v in major_mapping.items()},
+        'columns': list(columns),
+        'final_columns': list(final_columns),
+    }
+    with open(state_path, 'w', encoding='utf-8') as f:
+        json.dump(state, f, ensure_ascii=False, indent=2)
+
+
+def save_imputer(imputer, imputer_path: str = IMPUTER_PATH):
+    """Persist the imputer fitted by the full run (removes a stale one when there is none)."""
+    if imputer is not None:
+        joblib.dump(imputer, imputer_path)
+    elif os.path.exists(imputer_path):
+        os.remove(imputer_path)
+
+
+def load_imputer(imputer_path: str = IMPUTER_PATH):
+    return joblib.load(imputer_path) if os.path.exists(imputer_path) else None
+
+
+def _align_to(columns, imputer=None):
+    """
+    Pipeline step replacing the MCAR step: keep the stored column layout, filling
+    missing answers with the stored imputer when the full run used one.
+    """
+    def _align(df, reports):
+        # MCAR is reported on the new batch only
+        reports['mcar'] = run_little_mcar_test(df)
+        result = reports['mcar']
+        print(f"📊 MCAR Test Result (new rows): Chi2={result['chi2']}, df={result['df']}, p-value={result['p']}")
+        missing = [col for col in columns if col not in df.columns]
+        if missing:
+            raise ValueError(f"New responses are missing columns: {missing}")
+        df = df[columns]
+        if imputer is not None:
+            df = imputer.transform(df)
+        incomplete = df.isnull().any(axis=1)
+        if incomplete.any():
+            print(f"⚠️ Skipping {int(incomplete.sum())} new responses with missing answers.")
+            df = df[~incomplete]
+        return df
+    return _align
+
+
+def select_new_rows(data, watermark, seen_keys=None):
+    """
+    Rows of a renamed raw frame not processed yet: those after `watermark`, plus
+    those at it whose row key is not in `seen_keys`. Without a watermark every row
+    not in `seen_keys` is new. States saved without keys treat the watermark as
+    exclusive.
+    """
+    if watermark is None:
+        return data[~row_keys(data).isin(seen_keys or [])]
+    timestamps = pd.to_datetime(data[TIMESTAMP_COL], errors='coerce')
+    is_new = timestamps > watermark
+    if seen_keys is not None:
+        is_new |= (timestamps == watermark) & ~row_keys(data).isin(seen_keys)
+    return data[is_new]
+
+
+def run_incremental(file_id=None, processed_path='./data/processed_data.csv',
+                    final_path='./data/final_processed_data.csv', state_path=STATE_PATH,
+                    missing_strategy='drop', imputer_path=IMPUTER_PATH):
+    """
+    Process only responses not seen by earlier runs (see select_new_rows) and
+    append them to processed_data / final_processed_data.
+
+    Gender/major codes are taken from the stored mappings (new labels get new codes,
+    existing ones never change) so appended rows stay consistent with earlier ones.
+    Without a saved state this falls back to a full run with `missing_strategy`
+    that writes the state (and the fitted imputer, reused for later appends).
+    """
+    state = load_state(state_path)
+    data = rename_column(retrieve_data(file_id))
+
+    if state is None or not os.path.exists(processed_path) or not os.path.exists(final_path):
+        print("ℹ️ No incremental state found, processing full history.")
+        watermark = max_timestamp(data)
+        keys = watermark_keys(data, watermark)
+        pipeline = build_preprocess_pipeline(missing_strategy=missing_strategy)
+        outputs = pipeline.run(['processed_data', 'final_processed_data'], source=data)
+        processed, final = outputs['processed_data'], outputs['final_processed_data']
+        save_data(processed, file_name=processed_path, schema=PROCESSED_SCHEMA)
+        save_data(final, file_name=final_path, schema=FINAL_SCHEMA)
+        mappings = pipeline.reports['encode']
+        save_state(watermark, mappings['gender_mapping'], mappings['major_mapping'],
+                   processed.columns, final.columns, state_path, keys)
+        save_imputer(pipeline.reports['imputer'], imputer_path)
+        return len(final)
+
+    new_rows = select_new_rows(data, state['watermark'], state.get('watermark_keys'))
+    print(f"📥 {len(new_rows)} new responses since {state['watermark']}.")
+    if new_rows.empty:
+        return 0
+    # Every fetched row up to the latest timestamp has now been processed
+    watermark = max_timestamp(data)
+
+    gender_mapping = extend_label_mapping(state['gender_mapping'], new_rows['gender'].dropna())
+    major_mapping = extend_label_mapping(state['major_mapping'], new_rows['major'].dropna())
+
+    pipeline = build_preprocess_pipeline(gender_mapping, major_mapping)
+    imputer = load_imputer(imputer_path)
+    pipeline.add_step('processed_data', _align_to(state['columns'], imputer), input='checked',
+                      params={'columns': state['columns'], 'imputer': imputer is not None},
+                      start_msg="🔎 Aligning new responses to stored columns...",
+                      done_msg="✅ New responses aligned.")
+    outputs = pipeline.run(['processed_data', 'final_processed_data'], source=new_rows.copy())
+    processed = outputs['processed_data']
+    final = outputs['final_processed_data'][state['final_columns']]
+
+    write_dataset(processed, processed_path, PROCESSED_SCHEMA, mode='a', header=False)
+    write_dataset(final, final_path, FINAL_SCHEMA, mode='a', header=False)
+    print(f"✅ Appended {len(final)} rows to {processed_path} and {final_path}.")
+
+    save_state(watermark, gender_mapping, major_mapping, state['columns'], state['final_columns'], state_path,
+               watermark_keys(data, watermark))
+    return len(final)
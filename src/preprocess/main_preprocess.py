@@ -1,55 +1,46 @@
 from dotenv import load_dotenv
 import os
-from . import (
-    rename_column,
-    PSSCalculator,
-    GeneralChecker,
-    run_little_mcar_test,
-)
-from .encode_data import encode_data
+from .pipeline import build_preprocess_pipeline
+from .incremental import save_state, save_imputer
+from .step_cache import cache_from_env, hash_file
 from .fetch_and_store import retrieve_data, save_data
-import pandas as pd
+from .schema import PROCESSED_SCHEMA, FINAL_SCHEMA
 
 def main_preprocess():
     print("🔄 Loading environment variables...")
     load_dotenv()
 
-    print("📥 Retrieving data from Google Drive...")
     file_id = os.getenv("FILE_ID")
-    data = retrieve_data(file_id)
-    print("✅ Data retrieved successfully.")
-
-    print("🔧 Renaming columns...")
-    data = rename_column(data)
-    print("✅ Columns renamed.")
-
-    print("🧠 Calculating PSS score...")
-    pss_calculator = PSSCalculator(data)
-    data = pss_calculator.calculate()
-    print("✅ PSS score calculated.")
-
-    print("🧪 Checking general data integrity...")
-    general_checker = GeneralChecker(data)
-    data = general_checker.do_all_checks()
-    print("✅ Data integrity check completed.")
-
-    print("🔎 Running MCAR test...")
-    result = run_little_mcar_test(data)
-    print("✅ MCAR test finished.")
-    print(f"📊 MCAR Test Result: Chi2={result['chi2']}, df={result['df']}, p-value={result['p']}")
-    
+
+    def load_source():
+        print("📥 Retrieving data from Google Drive...")
+        data = retrieve_data(file_id)
+        print("✅ Data retrieved successfully.")
+        return data
+
+    # A local file is addressed by its content, so cached steps skip reading it at all
+    source_key = hash_file(file_id) if file_id and os.path.isfile(file_id) else None
+
+    # drop (default) | mode | group_mode | iterative
+    missing_strategy = os.getenv("MISSING_STRATEGY", "drop")
+    pipeline = build_preprocess_pipeline(cache=cache_from_env(), missing_strategy=missing_strategy)
+    outputs = pipeline.run(['processed_data', 'final_processed_data'], source=load_source, source_key=source_key)
+    processed, final = outputs['processed_data'], outputs['final_processed_data']
+
     print("📊 Preview of final DataFrame:")
-    print(data['conduct_score'].unique())
+    print(processed['conduct_score'].unique())
 
     print("💾 Saving processed data...")
-    save_data(data, file_name='./data/processed_data.csv')
+    save_data(processed, file_name='./data/processed_data.csv', schema=PROCESSED_SCHEMA)
     print("✅ Data saved successfully.")
 
-    print("🔄 Encoding categorical data...")
-    data, gender_map, major_map = encode_data(data)
-    print("✅ Categorical data encoded.")
-    data.drop(columns = 'conduct_score', inplace=True)
     print("Saving final processed data...")
-    print(data.dtypes)
-    save_data(data, file_name='./data/final_processed_data.csv')
-    print("✅ Final processed data saved.")
\ No newline at end of file
+    print(final.dtypes)
+    save_data(final, file_name='./data/final_processed_data.csv', schema=FINAL_SCHEMA)
+    print("✅ Final processed data saved.")
+
+    # Lets `--config preprocess_incremental` pick up from this run
+    mappings = pipeline.reports['encode']
+    save_state(pipeline.reports['watermark'], mappings['gender_mapping'], mappings['major_mapping'], processed.columns, final.columns,
+               watermark_keys=pipeline.reports['watermark_keys'])
+    save_imputer(pipeline.reports['imputer'])
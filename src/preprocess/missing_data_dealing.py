@@ -2,35 +2,121 @@ import numpy as np
 import pandas as pd
 from scipy.stats import chi2
 
+
+def missing_patterns(values: np.ndarray):
+    """
+    Group the rows of a float matrix by their missingness pattern.
+
+    Each pattern is encoded as an integer bitmask (bit j set when column j is
+    missing). Group sizes and per-column sums of the observed values are
+    accumulated with `np.bincount`.
+
+    Returns:
+        (keys, sizes, sums): bitmask per group, rows per group, (groups, columns) sums.
+    """
+    n_rows, p = values.shape
+    missing = np.isnan(values)
+    if p <= 62:
+        row_keys = missing.astype(np.int64) @ (np.int64(1) << np.arange(p, dtype=np.int64))
+        keys, inverse = np.unique(row_keys, return_inverse=True)
+    else:
+        unique_rows, inverse = np.unique(missing, axis=0, return_inverse=True)
+        keys = np.array([sum(1 << j for j in np.flatnonzero(row)) for row in unique_rows], dtype=object)
+    inverse = inverse.ravel()
+
+    filled = np.where(missing, 0.0, values)
+    sizes = np.bincount(inverse, minlength=len(keys))
+    sums = np.empty((len(keys), p))
+    for j in range(p):
+        sums[:, j] = np.bincount(inverse, weights=filled[:, j], minlength=len(keys))
+    return keys, sizes, sums
+
+
+def pairwise_moments(values: np.ndarray):
+    """Pairwise-complete counts, sums and cross products of a float matrix with NaNs."""
+    observed = ~np.isnan(values)
+    filled = np.where(observed, values, 0.0)
+    present = observed.astype(float)
+    return present.T @ present, filled.T @ present, filled.T @ filled
+
+
+def moments_to_mean_cov(pair_count, pair_sum, cross):
+    """Column means and pairwise-complete covariance (as `DataFrame.cov`) from `pairwise_moments`."""
+    with np.errstate(invalid='ignore', divide='ignore'):
+        means = np.diag(pair_sum) / np.diag(pair_count)
+        cov = (cross - pair_sum * pair_sum.T / pair_count) / (pair_count - 1)
+    return means, cov
+
+
+def little_mcar_statistic(means, cov, keys, sizes, sums) -> dict:
+    """
+    Little's MCAR statistic from per-pattern group sizes and sums.
+
+    d² = Σ_g n_g (ȳ_g − μ)_O(g)ᵀ Σ_O(g)⁻¹ (ȳ_g − μ)_O(g), where O(g) are the columns
+    observed in pattern g, with df = Σ_g p_g − p. The pattern-specific sub-covariances
+    are inverted as one batch: for each pattern the covariance is kept on its
+    observed block and replaced by the identity elsewhere, so the batched inverse
+    holds Σ_O(g)⁻¹ on that block and the zeroed differences ignore the rest.
+    """
+    p = len(means)
+    means = np.nan_to_num(means)
+    cov = np.nan_to_num(cov)
+    bits = np.array([1 << j for j in range(p)], dtype=object if keys.dtype == object else np.int64)
+    observed = (keys[:, None] & bits[None, :]) == 0
+
+    diff = np.where(observed, sums / sizes[:, None] - means, 0.0)
+    both = observed[:, :, None] & observed[:, None, :]
+    sub_cov = np.where(both, cov, np.eye(p))
+    inv_cov = np.linalg.pinv(sub_cov)
+
+    chi_square = float(np.einsum('g,gi,gij,gj->', sizes, diff, inv_cov, diff))
+    df_total = int(observed.sum()) - p
+    p_value = float(chi2.sf(chi_square, df_total)) if df_total > 0 else 1.0
+    return {"chi2": chi_square, "df": df_total, "p": p_value}
+
+
 def run_little_mcar_test(data: pd.DataFrame):
     """
     Little's MCAR test implementation.
-    Removes columns with missing values after the test.
+
+    The test runs on all numeric columns, using pairwise-complete means and
+    covariance. `data` is not modified; see `handle_missing` for what to do with
+    the missing values afterwards.
     """
-    df = data.copy()
-    missing_cols = df.columns[df.isnull().any()]
-    df = df[missing_cols]
+    if not data.isnull().any().any():
+        return {"chi2": 0.0, "df": 0, "p": 1.0}
+    numeric = data.infer_objects().select_dtypes(include='number')
+    if numeric.empty:
+        return {"chi2": 0.0, "df": 0, "p": 1.0}
 
-    patterns = df.isnull().astype(int)
-    pattern_strs = patterns.apply(lambda row: ''.join(row.astype(str)), axis=1)
-    groups = df.groupby(pattern_strs)
+    values = numeric.to_numpy(dtype=float)
+    means, cov = moments_to_mean_cov(*pairwise_moments(values))
+    return little_mcar_statistic(means, cov, *missing_patterns(values))
 
-    means = df.mean()
-    cov = df.cov()
-    inv_cov = np.linalg.pinv(cov)
 
-    chi_square = 0
-    df_total = 0
+def drop_missing_columns(data: pd.DataFrame) -> pd.DataFrame:
+    """New frame without the columns that have any missing value."""
+    return data.drop(columns=data.columns[data.isnull().any()])
 
-    for _, group in groups:
-        n_g = group.shape[0]
-        mean_g = group.mean()
-        diff = (mean_g - means).fillna(0).infer_objects(copy=False).values
-        stat = n_g * diff.T.dot(inv_cov).dot(diff)
-        chi_square += stat
-        df_total += len(diff[~np.isnan(diff)])
 
-    # ✅ Xóa các cột bị thiếu ra khỏi DataFrame gốc
-    data.drop(columns=missing_cols, inplace=True)
+MISSING_STRATEGIES = ('drop', 'mode', 'group_mode', 'iterative')
+
+
+def handle_missing(data: pd.DataFrame, strategy: str = 'drop'):
+    """
+    Deal with missing answers without modifying `data`.
+
+    strategy: 'drop' removes every column with a missing value (the historical
+    behaviour); any name from imputers.IMPUTERS fits that imputer and fills them.
+
+    Returns:
+        (DataFrame, Imputer or None): the new frame and the fitted imputer.
+    """
+    if strategy not in MISSING_STRATEGIES:
+        raise ValueError(f"Unknown missing-data strategy '{strategy}'. Available: {', '.join(MISSING_STRATEGIES)}")
+    if strategy == 'drop':
+        return drop_missing_columns(data), None
 
-    return {"chi2": chi_square, "df": df_total, "p": 1 - chi2.cdf(chi_square, df_total)}
+    from .imputers import get_imputer
+    imputer = get_imputer(strategy)
+    return imputer.fit_transform(data), imputer
@@ -0,0 +1,50 @@
+from .rename_columns import new_columns_name
+from .general_checking import GPA_RANGE_MAPPING
+from .student_ranking import StudentRankingEngine
+from .encode_data import FeatureEncoder
+
+_default_engine = None
+
+
+def _normalize(value) -> str:
+    return str(value).strip().replace('đến cận', '-').replace(' ', '')
+
+
+def featurize_response(response, feature_columns, encoder: FeatureEncoder,
+                       ranking_engine: StudentRankingEngine = None, imputer=None):
+    """
+    Encode a single raw survey response into the model's feature vector.
+
+    Applies the same steps as the batch pipeline to one record without pandas:
+    renaming (a positional raw row is zipped with the renamed headers), GPA range
+    normalization, student ranking from GPA and conduct, and the fitted
+    FeatureEncoder. PSS items and columns not in `feature_columns` are ignored.
+
+    Parameters:
+    response (dict or list): Answers keyed by renamed column, or a raw row in survey order.
+    feature_columns (list): Feature order expected by the model.
+    encoder (FeatureEncoder): Encoder fitted on the training data.
+    ranking_engine (StudentRankingEngine): Ranking rules, default engine when omitted.
+    imputer (Imputer): Fitted imputer filling missing answers, if the model was trained with one.
+
+    Returns:
+        np.ndarray: int8 codes in `feature_columns` order. Raises ValueError for unknown answers.
+    """
+    global _default_engine
+    if not isinstance(response, dict):
+        response = dict(zip(new_columns_name, response))
+    if ranking_engine is None:
+        if _default_engine is None:
+            _default_engine = StudentRankingEngine()
+        ranking_engine = _default_engine
+
+    record = dict(response)
+    gpa = record.get('last_semester_GPA')
+    record['last_semester_GPA'] = _normalize(GPA_RANGE_MAPPING.get(gpa, gpa))
+    record['conduct_score'] = _normalize(record.get('conduct_score'))
+    record['last_semester_student_ranking'] = ranking_engine.rank_one(record['last_semester_GPA'],
+                                                                      record['conduct_score'])
+
+    if imputer is not None:
+        record = imputer.transform_record(record)
+    return encoder.transform_record(record, feature_columns)
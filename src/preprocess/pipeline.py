@@ -0,0 +1,220 @@
+from contextlib import contextmanager
+import pandas as pd
+
+from .rename_columns import rename_column
+from .pss_caculate import PSSCalculator
+from .general_checking import GeneralChecker
+from .missing_data_dealing import run_little_mcar_test, handle_missing
+from .encode_data import encode_data
+from .rename_columns import max_timestamp, watermark_keys
+from .step_cache import StepCache, hash_bytes, hash_frame, code_hash
+
+
+@contextmanager
+def copy_on_write():
+    """Enable pandas Copy-on-Write for the duration of the block (no-op where it is always on)."""
+    try:
+        context = pd.option_context('mode.copy_on_write', True)
+        context.__enter__()
+    except (KeyError, pd.errors.OptionError):
+        context = None
+    try:
+        yield
+    finally:
+        if context is not None:
+            context.__exit__(None, None, None)
+
+
+class Step:
+    """
+    A node of the preprocessing graph.
+
+    `func(df, reports)` receives the frame produced by `input` and may modify it in
+    place; side results (test statistics, encoder mappings, ...) go into `reports`
+    under the step name. `params` are the step's settings that affect its output and
+    are part of its cache key.
+    """
+
+    def __init__(self, name, func, input=None, params=None, start_msg=None, done_msg=None):
+        self.name = name
+        self.func = func
+        self.input = input
+        self.params = params or {}
+        self.start_msg = start_msg
+        self.done_msg = done_msg
+
+
+class PreprocessPipeline:
+    """
+    Lazy preprocessing graph.
+
+    Steps are only declared when added; `run` walks back from the requested outputs,
+    executes the steps they depend on and returns just those outputs. Steps are fused
+    onto a single frame: each one works in place on its input, and a Copy-on-Write
+    snapshot is only taken when an intermediate frame is itself a requested output.
+
+    With a `StepCache`, every step output is stored under a content address derived
+    from the source data hash, the step parameters, the preprocessing code and its
+    input's address. `run` resumes from the latest cached step and skips everything
+    before it, including loading the source.
+    """
+
+    def __init__(self, cache: StepCache = None):
+        self.steps = {}
+        self.reports = {}
+        self.cache = cache
+
+    def add_step(self, name, func, input=None, params=None, start_msg=None, done_msg=None):
+        if input is not None and input not in self.steps:
+            raise ValueError(f"Step '{name}' depends on unknown step '{input}'")
+        self.steps[name] = Step(name, func, input, params, start_msg, done_msg)
+        return self
+
+    def plan(self, outputs):
+        """Return the ordered list of steps needed to produce `outputs`."""
+        needed = set()
+        for output in outputs:
+            if output not in self.steps:
+                raise ValueError(f"Unknown output '{output}'. Available: {', '.join(self.steps)}")
+            name = output
+            while name is not None and name not in needed:
+                needed.add(name)
+                name = self.steps[name].input
+        return [name for name in self.steps if name in needed]
+
+    def keys(self, plan, source_key):
+        """Content address of each step in `plan`."""
+        keys = {}
+        for name in plan:
+            step = self.steps[name]
+            parent = keys[step.input] if step.input is not None else source_key
+            keys[name] = hash_bytes(name, step.params, code_hash(), parent)
+        return keys
+
+    def run(self, outputs, source=None, source_key: str = None):
+        """
+        Execute the steps required for `outputs` and return them as a dict.
+
+        Parameters:
+        outputs (list): Names of the steps whose frames should be returned.
+        source (DataFrame or callable): Frame fed to root steps (steps without an
+            input). A callable is only invoked if a root step actually has to run.
+        source_key (str): Content hash of the source (e.g. `hash_file` of the raw
+            file). Computed from the frame when omitted.
+        """
+        outputs = list(outputs)
+        plan = self.plan(outputs)
+        self.reports = {}
+        results = {}
+        current = None
+        keys = {}
+
+        if self.cache is not None:
+            if source_key is None:
+                source = source() if callable(source) else source
+                source_key = hash_frame(source)
+            keys = self.keys(plan, source_key)
+            # Resume after the latest cached step whose requested predecessors are cached too;
+            # its entry carries the reports accumulated up to that step
+            for i in range(len(plan) - 1, -1, -1):
+                hit, value = self.cache.get(keys[plan[i]])
+                if not hit:
+                    continue
+                earlier = {}
+                for name in outputs:
+                    if name in plan[:i]:
+                        found, cached = self.cache.get(keys[name])
+                        if not found:
+                            break
+                        earlier[name] = cached[0]
+                else:
+                    current, self.reports = value
+                    results.update(earlier)
+                    print(f"⚡ Reusing cached step '{plan[i]}'.")
+                    if plan[i] in outputs:
+                        results[plan[i]] = current if i == len(plan) - 1 else current.copy(deep=False)
+                    plan = plan[i + 1:]
+                    break
+
+        if current is None and plan:
+            current = source() if callable(source) else source
+
+        with copy_on_write():
+            for name in plan:
+                step = self.steps[name]
+                if step.start_msg:
+                    print(step.start_msg)
+                current = step.func(current, self.reports)
+                if step.done_msg:
+                    print(step.done_msg)
+                if self.cache is not None:
+                    self.cache.put(keys[name], (current, self.reports))
+                if name in outputs:
+                    # Lazy snapshot: later in-place steps copy only the columns they touch
+                    is_last = name == plan[-1]
+                    results[name] = current if is_last else current.copy(deep=False)
+
+        return results
+
+
+def _rename(df, reports):
+    df = rename_column(df)
+    reports['watermark'] = max_timestamp(df)
+    reports['watermark_keys'] = watermark_keys(df, reports['watermark'])
+    return df
+
+
+def _calculate_pss(df, reports):
+    return PSSCalculator(df, copy=False).calculate()
+
+
+def _check_integrity(df, reports):
+    return GeneralChecker(df, copy=False).do_all_checks()
+
+
+def _missing_handler(strategy='drop'):
+    def _mcar(df, reports):
+        reports['mcar'] = run_little_mcar_test(df)
+        result = reports['mcar']
+        print(f"📊 MCAR Test Result: Chi2={result['chi2']}, df={result['df']}, p-value={result['p']}")
+        df, reports['imputer'] = handle_missing(df, strategy)
+        return df
+    return _mcar
+
+
+def _encoder(gender_mapping=None, major_mapping=None):
+    def _encode(df, reports):
+        df, gender_map, major_map = encode_data(df, copy=False,
+                                                gender_mapping=gender_mapping,
+                                                major_mapping=major_mapping)
+        reports['encode'] = {'gender_mapping': gender_map, 'major_mapping': major_map}
+        df.drop(columns='conduct_score', inplace=True)
+        return df
+    return _encode
+
+
+def build_preprocess_pipeline(gender_mapping=None, major_mapping=None, cache: StepCache = None,
+                              missing_strategy: str = 'drop') -> PreprocessPipeline:
+    """
+    Graph of the standard steps: rename → PSS → integrity → MCAR → encode.
+
+    gender_mapping / major_mapping: fixed encoder mappings to reuse instead of
+    refitting them on the data (see encode_data).
+    cache: optional StepCache to skip steps whose inputs are unchanged.
+    missing_strategy: 'drop' or an imputer name (see missing_data_dealing.handle_missing);
+    the fitted imputer is reported under reports['imputer'].
+    """
+    pipeline = PreprocessPipeline(cache)
+    pipeline.add_step('renamed', _rename,
+                      start_msg="🔧 Renaming columns...", done_msg="✅ Columns renamed.")
+    pipeline.add_step('pss', _calculate_pss, input='renamed',
+                      start_msg="🧠 Calculating PSS score...", done_msg="✅ PSS score calculated.")
+    pipeline.add_step('checked', _check_integrity, input='pss',
+                      start_msg="🧪 Checking general data integrity...", done_msg="✅ Data integrity check completed.")
+    pipeline.add_step('processed_data', _missing_handler(missing_strategy), input='checked',
+                      params={'missing_strategy': missing_strategy},
+                      start_msg="🔎 Running MCAR test...", done_msg="✅ MCAR test finished.")
+    pipeline.add_step('final_processed_data', _encoder(gender_mapping, major_mapping), input='processed_data',
+                      params={'gender_mapping': gender_mapping, 'major_mapping': major_mapping},
+                      start_msg="🔄 Encoding categorical data...", done_msg="✅ Categorical data encoded.")
+    return pipeline
@@ -1,51 +1,57 @@
+import numpy as np
 import pandas as pd
 
+PSS_ITEMS = [str(i) for i in range(1, 11)]
+# Positively stated questions, reverse scored (1-based index)
+REVERSE_ITEMS = ['4', '5', '7', '8']
+# Upper-exclusive class boundaries of the PSS total: [0, 9) → 0, [9, 17) → 1, ..., [33, 40] → 4
+TARGET_CUT_POINTS = (9, 17, 25, 33)
+
 class PSSCalculator:
     """
     Class to calculate PSS (Perceived Stress Scale) scores from a DataFrame.
+
+    The ten item columns are scored as one int8 matrix: reverse scoring is a single
+    array operation and the total is binned into classes with `np.digitize`.
     """
 
-    def __init__(self, df: pd.DataFrame):
-        self.df = df.copy()
+    def __init__(self, df: pd.DataFrame, copy: bool = True, cut_points=TARGET_CUT_POINTS):
+        self.df = df.copy() if copy else df
+        self.cut_points = cut_points
 
-    def _convert_columns_to_int(self):
-        """
-        Convert PSS question columns (1 to 10) to integer type.
-        """
-        for i in range(1, 11):
-            col_name = str(i)
-            if col_name in self.df.columns:
-                self.df[col_name] = self.df[col_name].astype(int)
-
-    def _reverse_score(self, x):
+    @staticmethod
+    def _reverse_score(x):
         """
         Reverse score mapping:
         0 → 4, 1 → 3, 2 → 2, 3 → 1, 4 → 0
         """
         return 4 - x
 
-    def _apply_reverse_scoring(self):
+    @staticmethod
+    def convert_target(val, cut_points=TARGET_CUT_POINTS):
+        """Map a PSS total (scalar or array) to its stress class."""
+        return np.digitize(val, cut_points)
+
+    @staticmethod
+    def score_items(items: np.ndarray, item_columns=PSS_ITEMS, reverse_items=REVERSE_ITEMS,
+                    cut_points=TARGET_CUT_POINTS) -> np.ndarray:
         """
-        Apply reverse scoring for positively stated questions.
-        Typically PSS uses reverse scoring for questions 4, 5, 7, 8 (1-based index).
+        Score a raw (n_rows, n_items) answer matrix without building a DataFrame.
+
+        Args:
+            items: Answers in 0-4, one column per entry of `item_columns`.
+            item_columns: Item names of the matrix columns.
+            reverse_items: Items to reverse score.
+            cut_points: Class boundaries passed to `np.digitize`.
+
+        Returns:
+            np.ndarray: Stress class per row.
         """
-        reverse_cols = ['4', '5', '7', '8']
-        for col in reverse_cols:
-            if col in self.df.columns:
-                self.df[col] = self.df[col].apply(self._reverse_score)
-                
-    @staticmethod
-    def convert_target(val):
-        if 0 <= val < 9:
-            return 0
-        elif 9 <= val < 17:
-            return 1
-        elif 17 <= val < 25:
-            return 2
-        elif 25 <= val < 33:
-            return 3
-        else:
-            return 4
+        items = np.asarray(items, dtype=np.int8)
+        reverse_mask = np.isin(item_columns, reverse_items)
+        scored = np.where(reverse_mask, PSSCalculator._reverse_score(items), items)
+        totals = scored.sum(axis=1, dtype=np.int16)
+        return PSSCalculator.convert_target(totals, cut_points)
 
     def calculate(self):
         """
@@ -54,13 +60,10 @@ class PSSCalculator:
         Returns:
             pd.DataFrame: Updated DataFrame with 'PSS Score' column.
         """
-        self._convert_columns_to_int()
-        self._apply_reverse_scoring()
-
-        # Sum scores from column '1' to '10'
-        pss_columns = [str(i) for i in range(1, 11) if str(i) in self.df.columns]
-        self.df["target"] = self.df[pss_columns].sum(axis=1)
-        self.df['target'] = self.df['target'].apply(self.convert_target)
+        # Score columns '1' to '10'
+        pss_columns = [col for col in PSS_ITEMS if col in self.df.columns]
+        items = self.df[pss_columns].astype(np.int8).to_numpy()
+        self.df['target'] = self.score_items(items, pss_columns, cut_points=self.cut_points).astype('int64')
         # Delete columns '1' to '10'
         self.df.drop(columns=pss_columns, inplace=True, axis=1)
         return self.df
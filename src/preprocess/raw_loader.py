@@ -0,0 +1,97 @@
+import json
+import os
+import time
+import pandas as pd
+
+from .step_cache import hash_file
+
+_SIGNATURE_KEY = b'raw_loader.signature'
+
+
+def fastest_excel_engine():
+    """'calamine' when python-calamine is installed (much faster), else pandas' default."""
+    try:
+        import python_calamine  # noqa: F401
+        return 'calamine'
+    except ImportError:
+        return None
+
+
+def _signature(path: str, verify_hash: bool) -> dict:
+    stat = os.stat(path)
+    signature = {'source': os.path.abspath(path), 'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+    if verify_hash:
+        signature['sha256'] = hash_file(path)
+    return signature
+
+
+def _to_arrow_table(df: pd.DataFrame):
+    import pyarrow as pa
+
+    try:
+        return pa.Table.from_pandas(df, preserve_index=False)
+    except (pa.ArrowTypeError, pa.ArrowInvalid):
+        # Excel columns mixing numbers and text: store them as text
+        df = df.copy()
+        for col in df.select_dtypes(include='object').columns:
+            df[col] = df[col].where(df[col].isna(), df[col].astype(str))
+        return pa.Table.from_pandas(df, preserve_index=False)
+
+
+def load_raw_data(path: str, columns: list = None, engine: str = None, cache_dir: str = None,
+                  verify_hash: bool = False, verbose: bool = True) -> pd.DataFrame:
+    """
+    Load a raw survey workbook through a typed Parquet cache.
+
+    The first call parses the workbook (with calamine when available) and writes
+    `<cache_dir>/<file name>.parquet`, tagged with the source's size and mtime (plus
+    its sha256 when `verify_hash=True`). Later calls read the Parquet file instead,
+    as long as the tag still matches, and only the requested `columns`. Both paths
+    return the frame decoded from the Parquet table, so its dtypes never depend on
+    whether the cache was hit.
+
+    Parameters:
+    path (str): Local path of the .xlsx/.xls file.
+    columns (list): Columns to return (all by default).
+    engine (str): pd.read_excel engine; defaults to `fastest_excel_engine()`.
+    cache_dir (str): Cache directory, default `.cache` next to the workbook.
+    verify_hash (bool): Also compare content hashes, not just size/mtime.
+    verbose (bool): Print where the data came from and how long it took.
+    """
+    import pyarrow.parquet as pq
+
+    start = time.perf_counter()
+    cache_dir = cache_dir or os.path.join(os.path.dirname(os.path.abspath(path)), '.cache')
+    cache_path = os.path.join(cache_dir, f"{os.path.basename(path)}.parquet")
+    signature = _signature(path, verify_hash)
+
+    if os.path.exists(cache_path):
+        metadata = pq.read_schema(cache_path).metadata or {}
+        cached = metadata.get(_SIGNATURE_KEY)
+        if cached is not None and json.loads(cached) == signature:
+            df = pq.read_table(cache_path, columns=columns).to_pandas()
+            if verbose:
+                print(f"⚡ Loaded {path} from cache in {time.perf_counter() - start:.3f}s")
+            return df
+
+    engine = engine or fastest_excel_engine()
+    df = pd.read_excel(path, header=0, engine=engine)
+    parsed = time.perf_counter()
+
+    table = _to_arrow_table(df)
+    metadata = dict(table.schema.metadata or {})
+    metadata[_SIGNATURE_KEY] = json.dumps(signature).encode('utf-8')
+    os.makedirs(cache_dir, exist_ok=True)
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    pq.write_table(table.replace_schema_metadata(metadata), tmp_path)
+    os.replace(tmp_path, cache_path)
+
+    if verbose:
+        print(f"📄 Parsed {path} with engine={engine or 'default'} in {parsed - start:.3f}s, "
+              f"cached to {cache_path} in {time.perf_counter() - parsed:.3f}s")
+    # Same frame as a cache hit: Parquet round-trip types (e.g. mixed columns as text)
+    return (table.select(columns) if columns is not None else table).to_pandas()
+
+
+def is_local_workbook(file_id) -> bool:
+    return isinstance(file_id, str) and file_id.lower().endswith(('.xlsx', '.xls')) and os.path.isfile(file_id)
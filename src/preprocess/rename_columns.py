@@ -3,3 +3,31 @@ import pandas as pd
 def rename_column(df: pd.DataFrame) -> pd.DataFrame: 
     df.columns = new_columns_name
     return df
+
+def max_timestamp(df: pd.DataFrame):
+    """Latest survey timestamp in a renamed raw frame, or None if there is none."""
+    if 'time_stamp' not in df.columns:
+        return None
+    latest = pd.to_datetime(df['time_stamp'], errors='coerce').max()
+    return None if pd.isna(latest) else latest
+
+
+def row_keys(df: pd.DataFrame) -> pd.Series:
+    """
+    Content key (hex string) of each row of a renamed raw frame. Numeric columns
+    are hashed as floats and the rest as text, so a row keeps its key when a later
+    fetch infers other dtypes (e.g. an int column read as float once it has gaps).
+    """
+    normalized = pd.DataFrame({
+        col: df[col].astype('float64') if pd.api.types.is_numeric_dtype(df[col]) else df[col].astype(str)
+        for col in df.columns
+    })
+    return pd.util.hash_pandas_object(normalized, index=False).map('{:016x}'.format)
+
+
+def watermark_keys(df: pd.DataFrame, watermark) -> list:
+    """Keys of the rows at `watermark` (every row when there is no watermark)."""
+    if watermark is None:
+        return row_keys(df).tolist()
+    at_watermark = pd.to_datetime(df['time_stamp'], errors='coerce') == watermark
+    return row_keys(df[at_watermark]).tolist()
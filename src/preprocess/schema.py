@@ -0,0 +1,85 @@
+import numpy as np
+import pandas as pd
+
+from .encode_data import VALUE_MAPPINGS, CODE_DTYPE, to_int_codes
+
+# 1-5 (or 1-6) answers and the 0-4 stress class
+ORDINAL_COLUMNS = [
+    'academic_year', 'activity_engagement_level', 'internet_adaptation', 'workout_rate',
+    'peer_pressure_rate', 'sharing_frequency', 'family_affects', 'family_allowance_sufficiency',
+    'family_educational_level', 'family_major_support', 'target',
+]
+
+# processed_data.csv: raw labels as Categoricals, ordinal answers as int8
+PROCESSED_SCHEMA = {
+    'gender': 'category',
+    'major': 'category',
+    **{col: pd.CategoricalDtype(sorted(mapping, key=mapping.get), ordered=True)
+       for col, mapping in VALUE_MAPPINGS.items()},
+    **{col: CODE_DTYPE for col in ORDINAL_COLUMNS},
+}
+
+# final_processed_data.csv: every column is an int8 code
+FINAL_SCHEMA = {col: CODE_DTYPE for col in ['gender', 'major', *VALUE_MAPPINGS, *ORDINAL_COLUMNS]}
+
+
+def apply_schema(df: pd.DataFrame, schema: dict) -> pd.DataFrame:
+    """
+    Cast the columns of `df` listed in `schema` to their declared dtype.
+
+    Raises ValueError instead of silently losing data: labels outside a
+    categorical's categories, or integers outside the integer dtype's range.
+    Columns not in the schema are left as they are.
+    """
+    casts = {}
+    for col, dtype in schema.items():
+        if col not in df.columns or df[col].dtype == dtype:
+            continue
+        values = df[col]
+        if isinstance(dtype, pd.CategoricalDtype):
+            cast = values.astype(dtype)
+            lost = cast.isna() & values.notna()
+            if lost.any():
+                raise ValueError(f"Unexpected values for '{col}': {list(pd.unique(values[lost]))}")
+        elif dtype != 'category':
+            cast = pd.Series(to_int_codes(col, values, dtype), index=values.index, name=col)
+        else:
+            cast = values.astype(dtype)
+        casts[col] = cast
+    return df.assign(**casts) if casts else df
+
+
+def read_dataset(path: str, schema: dict, **kwargs) -> pd.DataFrame:
+    """Read a processed CSV with the schema's compact dtypes and validate it."""
+    header = pd.read_csv(path, nrows=0).columns
+    # Parse labels as strings first so apply_schema can report unexpected ones
+    dtypes = {col: (object if isinstance(dtype, pd.CategoricalDtype) else dtype)
+              for col, dtype in schema.items() if col in header}
+    return apply_schema(pd.read_csv(path, dtype=dtypes, **kwargs), schema)
+
+
+def write_dataset(df: pd.DataFrame, path: str, schema: dict, **kwargs):
+    """Validate `df` against the schema and write it as CSV."""
+    apply_schema(df, schema).to_csv(path, index=False, **kwargs)
+
+
+def memory_report(df: pd.DataFrame, name: str = 'dataset', verbose: bool = True) -> pd.DataFrame:
+    """
+    Per-column memory of `df` next to what pandas' default dtypes (int64 / object)
+    would use for the same data.
+    """
+    rows = []
+    for col in df.columns:
+        values = df[col]
+        if isinstance(values.dtype, pd.CategoricalDtype) or values.dtype == object:
+            baseline = values.astype(object).memory_usage(index=False, deep=True)
+        else:
+            baseline = len(values) * 8
+        rows.append({'column': col, 'dtype': str(values.dtype),
+                     'bytes': values.memory_usage(index=False, deep=True), 'default_bytes': baseline})
+    report = pd.DataFrame(rows).set_index('column')
+    if verbose:
+        used, default = report['bytes'].sum(), report['default_bytes'].sum()
+        print(f"💾 {name}: {len(df):,} rows, {used / 1024:,.1f} KiB "
+              f"(default dtypes: {default / 1024:,.1f} KiB, {default / max(used, 1):.1f}x smaller)")
+    return report
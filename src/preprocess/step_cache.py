@@ -0,0 +1,110 @@
+import glob
+import hashlib
+import json
+import os
+import pickle
+import pandas as pd
+
+CACHE_DIR = './.cache/preprocess'
+MAX_CACHE_BYTES = 512 * 1024 * 1024
+
+
+def hash_bytes(*parts) -> str:
+    """sha256 over the given parts (bytes, or anything JSON/str-serializable)."""
+    digest = hashlib.sha256()
+    for part in parts:
+        if not isinstance(part, bytes):
+            part = json.dumps(part, sort_keys=True, default=str).encode('utf-8')
+        digest.update(part)
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
+def hash_file(path: str, block_size: int = 1 << 20) -> str:
+    """Content hash of a file."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(block_size), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def hash_frame(df: pd.DataFrame) -> str:
+    """Content hash of a DataFrame: values, index, column names and dtypes."""
+    row_hashes = pd.util.hash_pandas_object(df, index=True).to_numpy()
+    return hash_bytes(row_hashes.tobytes(), list(map(str, df.columns)), list(map(str, df.dtypes)))
+
+
+_code_hash = None
+
+
+def code_hash() -> str:
+    """Hash of the preprocessing source files, so any code change invalidates the cache."""
+    global _code_hash
+    if _code_hash is None:
+        package_dir = os.path.dirname(os.path.abspath(__file__))
+        files = sorted(glob.glob(os.path.join(package_dir, '*.py')))
+        _code_hash = hash_bytes(*[hash_file(path) for path in files])
+    return _code_hash
+
+
+class StepCache:
+    """
+    Content-addressed on-disk cache for pipeline step outputs.
+
+    Entries are pickles named by their key. Every hit refreshes the file's mtime, and
+    when the directory grows beyond `max_bytes` the least recently used entries are
+    evicted.
+    """
+
+    def __init__(self, cache_dir: str = CACHE_DIR, max_bytes: int = MAX_CACHE_BYTES):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.pkl")
+
+    def get(self, key: str):
+        """Return (hit, value)."""
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                value = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return False, None
+        os.utime(path)
+        return True, value
+
+    def put(self, key: str, value):
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+        self.evict()
+
+    def evict(self):
+        """Delete least recently used entries until the cache fits in `max_bytes`."""
+        entries = []
+        for path in glob.glob(os.path.join(self.cache_dir, '*.pkl')):
+            stat = os.stat(path)
+            entries.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            os.remove(path)
+            total -= size
+
+    def clear(self):
+        for path in glob.glob(os.path.join(self.cache_dir, '*.pkl')):
+            os.remove(path)
+
+
+def cache_from_env():
+    """StepCache configured from PREPROCESS_CACHE(_DIR/_MAX_MB), or None when PREPROCESS_CACHE=0."""
+    if os.getenv('PREPROCESS_CACHE', '1') == '0':
+        return None
+    max_mb = float(os.getenv('PREPROCESS_CACHE_MAX_MB', MAX_CACHE_BYTES / (1024 * 1024)))
+    return StepCache(os.getenv('PREPROCESS_CACHE_DIR', CACHE_DIR), int(max_mb * 1024 * 1024))
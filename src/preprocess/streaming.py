@@ -0,0 +1,181 @@
+import os
+import numpy as np
+import pandas as pd
+
+from .rename_columns import rename_column
+from .pss_caculate import PSSCalculator
+from .general_checking import GeneralChecker
+from .encode_data import encode_data, fit_label_mapping
+from .missing_data_dealing import missing_patterns, pairwise_moments, moments_to_mean_cov, little_mcar_statistic
+from .schema import PROCESSED_SCHEMA, FINAL_SCHEMA, write_dataset
+
+
+def iter_raw_chunks(path: str, chunksize: int = 10000):
+    """
+    Yield the raw survey export in DataFrame chunks of at most `chunksize` rows.
+
+    CSV files are read with pandas' chunked reader; Excel workbooks are streamed row by
+    row with openpyxl in read-only mode, so the whole sheet is never held in memory.
+    """
+    if path.lower().endswith('.csv'):
+        yield from pd.read_csv(path, chunksize=chunksize)
+        return
+
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    try:
+        rows = workbook.active.iter_rows(values_only=True)
+        header = list(next(rows))
+        # Sheets often report trailing empty columns/rows; pd.read_excel drops them too
+        while header and header[-1] is None:
+            header.pop()
+        width = len(header)
+        buffer = []
+        for row in rows:
+            row = row[:width]
+            if all(value is None for value in row):
+                continue
+            # Same as pd.read_excel: integral floats come back as ints
+            row = [int(value) if isinstance(value, float) and value.is_integer() else value for value in row]
+            buffer.append(row)
+            if len(buffer) == chunksize:
+                yield pd.DataFrame(buffer, columns=header).infer_objects()
+                buffer = []
+        if buffer:
+            yield pd.DataFrame(buffer, columns=header).infer_objects()
+    finally:
+        workbook.close()
+
+
+def transform_chunk(chunk: pd.DataFrame) -> pd.DataFrame:
+    """Row-local steps: rename → PSS → integrity transforms, in place on the chunk."""
+    chunk = rename_column(chunk)
+    chunk = PSSCalculator(chunk, copy=False).calculate()
+    return GeneralChecker(chunk, copy=False).transform()
+
+
+class MCARAccumulator:
+    """
+    Streaming sufficient statistics for Little's MCAR test.
+
+    Keeps the pairwise-complete moments of the numeric columns (same covariance
+    definition as `DataFrame.cov`) and, per missingness bitmask, the group size and
+    sums, so `result` gives the same statistic as `run_little_mcar_test` on the
+    concatenated chunks.
+    """
+
+    def __init__(self):
+        self.columns = []
+        self.pair_count = self.pair_sum = self.cross = None
+        self.groups = {}
+
+    def _grow(self, columns):
+        new = [col for col in columns if col not in self.columns]
+        if not new:
+            return
+        old_p = len(self.columns)
+        self.columns.extend(new)
+        p = len(self.columns)
+        for attr in ('pair_count', 'pair_sum', 'cross'):
+            grown = np.zeros((p, p))
+            if old_p:
+                grown[:old_p, :old_p] = getattr(self, attr)
+            setattr(self, attr, grown)
+        # Rows seen so far had none of the new columns: mark them missing in their patterns
+        new_bits = sum(1 << j for j in range(old_p, p))
+        self.groups = {key | new_bits: (n_g, np.pad(sums, (0, p - old_p)))
+                       for key, (n_g, sums) in self.groups.items()}
+
+    def update(self, chunk: pd.DataFrame):
+        numeric = chunk.infer_objects().select_dtypes(include='number')
+        self._grow(list(numeric.columns))
+        values = numeric.reindex(columns=self.columns).to_numpy(dtype=float)
+
+        pair_count, pair_sum, cross = pairwise_moments(values)
+        self.pair_count += pair_count
+        self.pair_sum += pair_sum
+        self.cross += cross
+
+        for key, n_g, sums in zip(*missing_patterns(values)):
+            key = int(key)
+            if key in self.groups:
+                prev_n, prev_sums = self.groups[key]
+                n_g, sums = prev_n + n_g, prev_sums + sums
+            self.groups[key] = (n_g, sums)
+
+    def result(self, missing_cols) -> dict:
+        if not missing_cols or not self.columns:
+            return {"chi2": 0.0, "df": 0, "p": 1.0}
+        means, cov = moments_to_mean_cov(self.pair_count, self.pair_sum, self.cross)
+        keys = list(self.groups)
+        key_dtype = np.int64 if len(self.columns) <= 62 else object
+        return little_mcar_statistic(means, cov, np.array(keys, dtype=key_dtype),
+                                     np.array([self.groups[key][0] for key in keys]),
+                                     np.array([self.groups[key][1] for key in keys]))
+
+
+def scan_raw_data(path: str, chunksize: int = 10000) -> dict:
+    """
+    First streaming pass: collect the global state the row-local steps cannot compute.
+
+    Returns the columns containing nulls (dropped after the MCAR test), the
+    gender/major vocabularies for label encoding and the MCAR test result.
+    """
+    missing_cols = []
+    genders, majors = set(), set()
+    mcar = MCARAccumulator()
+    n_rows = 0
+
+    for chunk in iter_raw_chunks(path, chunksize):
+        chunk = transform_chunk(chunk)
+        n_rows += len(chunk)
+        for col in chunk.columns[chunk.isnull().any()]:
+            if col not in missing_cols:
+                missing_cols.append(col)
+        genders.update(chunk['gender'].dropna().unique())
+        majors.update(chunk['major'].dropna().unique())
+        mcar.update(chunk)
+
+    return {
+        'n_rows': n_rows,
+        'missing_cols': missing_cols,
+        'gender_mapping': fit_label_mapping(sorted(genders)),
+        'major_mapping': fit_label_mapping(sorted(majors)),
+        'mcar': mcar.result(missing_cols),
+    }
+
+
+def stream_preprocess(path: str, processed_path: str = './data/processed_data.csv',
+                      final_path: str = './data/final_processed_data.csv', chunksize: int = 10000) -> dict:
+    """
+    Preprocess a raw survey export with memory bounded by `chunksize`.
+
+    Pass 1 (`scan_raw_data`) computes the MCAR statistics, null columns and encoder
+    vocabularies; pass 2 transforms each chunk, drops the null columns, encodes it
+    with the global mappings and appends it to `processed_path` and `final_path`.
+    """
+    print("📥 Scanning raw data (pass 1)...")
+    state = scan_raw_data(path, chunksize)
+    result = state['mcar']
+    print(f"✅ Scanned {state['n_rows']} rows.")
+    print(f"📊 MCAR Test Result: Chi2={result['chi2']}, df={result['df']}, p-value={result['p']}")
+
+    print("🔄 Transforming and encoding chunks (pass 2)...")
+    for path_out in (processed_path, final_path):
+        if os.path.exists(path_out):
+            os.remove(path_out)
+
+    for i, chunk in enumerate(iter_raw_chunks(path, chunksize)):
+        chunk = transform_chunk(chunk)
+        chunk.drop(columns=state['missing_cols'], inplace=True)
+        write_dataset(chunk, processed_path, PROCESSED_SCHEMA, mode='a', header=(i == 0))
+
+        encoded, _, _ = encode_data(chunk, copy=False,
+                                    gender_mapping=state['gender_mapping'],
+                                    major_mapping=state['major_mapping'])
+        encoded.drop(columns='conduct_score', inplace=True)
+        write_dataset(encoded, final_path, FINAL_SCHEMA, mode='a', header=(i == 0))
+
+    print(f"✅ Streaming preprocessing saved {processed_path} and {final_path}.")
+    return state
@@ -0,0 +1,61 @@
+import numpy as np
+import pandas as pd
+
+GPA_BUCKETS = ['<5', '5-6', '6-7', '7-8', '8-9', '9-10']
+CONDUCT_BUCKETS = ['<50', '50-64', '65-79', '80-89', '90-100']
+DEFAULT_RANKING = 'Trung bình'
+
+# (GPA bucket, conduct bucket) -> ranking. Any pair not listed gets DEFAULT_RANKING.
+RANKING_RULES = {
+    ('9-10', '90-100'): 'Xuất sắc',
+    ('8-9', '80-89'): 'Giỏi',
+    ('8-9', '90-100'): 'Giỏi',
+    ('9-10', '80-89'): 'Giỏi',
+    ('7-8', '65-79'): 'Khá',
+    ('7-8', '80-89'): 'Khá',
+    ('7-8', '90-100'): 'Khá',
+    ('8-9', '65-79'): 'Khá',
+    ('9-10', '65-79'): 'Khá',
+    ('6-7', '80-89'): 'Khá',
+}
+
+
+class StudentRankingEngine:
+    """
+    Table-driven student ranking.
+
+    The rule table is compiled once into a (GPA bucket x conduct bucket) matrix of
+    ranking codes. Rankings are then looked up for a whole column pair in a single
+    vectorized pass using categorical codes. The matrix has one extra row and column
+    filled with the default ranking, so unknown buckets (code -1) fall into it.
+    """
+
+    def __init__(self, rules: dict = None, gpa_buckets: list = None,
+                 conduct_buckets: list = None, default: str = DEFAULT_RANKING):
+        self.rules = RANKING_RULES if rules is None else rules
+        self.gpa_buckets = list(GPA_BUCKETS if gpa_buckets is None else gpa_buckets)
+        self.conduct_buckets = list(CONDUCT_BUCKETS if conduct_buckets is None else conduct_buckets)
+        self.default = default
+
+        self.labels = np.array([default] + sorted(set(self.rules.values()) - {default}), dtype=object)
+        label_codes = {label: code for code, label in enumerate(self.labels)}
+
+        self.matrix = np.zeros((len(self.gpa_buckets) + 1, len(self.conduct_buckets) + 1), dtype=np.int8)
+        for (gpa, conduct), ranking in self.rules.items():
+            if gpa not in self.gpa_buckets or conduct not in self.conduct_buckets:
+                raise ValueError(f"Unknown bucket in ranking rule: ({gpa!r}, {conduct!r})")
+            self.matrix[self.gpa_buckets.index(gpa), self.conduct_buckets.index(conduct)] = label_codes[ranking]
+
+    def rank_codes(self, gpa: pd.Series, conduct: pd.Series) -> np.ndarray:
+        """Return the ranking code (index into `self.labels`) for each row."""
+        gpa_codes = pd.Categorical(gpa, categories=self.gpa_buckets).codes
+        conduct_codes = pd.Categorical(conduct, categories=self.conduct_buckets).codes
+        return self.matrix[gpa_codes, conduct_codes]
+
+    def rank(self, gpa: pd.Series, conduct: pd.Series) -> np.ndarray:
+        """Return the ranking label for each row."""
+        return self.labels[self.rank_codes(gpa, conduct)]
+
+    def rank_one(self, gpa: str, conduct: str) -> str:
+        """Ranking label of a single (GPA bucket, conduct bucket) pair."""
+        return self.rules.get((gpa, conduct), self.default)
@@ -0,0 +1,7 @@
+import os
+import sys
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+# src.* is imported as a package; Model/ scripts use flat imports and run from their directory
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'Model'))
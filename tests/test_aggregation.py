@@ -0,0 +1,64 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from benchmarks.synthetic_survey import generate_survey
+from src.eda.aggregation import CountTable
+
+
+@pytest.fixture(scope='module')
+def survey():
+    df = generate_survey(400, seed=5).drop(columns='time_stamp')
+    rng = np.random.default_rng(5)
+    df['target'] = rng.integers(0, 3, len(df))
+    df.loc[rng.random(len(df)) < 0.05, 'target'] = np.nan
+    df['gender'] = df['gender'].astype('category')
+    return df
+
+
+def test_tables_match_groupby(survey):
+    counts = CountTable(survey, target_col='target')
+    assert 'target' not in counts.columns
+    for col in counts.columns:
+        expected = survey.groupby([col, 'target'], observed=False).size().unstack(fill_value=0)
+        table = counts.table(col)
+        assert list(table.index) == list(expected.index)
+        assert list(table.columns) == list(expected.columns)
+        np.testing.assert_array_equal(table.to_numpy(), expected.to_numpy())
+
+
+def test_shares_and_nunique_match_value_counts(survey):
+    counts = CountTable(survey, target_col=None)
+    for col in ['major', 'self_study_hours', 'family_educational_level']:
+        expected = survey[col].value_counts(normalize=True) * 100
+        shares = counts.shares(col)
+        pd.testing.assert_series_equal(shares.sort_index(), expected.sort_index(),
+                                       check_names=False, check_index_type=False)
+        assert counts.nunique(col) == survey[col].nunique()
+
+
+def test_long_and_order(survey):
+    counts = CountTable(survey)
+    order = ['> 4', '< 1', 'never']
+    table = counts.table('self_study_hours', order)
+    assert list(table.index) == order and (table.loc['never'] == 0).all()
+    long = counts.long('self_study_hours')
+    assert list(long.columns) == ['self_study_hours', 'target', 'count']
+    assert long['count'].sum() == survey['target'].notna().sum()
+
+
+def test_from_frame_reuses_a_table_with_the_same_target(survey):
+    counts = CountTable(survey, target_col='target')
+    assert CountTable.from_frame(counts, 'target') is counts
+    assert isinstance(CountTable.from_frame(survey, 'target'), CountTable)
+
+
+def test_from_frame_rejects_a_table_with_another_target(survey):
+    counts = CountTable(survey, target_col='target')
+    with pytest.raises(ValueError, match="target_col='target'"):
+        CountTable.from_frame(counts, 'gender')
+    with pytest.raises(ValueError):
+        CountTable.from_frame(CountTable(survey, target_col=None), 'target')
+    # A frame without the requested target aggregates to a single bucket either way
+    no_target = CountTable(survey.drop(columns='target'))
+    assert CountTable.from_frame(no_target, 'target') is no_target
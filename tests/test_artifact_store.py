@@ -0,0 +1,62 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.preprocess.artifact_store import (ARTIFACT_STORES, ArtifactStore, CSVArtifactStore,
+                                           get_artifact_store)
+
+
+def _frame():
+    return pd.DataFrame({
+        'gender': pd.Categorical(['Nam', 'Nữ', 'Nam']),
+        'academic_year': np.array([1, 2, 3], dtype=np.int8),
+        'family_educational_level': [1.0, np.nan, 3.0],
+        'major': ['Khoa học Dữ liệu', 'Khoa học Máy tính', None],
+    })
+
+
+@pytest.mark.parametrize('kind', ['parquet', 'arrow'])
+def test_arrow_stores_round_trip_dtypes(tmp_path, kind):
+    store = get_artifact_store(str(tmp_path), kind)
+    df = _frame()
+    path = store.save(df, 'temp_raw_data')
+    assert path == store.path('temp_raw_data') and store.exists('temp_raw_data')
+    pd.testing.assert_frame_equal(store.load('temp_raw_data'), df)
+    pd.testing.assert_frame_equal(store.load('temp_raw_data', columns=['major', 'gender']), df[['major', 'gender']])
+
+
+def test_csv_store_round_trips_values(tmp_path):
+    store = get_artifact_store(str(tmp_path), 'csv')
+    df = _frame()
+    store.save(df, 'temp_raw_data')
+    loaded = store.load('temp_raw_data')
+    assert loaded['gender'].tolist() == df['gender'].tolist()
+    assert loaded['academic_year'].tolist() == df['academic_year'].tolist()
+
+
+def test_remove_and_cleanup(tmp_path):
+    store = get_artifact_store(str(tmp_path))
+    for name in ('a', 'b'):
+        store.save(_frame(), name)
+    assert store.remove('a') and not store.remove('a')
+    assert store.cleanup(['a', 'b']) == [store.path('b')]
+
+
+def test_store_kind_from_environment(tmp_path, monkeypatch):
+    monkeypatch.setenv('ARTIFACT_FORMAT', 'CSV')
+    assert isinstance(get_artifact_store(str(tmp_path)), CSVArtifactStore)
+    with pytest.raises(ValueError, match='Unknown artifact store'):
+        get_artifact_store(str(tmp_path), 'feather')
+
+
+def test_store_must_implement_save_and_load(tmp_path):
+    with pytest.raises(TypeError):
+        ArtifactStore(str(tmp_path))
+
+    class Incomplete(ArtifactStore):
+        def save(self, df, name):
+            return self.path(name)
+
+    with pytest.raises(TypeError, match='load'):
+        Incomplete(str(tmp_path))
+    assert all(issubclass(store, ArtifactStore) for store in ARTIFACT_STORES.values())
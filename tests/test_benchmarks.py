@@ -0,0 +1,46 @@
+import json
+import os
+import subprocess
+import sys
+
+import pandas as pd
+
+from benchmarks.synthetic_survey import generate_survey
+from src.preprocess.pipeline import build_preprocess_pipeline
+from src.preprocess.rename_columns import new_columns_name
+
+SCRIPT = os.path.join(os.path.dirname(__file__), '..', 'benchmarks', 'run_benchmarks.py')
+
+
+def test_synthetic_survey_is_a_valid_raw_export():
+    df = generate_survey(300, seed=7)
+    assert list(df.columns) == new_columns_name
+    pd.testing.assert_frame_equal(df, generate_survey(300, seed=7))
+    assert df['time_stamp'].is_monotonic_increasing
+    outputs = build_preprocess_pipeline().run(['final_processed_data'], source=df.copy())
+    final = outputs['final_processed_data']
+    assert len(final) == 300 and final['target'].nunique() > 1
+
+
+def _run(*args):
+    return subprocess.run([sys.executable, SCRIPT, '--sizes', '200,400', '--steps', 'pss,mcar,encode',
+                           '--repeat', '1', '--no-memory', *args], capture_output=True, text=True)
+
+
+def test_results_file_and_regression_gate(tmp_path):
+    baseline_path = str(tmp_path / 'baseline.json')
+    run = _run('--output', baseline_path)
+    assert run.returncode == 0, run.stderr
+    with open(baseline_path, encoding='utf-8') as f:
+        baseline = json.load(f)
+    assert {(r['step'], r['rows']) for r in baseline['results']} == \
+        {(step, rows) for step in ('pss', 'mcar', 'encode') for rows in (200, 400)}
+
+    # A baseline 1000x faster than anything this machine can do must fail the gate
+    for record in baseline['results']:
+        record['seconds'] /= 1000
+    with open(baseline_path, 'w', encoding='utf-8') as f:
+        json.dump(baseline, f)
+    gated = _run('--output', str(tmp_path / 'current.json'), '--compare', baseline_path, '--fail-on-regression')
+    assert gated.returncode != 0
+    assert 'slower' in gated.stdout
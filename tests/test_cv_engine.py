@@ -0,0 +1,87 @@
+import numpy as np
+import optuna
+import pandas as pd
+import pytest
+from sklearn.metrics import f1_score
+from sklearn.model_selection import StratifiedKFold
+from sklearn.tree import DecisionTreeClassifier
+
+from config import CV_FOLDS
+from cv_engine import CVEngine, cv_engine, stratified_folds
+from tuning_orchestrator import tune_all_models
+from study_storage import journal_storage
+
+
+def _data(n=300, seed=0):
+    rng = np.random.default_rng(seed)
+    X = pd.DataFrame(rng.integers(0, 5, (n, 4)), columns=list('abcd'))
+    y = ((X['a'] + rng.integers(0, 2, n)) % 3).to_numpy()
+    return X, y
+
+
+def test_stratified_folds_are_cached_and_match_sklearn(tmp_path):
+    _, y = _data()
+    folds = stratified_folds(y, random_state=0, cache_dir=str(tmp_path))
+    assert len(folds) == CV_FOLDS
+    expected = StratifiedKFold(CV_FOLDS, shuffle=True, random_state=0).split(np.zeros(len(y)), y)
+    for (train, val), (expected_train, expected_val) in zip(folds, expected):
+        np.testing.assert_array_equal(train, expected_train)
+        np.testing.assert_array_equal(val, expected_val)
+    assert len(list(tmp_path.iterdir())) == 1
+    cached = stratified_folds(y, random_state=0, cache_dir=str(tmp_path))
+    for (train, val), (cached_train, cached_val) in zip(folds, cached):
+        np.testing.assert_array_equal(train, cached_train)
+        np.testing.assert_array_equal(val, cached_val)
+
+
+def test_evaluate_matches_per_fold_loop(tmp_path):
+    X, y = _data()
+    model = DecisionTreeClassifier(max_depth=3, random_state=0)
+    with CVEngine(X, y, n_splits=4, cache_dir=str(tmp_path)) as engine:
+        score = engine.evaluate(model)
+        folds = engine.folds
+    expected = [f1_score(y[val], DecisionTreeClassifier(max_depth=3, random_state=0)
+                         .fit(X.iloc[train], y[train]).predict(X.iloc[val]), average='weighted')
+                for train, val in folds]
+    assert score == pytest.approx(np.mean(expected))
+
+
+def test_parallel_folds_match_in_process(tmp_path):
+    X, y = _data()
+    model = DecisionTreeClassifier(max_depth=3, random_state=0)
+    with CVEngine(X, y, n_splits=3, cache_dir=str(tmp_path)) as engine:
+        serial = engine.evaluate(model)
+    with CVEngine(X, y, n_splits=3, n_jobs=2, cache_dir=str(tmp_path)) as engine:
+        assert engine.evaluate(model) == pytest.approx(serial)
+        refitted = engine.refit(model)
+    assert list(refitted.feature_names_in_) == list(X.columns)
+
+
+def test_cv_engine_without_folds_is_none():
+    X, y = _data()
+    with cv_engine(X, y, X, y) as engine:
+        assert engine is None
+
+
+def test_resumed_best_trial_is_refitted_from_its_params(tmp_path):
+    X, y = _data()
+    X_train, X_dev, y_train, y_dev = X.iloc[:200], X.iloc[200:], y[:200], y[200:]
+    # A best trial from an earlier run: none of this run's workers return its model
+    params = {'criterion': 'entropy', 'max_depth': 4, 'min_samples_split': 7, 'min_samples_leaf': 3}
+    distributions = {
+        'criterion': optuna.distributions.CategoricalDistribution(['gini', 'entropy']),
+        'max_depth': optuna.distributions.IntDistribution(1, 5),
+        'min_samples_split': optuna.distributions.IntDistribution(2, 10),
+        'min_samples_leaf': optuna.distributions.IntDistribution(1, 5),
+    }
+    study = optuna.create_study(direction='maximize', study_name='tree',
+                                storage=journal_storage(str(tmp_path / 'tree.log')))
+    study.add_trial(optuna.trial.create_trial(params=params, distributions=distributions, value=2.0))
+
+    best_models, leaderboard = tune_all_models(X_train, y_train, X_dev, y_dev, families=['tree'], n_trials=2,
+                                               cpu_budget=1, storage_dir=str(tmp_path), pruner='none')
+    model = best_models['tree']
+    assert {name: model.get_params()[name] for name in params} == params
+    assert model.get_params()['class_weight'] == 'balanced'
+    assert len(model.predict(X_dev)) == len(y_dev)
+    assert leaderboard.loc[0, 'best_f1'] == 2.0 and leaderboard.loc[0, 'n_trials'] == 3
@@ -0,0 +1,80 @@
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.preprocessing import LabelEncoder
+
+from src.preprocess.encode_data import FeatureEncoder, VALUE_MAPPINGS, encode_data, to_int_codes
+
+GENDERS = {'Nam': 0, 'Nữ': 1}
+MAJORS = {'Khoa học Dữ liệu': 0, 'Khoa học Máy tính': 1}
+
+
+def _frame():
+    return pd.DataFrame({
+        'gender': ['Nữ', 'Nam', 'Nam'],
+        'major': ['Khoa học Máy tính', 'Khoa học Dữ liệu', 'Khoa học Máy tính'],
+        'self_study_hours': ['< 1', '> 4', '2 - 3'],
+        'academic_year': [1, 3, 6],
+    })
+
+
+def test_encode_data_matches_label_encoder_and_value_mappings():
+    df = _frame()
+    encoded, gender_mapping, major_mapping = encode_data(df)
+
+    assert (encoded.dtypes == np.int8).all()
+    assert list(encoded['gender']) == list(LabelEncoder().fit_transform(df['gender']))
+    assert list(encoded['major']) == list(LabelEncoder().fit_transform(df['major']))
+    assert list(encoded['self_study_hours']) == [VALUE_MAPPINGS['self_study_hours'][v] for v in df['self_study_hours']]
+    assert list(encoded['academic_year']) == [1, 3, 6]
+    assert gender_mapping == GENDERS
+
+
+def test_transform_record_and_array_match_frame_transform():
+    df = _frame()
+    encoder = FeatureEncoder(GENDERS, MAJORS)
+    frame = encoder.transform(df).to_numpy()
+    columns = list(df.columns)
+    records = np.vstack([encoder.transform_record(row, columns) for row in df.to_dict('records')])
+    assert (records == frame).all()
+    assert (encoder.transform_array(df.to_numpy(dtype=object), columns) == frame).all()
+
+
+@pytest.mark.parametrize('value', [200, -200, np.nan, 3.7, 'abc'])
+def test_numeric_columns_reject_values_that_do_not_fit(value):
+    df = _frame().astype({'academic_year': object})
+    df.loc[1, 'academic_year'] = value
+    encoder = FeatureEncoder(GENDERS, MAJORS)
+    with pytest.raises(ValueError):
+        encoder.transform(df)
+    with pytest.raises(ValueError):
+        encoder.transform_record(df.iloc[1].to_dict(), list(df.columns))
+
+
+def test_unknown_and_missing_labels_raise():
+    encoder = FeatureEncoder(GENDERS, MAJORS)
+    df = _frame()
+    df.loc[0, 'major'] = 'Ngành mới'
+    with pytest.raises(ValueError, match='major'):
+        encoder.transform(df)
+    record = _frame().iloc[0].to_dict()
+    with pytest.raises(ValueError, match='Unknown'):
+        encoder.transform_record(dict(record, gender='?'), list(record))
+    with pytest.raises(ValueError, match='Missing'):
+        encoder.transform_record({'gender': 'Nam'}, ['gender', 'major'])
+
+
+def test_unfitted_encoder_raises():
+    with pytest.raises(ValueError, match='not fitted'):
+        FeatureEncoder().transform(_frame())
+
+
+def test_to_int_codes_accepts_integral_floats_and_strings():
+    assert list(to_int_codes('c', np.array([1.0, 2.0]))) == [1, 2]
+    assert list(to_int_codes('c', np.array(['3', 4], dtype=object))) == [3, 4]
+
+
+def test_dict_round_trip():
+    encoder = FeatureEncoder(GENDERS, MAJORS)
+    restored = FeatureEncoder.from_dict(encoder.to_dict())
+    assert (restored.transform(_frame()) == encoder.transform(_frame())).all().all()
@@ -0,0 +1,81 @@
+import pickle
+
+import matplotlib
+matplotlib.use('Agg')
+import numpy as np
+import pandas as pd
+from sklearn.tree import DecisionTreeClassifier
+
+from evaluation_context import EvaluationContext, dataset_fingerprint
+from thresholded_classifier import ThresholdedClassifier
+from visualization import (plot_log_loss_vs_threshold_multiclass_all_in_one, plot_multiclass_det,
+                           plot_multiclass_roc_auc)
+
+
+class CountingModel:
+    """Wraps an estimator and counts its inference calls."""
+
+    def __init__(self, model):
+        self.model = model
+        self.classes_ = model.classes_
+        self.calls = 0
+
+    def predict_proba(self, X):
+        self.calls += 1
+        return self.model.predict_proba(X)
+
+    def predict(self, X):
+        self.calls += 1
+        return self.model.predict(X)
+
+
+def _fitted(n=300, seed=0):
+    rng = np.random.default_rng(seed)
+    X = pd.DataFrame(rng.normal(size=(n, 3)), columns=['a', 'b', 'c'])
+    y = (X['a'] > 0).astype(int).to_numpy() + (X['b'] > 0.5).astype(int).to_numpy()
+    model = DecisionTreeClassifier(max_depth=4, random_state=0).fit(X, y)
+    return ThresholdedClassifier(model, [0.9, 0.4, 0.7]), X, y
+
+
+def test_one_pass_per_model_and_dataset():
+    classifier, X, _ = _fitted()
+    context = EvaluationContext()
+    np.testing.assert_allclose(context.predict_proba(classifier, X), classifier.predict_proba(X))
+    np.testing.assert_array_equal(context.predict(classifier, X), classifier.predict(X))
+    np.testing.assert_array_equal(context.predict(classifier.model, X), classifier.model.predict(X))
+    # Thresholded outputs reuse the base model's probabilities; predict() is its own pass
+    assert context.passes == 2
+    context.predict_proba(classifier.model, X.copy())
+    assert context.passes == 2
+    context.predict_proba(classifier.model, X.iloc[:10])
+    assert context.passes == 3
+    context.clear()
+    context.predict_proba(classifier.model, X)
+    assert context.passes == 4
+
+
+def test_plots_share_one_inference_pass():
+    classifier, X, y = _fitted()
+    model = CountingModel(classifier.model)
+    context = EvaluationContext()
+    plot_log_loss_vs_threshold_multiclass_all_in_one(model, X, y, context=context, show=False)
+    plot_multiclass_roc_auc(model, X, y, [0, 1, 2], context=context, show=False)
+    plot_multiclass_det(model, X, y, [0, 1, 2], context=context, show=False)
+    assert model.calls == 1
+
+
+def test_context_survives_pickling():
+    classifier, X, _ = _fitted()
+    context = EvaluationContext()
+    expected = context.predict_proba(classifier.model, X)
+    model, restored = pickle.loads(pickle.dumps((classifier.model, context)))
+    np.testing.assert_array_equal(restored.predict_proba(model, X), expected)
+    assert restored.passes == 1
+
+
+def test_dataset_fingerprint():
+    _, X, _ = _fitted()
+    assert dataset_fingerprint(X) == dataset_fingerprint(X.copy())
+    assert dataset_fingerprint(X.to_numpy()) == dataset_fingerprint(X.to_numpy().copy())
+    assert dataset_fingerprint(X) != dataset_fingerprint(X.iloc[::-1])
+    assert dataset_fingerprint(X.to_numpy()) != dataset_fingerprint(X.to_numpy().astype(np.float32))
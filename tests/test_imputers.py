@@ -0,0 +1,71 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.preprocess.imputers import IMPUTERS, GroupModeImputer, Imputer, ModeImputer, get_imputer
+from src.preprocess.missing_data_dealing import handle_missing
+
+
+def _frame():
+    return pd.DataFrame({
+        'major': ['A', 'A', 'A', 'B', 'B', 'B', 'C'],
+        'workout_rate': [1, 2, 2, 5, 5, 4, 3],
+        'family_educational_level': [1.0, 1.0, np.nan, 4.0, np.nan, 4.0, np.nan],
+    })
+
+
+def test_mode_imputer_matches_pandas_mode():
+    df = _frame()
+    filled = ModeImputer().fit_transform(df)
+    expected = df['family_educational_level'].fillna(df['family_educational_level'].mode().iloc[0])
+    pd.testing.assert_series_equal(filled['family_educational_level'], expected)
+    assert df['family_educational_level'].isna().sum() == 3
+
+
+def test_group_mode_imputer_matches_groupby_mode():
+    df = _frame()
+    imputer = GroupModeImputer().fit(df)
+    filled = imputer.transform(df)
+    overall = df['family_educational_level'].mode().iloc[0]
+    by_group = df.groupby('major')['family_educational_level'].agg(
+        lambda values: values.mode().iloc[0] if values.notna().any() else overall)
+    expected = df['family_educational_level'].fillna(df['major'].map(by_group))
+    pd.testing.assert_series_equal(filled['family_educational_level'], expected)
+
+
+@pytest.mark.parametrize('name', list(IMPUTERS))
+def test_transform_record_matches_transform(name):
+    df = _frame()
+    imputer = get_imputer(name).fit(df)
+    filled = imputer.transform(df)
+    for i, record in enumerate(df.to_dict('records')):
+        assert imputer.transform_record(record)['family_educational_level'] == \
+            filled['family_educational_level'].iloc[i]
+
+
+def test_iterative_imputer_keeps_observed_range():
+    df = _frame()
+    filled, imputer = handle_missing(df, 'iterative')
+    values = filled['family_educational_level']
+    assert values.notna().all() and (values % 1 == 0).all()
+    assert values.between(1.0, 4.0).all()
+    assert imputer.columns_ == ['family_educational_level']
+
+
+def test_drop_strategy_and_unknown_names():
+    filled, imputer = handle_missing(_frame(), 'drop')
+    assert imputer is None and list(filled.columns) == ['major', 'workout_rate']
+    with pytest.raises(ValueError, match='Unknown imputer'):
+        get_imputer('median')
+
+
+def test_imputer_must_implement_fit_and_transform():
+    with pytest.raises(TypeError):
+        Imputer()
+
+    class FitOnly(Imputer):
+        def fit(self, df):
+            return self
+
+    with pytest.raises(TypeError, match='transform'):
+        FitOnly()
@@ -0,0 +1,81 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from benchmarks.synthetic_survey import generate_survey
+from src.preprocess import incremental
+from src.preprocess.incremental import load_state, run_incremental, select_new_rows
+from src.preprocess.rename_columns import row_keys, watermark_keys
+
+
+def _frame():
+    return pd.DataFrame({
+        'time_stamp': pd.to_datetime(['2025-05-01 10:00', '2025-05-01 11:00', '2025-05-01 11:00', None]),
+        'gender': ['Nam', 'Nữ', 'Nam', 'Nữ'],
+        'academic_year': [1, 2, 3, 4],
+    })
+
+
+def test_row_keys_ignore_inferred_dtypes():
+    df = _frame()
+    with_gaps = df.astype({'academic_year': 'float64'})
+    assert list(row_keys(df)) == list(row_keys(with_gaps))
+    assert row_keys(df).is_unique
+
+
+def test_rows_at_the_watermark_are_deduplicated_by_key():
+    df = _frame()
+    watermark = pd.Timestamp('2025-05-01 11:00')
+    seen = watermark_keys(df.iloc[:2], watermark)
+    # Row 2 shares the watermark timestamp but arrived after the last run
+    assert list(select_new_rows(df, watermark, seen).index) == [2]
+    assert select_new_rows(df, watermark, watermark_keys(df, watermark)).empty
+
+
+def test_state_without_keys_keeps_an_exclusive_watermark():
+    df = _frame()
+    assert select_new_rows(df, pd.Timestamp('2025-05-01 10:00')).index.tolist() == [1, 2]
+
+
+def test_without_watermark_every_unseen_row_is_new():
+    df = _frame()
+    assert select_new_rows(df, None).index.tolist() == [0, 1, 2, 3]
+    assert select_new_rows(df, None, watermark_keys(df.iloc[:3], None)).index.tolist() == [3]
+
+
+@pytest.fixture
+def paths(tmp_path):
+    return {name: str(tmp_path / name) for name in
+            ('survey.xlsx', 'processed.csv', 'final.csv', 'state.json', 'imputer.joblib')}
+
+
+def _run(paths, data, monkeypatch):
+    monkeypatch.setattr(incremental, 'retrieve_data', lambda file_id: data.copy())
+    return run_incremental('survey.xlsx', paths['processed.csv'], paths['final.csv'], paths['state.json'],
+                           imputer_path=paths['imputer.joblib'])
+
+
+def test_late_rows_at_the_watermark_are_appended_once(paths, monkeypatch):
+    survey = generate_survey(120, seed=1, missing_rate=0.0)
+    first = survey.iloc[:80]
+    late = survey.iloc[80:81].assign(time_stamp=first['time_stamp'].max(), gender='Nữ', academic_year=6)
+
+    assert _run(paths, first, monkeypatch) == 80
+    assert _run(paths, pd.concat([first, late]), monkeypatch) == 1
+    assert _run(paths, pd.concat([first, late]), monkeypatch) == 0
+    assert _run(paths, pd.concat([first, late, survey.iloc[81:]]), monkeypatch) == 39
+    assert len(pd.read_csv(paths['final.csv'])) == 120
+    assert load_state(paths['state.json'])['watermark'] == survey['time_stamp'].max()
+
+
+def test_state_without_watermark_processes_all_rows(paths, monkeypatch):
+    survey = generate_survey(60, seed=2, missing_rate=0.0)
+    assert _run(paths, survey.iloc[:40], monkeypatch) == 40
+    with open(paths['state.json'], encoding='utf-8') as f:
+        state = json.load(f)
+    state['watermark'], state['watermark_keys'] = None, None
+    with open(paths['state.json'], 'w', encoding='utf-8') as f:
+        json.dump(state, f)
+    assert _run(paths, survey, monkeypatch) == 60
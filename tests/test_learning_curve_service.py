@@ -0,0 +1,66 @@
+import numpy as np
+import pytest
+from sklearn.model_selection import StratifiedKFold, learning_curve
+from sklearn.tree import DecisionTreeClassifier
+
+from learning_curve_service import LearningCurveService, train_size_schedule
+
+
+def test_schedule_matches_sklearn_fractions_below_the_cap():
+    assert list(train_size_schedule(232)) == [23, 75, 127, 179, 232]
+
+
+@pytest.mark.parametrize('n_train', [1_600_000, 2_000_000, 5_000_000])
+def test_schedule_keeps_points_and_spread_above_the_cap(n_train):
+    sizes = train_size_schedule(n_train, max_train_size=200_000)
+    assert list(sizes) == [20_000, 65_000, 110_000, 155_000, 200_000]
+
+
+def test_schedule_with_absolute_sizes():
+    assert list(train_size_schedule(1000, [10, 100, 5000], max_train_size=None)) == [10, 100, 1000]
+    assert list(train_size_schedule(10**6, [1000, 10**6], max_train_size=10_000)) == [10, 10_000]
+
+
+def _data(n=400, seed=0):
+    rng = np.random.default_rng(seed)
+    X = rng.integers(0, 5, (n, 6))
+    y = (X[:, 0] + rng.integers(0, 2, n)) % 3
+    return X, y
+
+
+def test_compute_matches_sklearn_sizes_and_shapes(tmp_path):
+    X, y = _data()
+    cv = StratifiedKFold(4, shuffle=True, random_state=0)
+    service = LearningCurveService(cache_dir=str(tmp_path))
+    sizes, train, test = service.compute(DecisionTreeClassifier(random_state=0), X, y, cv=cv)
+    expected_sizes = learning_curve(DecisionTreeClassifier(random_state=0), X, y, cv=cv)[0]
+    assert list(sizes) == list(expected_sizes)
+    assert train.shape == test.shape == (len(sizes), 4)
+    assert ((0 <= test) & (test <= 1)).all()
+
+
+def test_second_compute_is_served_from_cache(tmp_path, monkeypatch):
+    X, y = _data()
+    cv = StratifiedKFold(3, shuffle=True, random_state=0)
+    service = LearningCurveService(cache_dir=str(tmp_path))
+    first = service.compute(DecisionTreeClassifier(random_state=0), X, y, cv=cv)
+
+    import learning_curve_service
+    monkeypatch.setattr(learning_curve_service, '_fold_curve',
+                        lambda *a, **k: pytest.fail('cached points were refitted'))
+    second = service.compute(DecisionTreeClassifier(random_state=0), X, y, cv=cv)
+    for a, b in zip(first, second):
+        np.testing.assert_array_equal(a, b)
+    # Different params are a different cache entry
+    with pytest.raises(pytest.fail.Exception):
+        service.compute(DecisionTreeClassifier(max_depth=2, random_state=0), X, y, cv=cv)
+
+
+def test_warm_start_falls_back_to_cold_fit_when_classes_are_missing():
+    lightgbm = pytest.importorskip('lightgbm')
+    X, y = _data(300)
+    service = LearningCurveService(cache_dir=None, warm_start=True)
+    sizes, _, test = service.compute(lightgbm.LGBMClassifier(n_estimators=8, verbose=-1), X, y,
+                                     train_sizes=[3, 60, 200], cv=StratifiedKFold(3, shuffle=True, random_state=0))
+    assert list(sizes) == [3, 60, 200]
+    assert np.isfinite(test).all()
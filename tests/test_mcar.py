@@ -0,0 +1,68 @@
+import numpy as np
+import pandas as pd
+import pytest
+from scipy.stats import chi2
+
+from src.preprocess.missing_data_dealing import run_little_mcar_test
+from src.preprocess.streaming import MCARAccumulator
+
+
+def _survey(n=300, seed=0):
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame(rng.integers(1, 6, (n, 5)).astype(float), columns=list('abcde'))
+    df.loc[rng.random(n) < 0.15, 'a'] = np.nan
+    df.loc[(rng.random(n) < 0.1) & (df['e'] > 3), 'b'] = np.nan
+    return df
+
+
+def reference_mcar(data):
+    """Textbook Little's test: one loop over missingness patterns."""
+    data = data.select_dtypes(include='number')
+    means = data.mean().to_numpy()
+    cov = data.cov().to_numpy()
+    statistic, dof = 0.0, 0
+    for _, group in data.groupby(data.isnull().apply(tuple, axis=1)):
+        observed = group.notna().all().to_numpy()
+        diff = group.loc[:, observed].mean().to_numpy() - means[observed]
+        statistic += len(group) * diff @ np.linalg.pinv(cov[np.ix_(observed, observed)]) @ diff
+        dof += observed.sum()
+    dof -= data.shape[1]
+    return statistic, dof, chi2.sf(statistic, dof)
+
+
+def test_vectorized_test_matches_pattern_loop():
+    df = _survey()
+    result = run_little_mcar_test(df)
+    statistic, dof, p = reference_mcar(df)
+    assert result['chi2'] == pytest.approx(statistic)
+    assert result['df'] == dof
+    assert result['p'] == pytest.approx(p)
+
+
+def test_run_little_mcar_test_does_not_modify_input():
+    df = _survey()
+    before = df.copy()
+    run_little_mcar_test(df)
+    pd.testing.assert_frame_equal(df, before)
+
+
+def test_streaming_matches_batch():
+    df = _survey()
+    accumulator = MCARAccumulator()
+    for start in range(0, len(df), 70):
+        accumulator.update(df.iloc[start:start + 70])
+    assert accumulator.result(['a', 'b']) == pytest.approx(run_little_mcar_test(df))
+
+
+def test_streaming_column_first_seen_in_later_chunk():
+    df = _survey()
+    first, second = df.iloc[:120].drop(columns='c'), df.iloc[120:]
+    accumulator = MCARAccumulator()
+    accumulator.update(first)
+    accumulator.update(second)
+    combined = pd.concat([first, second])[df.columns]
+    expected = run_little_mcar_test(combined)
+    result = accumulator.result(['a', 'b', 'c'])
+    # Accumulator orders columns by first appearance; the statistic does not depend on it
+    assert result['chi2'] == pytest.approx(expected['chi2'])
+    assert result['df'] == expected['df']
@@ -0,0 +1,66 @@
+import json
+import os
+import subprocess
+import sys
+
+import numpy as np
+import optuna
+import pytest
+from sklearn.tree import DecisionTreeClassifier
+
+from model_registry import ModelRegistry
+from thresholded_classifier import ThresholdedClassifier
+
+
+def _classifier():
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(60, 3))
+    y = (X[:, 0] > 0).astype(int) + (X[:, 1] > 0.5).astype(int)
+    return ThresholdedClassifier(DecisionTreeClassifier(random_state=0).fit(X, y), [1.0, 0.5, 0.8]), X
+
+
+def test_save_and_load_versions(tmp_path):
+    registry = ModelRegistry(str(tmp_path))
+    classifier, X = _classifier()
+    assert registry.latest_version('svc') is None
+    assert registry.save('svc', classifier, metrics={'f1': 0.5}) == 1
+    assert registry.save('svc', classifier, encoder_mappings={'gender_mapping': {}}) == 2
+    assert registry.versions('svc') == [1, 2]
+
+    loaded, metadata = registry.load('svc')
+    assert metadata['version'] == 2 and metadata['encoder_mappings'] == {'gender_mapping': {}}
+    assert metadata['thresholds'] == [1.0, 0.5, 0.8]
+    np.testing.assert_array_equal(loaded.predict_proba(X), classifier.predict_proba(X))
+    assert registry.load('svc', version=1)[1]['metrics'] == {'f1': 0.5}
+
+
+def test_incomplete_version_is_ignored(tmp_path):
+    registry = ModelRegistry(str(tmp_path))
+    registry.save('svc', _classifier()[0])
+    # A version directory without metadata.json is a save that did not finish
+    os.makedirs(tmp_path / 'svc' / 'v2')
+    assert registry.versions('svc') == [1]
+    assert registry.save('svc', _classifier()[0]) == 2
+    with open(tmp_path / 'svc' / 'v2' / ModelRegistry.METADATA_FILE, encoding='utf-8') as f:
+        assert json.load(f)['version'] == 2
+
+
+def test_load_missing_model_raises(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        ModelRegistry(str(tmp_path)).load('svc')
+
+
+def test_study_storage_is_shared_across_calls(tmp_path):
+    registry = ModelRegistry(str(tmp_path))
+    study = optuna.create_study(storage=registry.study_storage('svc'), study_name='svc')
+    study.optimize(lambda trial: trial.suggest_float('x', 0, 1), n_trials=2)
+    resumed = optuna.load_study(storage=registry.study_storage('svc'), study_name='svc')
+    assert len(resumed.trials) == 2
+
+
+def test_registry_import_does_not_load_tuning_dependencies():
+    model_dir = os.path.join(os.path.dirname(__file__), '..', 'Model')
+    code = ("import sys, model_registry; "
+            "print(sorted(m for m in ('optuna', 'lightgbm', 'catboost', 'tuning_orchestrator') if m in sys.modules))")
+    out = subprocess.run([sys.executable, '-c', code], cwd=model_dir, capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == '[]'
@@ -0,0 +1,64 @@
+import os
+
+import pandas as pd
+import pytest
+
+from src.preprocess.pipeline import PreprocessPipeline, build_preprocess_pipeline
+from src.preprocess.schema import FINAL_SCHEMA, PROCESSED_SCHEMA, apply_schema
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), '..', 'data')
+
+
+@pytest.fixture(scope='module')
+def raw():
+    return pd.read_excel(os.path.join(DATA_DIR, 'raw_data.xlsx'))
+
+
+def _csv(path):
+    with open(path, encoding='utf-8') as f:
+        return f.read()
+
+
+def test_outputs_match_the_stored_datasets(raw):
+    """data/*.csv were produced by the original step-by-step scripts from raw_data.xlsx."""
+    outputs = build_preprocess_pipeline().run(['processed_data', 'final_processed_data'], source=raw.copy())
+    assert apply_schema(outputs['processed_data'], PROCESSED_SCHEMA).to_csv(index=False) == \
+        _csv(os.path.join(DATA_DIR, 'processed_data.csv'))
+    assert apply_schema(outputs['final_processed_data'], FINAL_SCHEMA).to_csv(index=False) == \
+        _csv(os.path.join(DATA_DIR, 'final_processed_data.csv'))
+
+
+def test_later_steps_do_not_modify_a_requested_intermediate(raw):
+    outputs = build_preprocess_pipeline().run(['processed_data', 'final_processed_data'], source=raw.copy())
+    alone = build_preprocess_pipeline().run(['processed_data'], source=raw.copy())['processed_data']
+    pd.testing.assert_frame_equal(outputs['processed_data'], alone)
+    assert 'conduct_score' in outputs['processed_data'].columns
+    assert 'conduct_score' not in outputs['final_processed_data'].columns
+
+
+def _tracing_pipeline(calls):
+    def step(name, value):
+        def func(df, reports):
+            calls.append(name)
+            reports[name] = value
+            return df.assign(**{name: value})
+        return func
+
+    return (PreprocessPipeline()
+            .add_step('a', step('a', 1))
+            .add_step('b', step('b', 2), input='a')
+            .add_step('c', step('c', 3), input='a'))
+
+
+def test_only_the_steps_needed_for_the_outputs_run():
+    calls = []
+    pipeline = _tracing_pipeline(calls)
+    assert pipeline.plan(['b']) == ['a', 'b']
+    loaded = []
+    result = pipeline.run(['b'], source=lambda: loaded.append(1) or pd.DataFrame({'x': [0]}))
+    assert calls == ['a', 'b'] and loaded == [1]
+    assert list(result) == ['b'] and list(result['b'].columns) == ['x', 'a', 'b']
+    with pytest.raises(ValueError, match='Unknown output'):
+        pipeline.plan(['d'])
+    with pytest.raises(ValueError, match='unknown step'):
+        pipeline.add_step('e', lambda df, reports: df, input='missing')
@@ -0,0 +1,75 @@
+import numpy as np
+import optuna
+import pytest
+from sklearn.metrics import f1_score
+from sklearn.tree import DecisionTreeClassifier
+
+from pruning import PRUNERS, SUBSET_FRACTIONS, fit_with_subset_halving, make_pruner
+from tuning_models import optimize_lightgbm, optimize_tree
+
+
+def _data(n=400, seed=0):
+    rng = np.random.default_rng(seed)
+    X = rng.normal(size=(n, 5))
+    y = (X[:, 0] > 0).astype(int) + (X[:, 1] > 0.5).astype(int)
+    return X[:300], y[:300], X[300:], y[300:]
+
+
+def test_make_pruner():
+    assert isinstance(make_pruner('none'), optuna.pruners.NopPruner)
+    assert isinstance(make_pruner('median'), optuna.pruners.MedianPruner)
+    custom = optuna.pruners.ThresholdPruner(lower=0.5)
+    assert make_pruner(custom) is custom
+    assert set(PRUNERS) >= {'median', 'percentile', 'sha', 'hyperband', 'none'}
+    with pytest.raises(ValueError, match='Unknown pruner'):
+        make_pruner('fast')
+
+
+def _halving_trial(pruner):
+    X_train, y_train, X_dev, y_dev = _data()
+    study = optuna.create_study(direction='maximize', pruner=pruner)
+    fits = []
+
+    def objective(trial):
+        def make_model(final):
+            fits.append(final)
+            return DecisionTreeClassifier(max_depth=2, random_state=0)
+        return fit_with_subset_halving(trial, make_model, X_train, y_train, X_dev, y_dev,
+                                       lambda model: f1_score(y_dev, model.predict(X_dev), average='weighted'))[1]
+
+    study.optimize(objective, n_trials=1)
+    return study, fits
+
+
+def test_subset_halving_reports_every_rung():
+    study, fits = _halving_trial(optuna.pruners.MedianPruner(n_startup_trials=0))
+    trial = study.trials[0]
+    assert fits == [False] * (len(SUBSET_FRACTIONS) - 1) + [True]
+    assert sorted(trial.intermediate_values) == list(range(len(SUBSET_FRACTIONS)))
+    assert trial.value == trial.intermediate_values[len(SUBSET_FRACTIONS) - 1]
+
+
+def test_subset_halving_stops_when_pruned():
+    study, fits = _halving_trial(optuna.pruners.ThresholdPruner(lower=2.0))
+    assert study.trials[0].state == optuna.trial.TrialState.PRUNED
+    assert fits == [False]
+
+
+def test_subset_halving_fits_once_without_a_pruner():
+    study, fits = _halving_trial(optuna.pruners.NopPruner())
+    assert fits == [True]
+    assert study.trials[0].state == optuna.trial.TrialState.COMPLETE
+
+
+def test_tuners_return_a_fitted_model_with_pruning():
+    X_train, y_train, X_dev, y_dev = _data()
+    tree = optimize_tree(X_train, y_train, X_dev, y_dev, n_trials=8, pruner='median')
+    assert len(tree.predict(X_dev)) == len(y_dev)
+
+    # LightGBM trials report their validation loss while boosting; this pruner rejects every report
+    storage = optuna.storages.InMemoryStorage()
+    model = optimize_lightgbm(X_train, y_train, X_dev, y_dev, n_trials=3, n_threads=1, storage=storage,
+                              study_name='lgbm', pruner=optuna.pruners.ThresholdPruner(lower=0.0))
+    states = {trial.state for trial in optuna.load_study(study_name='lgbm', storage=storage).trials}
+    assert states == {optuna.trial.TrialState.PRUNED}
+    assert model is None
@@ -0,0 +1,53 @@
+import numpy as np
+import pandas as pd
+
+from src.preprocess.pss_caculate import PSS_ITEMS, PSSCalculator
+
+
+def reference_pss(df):
+    """Per-column reverse scoring and per-row binning, as PSSCalculator did before vectorizing."""
+    df = df.copy()
+    for col in ['4', '5', '7', '8']:
+        df[col] = df[col].astype(int).apply(lambda x: 4 - x)
+    totals = df[PSS_ITEMS].astype(int).sum(axis=1)
+    bins = [(0, 9), (9, 17), (17, 25), (25, 33)]
+    df['target'] = totals.apply(lambda v: next((i for i, (lo, hi) in enumerate(bins) if lo <= v < hi), 4))
+    return df.drop(columns=PSS_ITEMS)
+
+
+def _answers(n=500, seed=0):
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame(rng.integers(0, 5, (n, 10)), columns=PSS_ITEMS)
+    df.insert(0, 'gender', rng.choice(['Nam', 'Nữ'], n))
+    # Every total from 0 to 40, so each class boundary is hit
+    df.loc[:40, PSS_ITEMS] = 0
+    for total in range(41):
+        remaining = total
+        for col in PSS_ITEMS:
+            score = min(4, remaining)
+            df.loc[total, col] = 4 - score if col in ('4', '5', '7', '8') else score
+            remaining -= score
+    return df
+
+
+def test_calculate_matches_row_by_row_scoring():
+    df = _answers()
+    expected = reference_pss(df)
+    result = PSSCalculator(df).calculate()
+    pd.testing.assert_frame_equal(result, expected)
+    assert list(df.columns[1:]) == PSS_ITEMS
+
+
+def test_in_place_mode_and_score_items_agree():
+    df = _answers(seed=1)
+    items = df[PSS_ITEMS].to_numpy()
+    result = PSSCalculator(df, copy=False).calculate()
+    assert result is df and 'target' in df.columns
+    np.testing.assert_array_equal(PSSCalculator.score_items(items), df['target'].to_numpy())
+
+
+def test_convert_target_boundaries():
+    totals = np.arange(41)
+    expected = [0] * 9 + [1] * 8 + [2] * 8 + [3] * 8 + [4] * 8
+    assert list(PSSCalculator.convert_target(totals)) == expected
+    assert PSSCalculator.convert_target(17) == 2
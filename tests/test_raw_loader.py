@@ -0,0 +1,56 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from benchmarks.synthetic_survey import generate_survey
+from src.preprocess.raw_loader import is_local_workbook, load_raw_data
+
+
+@pytest.fixture
+def workbook(tmp_path):
+    df = generate_survey(50, seed=3)
+    # A column mixing numbers and text, which Arrow stores as text
+    df['family_educational_level'] = df['family_educational_level'].astype(object)
+    df.loc[:4, 'family_educational_level'] = 'không rõ'
+    path = str(tmp_path / 'survey.xlsx')
+    df.to_excel(path, index=False)
+    return path
+
+
+@pytest.mark.parametrize('columns', [None, ['gender', 'family_educational_level']])
+def test_cache_miss_and_hit_return_the_same_frame(workbook, tmp_path, columns):
+    cache_dir = str(tmp_path / 'cache')
+    miss = load_raw_data(workbook, columns=columns, cache_dir=cache_dir, verbose=False)
+    assert os.path.exists(os.path.join(cache_dir, 'survey.xlsx.parquet'))
+    hit = load_raw_data(workbook, columns=columns, cache_dir=cache_dir, verbose=False)
+    pd.testing.assert_frame_equal(miss, hit)
+    if columns is not None:
+        assert list(miss.columns) == columns
+
+
+def test_cache_matches_the_workbook(workbook, tmp_path):
+    loaded = load_raw_data(workbook, cache_dir=str(tmp_path / 'cache'), verbose=False)
+    expected = pd.read_excel(workbook)
+    assert list(loaded.columns) == list(expected.columns)
+    pd.testing.assert_frame_equal(loaded.drop(columns='family_educational_level'),
+                                  expected.drop(columns='family_educational_level'))
+    mixed, expected_mixed = loaded['family_educational_level'], expected['family_educational_level']
+    assert (mixed.isna() == expected_mixed.isna()).all()
+    assert list(mixed.dropna()) == list(expected_mixed.dropna().astype(str))
+
+
+def test_changed_workbook_invalidates_the_cache(workbook, tmp_path):
+    cache_dir = str(tmp_path / 'cache')
+    load_raw_data(workbook, cache_dir=cache_dir, verbose=False)
+    generate_survey(20, seed=4).to_excel(workbook, index=False)
+    os.utime(workbook, ns=(0, 10**18))
+    assert len(load_raw_data(workbook, cache_dir=cache_dir, verify_hash=True, verbose=False)) == 20
+
+
+def test_is_local_workbook(workbook, tmp_path):
+    assert is_local_workbook(workbook)
+    assert not is_local_workbook(str(tmp_path / 'missing.xlsx'))
+    assert not is_local_workbook('https://docs.google.com/spreadsheets/d/x/export?format=xlsx')
+    assert not is_local_workbook(None)
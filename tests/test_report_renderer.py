@@ -0,0 +1,84 @@
+import importlib.util
+import json
+import os
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import pytest
+
+from utils import report_renderer
+from utils.report_renderer import FigureJob, ReportRenderer, package_hash
+
+
+def line_plot(values, title='', context=None, n_jobs=1, show=True):
+    fig, ax = plt.subplots()
+    ax.plot(values)
+    ax.set_title(title)
+    return fig
+
+
+def broken_plot(show=True):
+    raise RuntimeError('no data')
+
+
+def test_render_then_skip_unchanged(tmp_path):
+    renderer = ReportRenderer(str(tmp_path), max_workers=1).add('line', line_plot, [1, 2, 3], title='a')
+    first = renderer.render()
+    assert first['line'] == {'status': 'rendered', 'files': ['line.png', 'line.html']}
+    assert all(os.path.exists(tmp_path / name) for name in first['line']['files'])
+    with open(tmp_path / 'manifest.json', encoding='utf-8') as f:
+        assert set(json.load(f)) == {'line'}
+
+    assert renderer.render()['line']['status'] == 'skipped'
+    assert renderer.render(force=True)['line']['status'] == 'rendered'
+    os.remove(tmp_path / 'line.png')
+    assert renderer.render()['line']['status'] == 'rendered'
+
+
+def test_inputs_change_the_key_but_caches_and_jobs_do_not():
+    key = FigureJob('line', line_plot, ([1, 2],), {'title': 'a'}, ('png',)).key()
+    assert FigureJob('line', line_plot, ([1, 2],), {'title': 'a', 'context': object(), 'n_jobs': 8},
+                     ('png',)).key() == key
+    assert FigureJob('line', line_plot, ([1, 3],), {'title': 'a'}, ('png',)).key() != key
+    assert FigureJob('line', line_plot, ([1, 2],), {'title': 'b'}, ('png',)).key() != key
+    assert FigureJob('line', line_plot, ([1, 2],), {'title': 'a'}, ('html',)).key() != key
+
+
+def _load(path, name):
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_editing_a_helper_module_changes_the_key(tmp_path, monkeypatch):
+    (tmp_path / 'helpers.py').write_text("SCALE = 1\n")
+    (tmp_path / 'plots.py').write_text("def plot(show=True):\n    return None\n")
+    plots = _load(str(tmp_path / 'plots.py'), 'plots')
+    job = FigureJob('plot', plots.plot, (), {}, ('png',))
+
+    monkeypatch.setattr(report_renderer, '_package_hashes', {})
+    key = job.key()
+    (tmp_path / 'helpers.py').write_text("SCALE = 2\n")
+    monkeypatch.setattr(report_renderer, '_package_hashes', {})
+    assert job.key() != key
+    assert package_hash(str(tmp_path / 'plots.py')) == package_hash(str(tmp_path / 'helpers.py'))
+
+
+def test_failed_figure_is_not_recorded(tmp_path):
+    results = (ReportRenderer(str(tmp_path), max_workers=2)
+               .add('broken', broken_plot)
+               .add('line', line_plot, [1, 2])
+               .render())
+    assert results['broken'] == {'status': 'failed', 'files': []}
+    assert results['line']['status'] == 'rendered'
+    with open(tmp_path / 'manifest.json', encoding='utf-8') as f:
+        assert set(json.load(f)) == {'line'}
+
+
+def test_jobs_per_figure_shares_the_cpus(monkeypatch):
+    monkeypatch.setattr(os, 'cpu_count', lambda: 8)
+    assert ReportRenderer(max_workers=4).jobs_per_figure == 2
+    assert ReportRenderer(max_workers=16).jobs_per_figure == 1
+    assert ReportRenderer().jobs_per_figure == 1
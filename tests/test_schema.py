@@ -0,0 +1,41 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.preprocess.fetch_and_store import save_data
+from src.preprocess.schema import FINAL_SCHEMA, PROCESSED_SCHEMA, apply_schema, read_dataset, write_dataset
+
+
+def test_apply_schema_casts_to_compact_dtypes():
+    df = pd.DataFrame({'gender': ['Nam', 'Nữ'], 'self_study_hours': ['< 1', '> 4'], 'target': [0, 4]})
+    cast = apply_schema(df, PROCESSED_SCHEMA)
+    assert cast['target'].dtype == np.int8
+    assert cast['self_study_hours'].cat.ordered
+    assert list(cast['self_study_hours']) == ['< 1', '> 4']
+
+
+@pytest.mark.parametrize('frame', [
+    pd.DataFrame({'self_study_hours': ['< 1', 'a lot']}),
+    pd.DataFrame({'target': [0, 300]}),
+    pd.DataFrame({'target': [0.0, np.nan]}),
+    pd.DataFrame({'target': [0.5, 1.0]}),
+])
+def test_apply_schema_rejects_values_it_would_lose(frame):
+    with pytest.raises(ValueError):
+        apply_schema(frame, PROCESSED_SCHEMA)
+
+
+def test_write_and_read_round_trip(tmp_path):
+    df = pd.DataFrame({'gender': [0, 1], 'target': [2, 3]})
+    path = tmp_path / 'final.csv'
+    write_dataset(df, path, FINAL_SCHEMA)
+    back = read_dataset(path, FINAL_SCHEMA)
+    assert (back.dtypes == np.int8).all()
+    assert back.astype(int).equals(df)
+
+
+def test_save_data_propagates_schema_violations(tmp_path):
+    path = tmp_path / 'final.csv'
+    with pytest.raises(ValueError):
+        save_data(pd.DataFrame({'target': [0, 300]}), file_name=str(path), schema=FINAL_SCHEMA)
+    assert not path.exists()
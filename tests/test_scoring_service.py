@@ -0,0 +1,114 @@
+import asyncio
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.tree import DecisionTreeClassifier
+
+from benchmarks.synthetic_survey import generate_survey
+from model_registry import ModelRegistry
+from scoring_service import ScoringService
+from src.preprocess.encode_data import FeatureEncoder
+from src.preprocess.online import featurize_response
+from thresholded_classifier import ThresholdedClassifier
+
+FEATURES = ['gender', 'academic_year', 'major', 'last_semester_student_ranking', 'self_study_hours']
+
+
+@pytest.fixture(scope='module')
+def survey():
+    df = generate_survey(200, seed=0).drop(columns='time_stamp')
+    encoder = FeatureEncoder().fit(df)
+    responses = json.loads(df.to_json(orient='records', force_ascii=False))
+    X = pd.DataFrame([featurize_response(r, FEATURES, encoder) for r in responses], columns=FEATURES)
+    y = (X['self_study_hours'] + X['gender']) % 3
+    classifier = ThresholdedClassifier(DecisionTreeClassifier(max_depth=4, random_state=0).fit(X, y), [1.0, 0.6, 0.9])
+    return classifier, encoder, responses, X
+
+
+async def _call(service, method, path, payload=None):
+    body = json.dumps(payload, ensure_ascii=False).encode('utf-8') if payload is not None else b''
+    service.queue = asyncio.Queue()
+    batcher = asyncio.create_task(service._batcher())
+    try:
+        return await service._route(method, path, body)
+    finally:
+        batcher.cancel()
+
+
+def _route(service, method, path, payload=None):
+    return asyncio.run(_call(service, method, path, payload))
+
+
+def test_predict_matches_batch_scoring(survey):
+    classifier, encoder, responses, X = survey
+    service = ScoringService(classifier, encoder.to_dict())
+    status, payload = _route(service, 'POST', '/predict', {'responses': responses[:10]})
+    assert status == '200 OK'
+    expected = classifier.predict_proba(X.iloc[:10])
+    np.testing.assert_allclose([p['probabilities'] for p in payload], expected)
+    assert [p['stress_class'] for p in payload] == list(classifier.predict(X.iloc[:10]))
+
+    status, single = _route(service, 'POST', '/predict', responses[0])
+    assert status == '200 OK' and single == payload[0]
+
+
+def test_health_and_unknown_route(survey):
+    classifier, encoder, _, _ = survey
+    service = ScoringService(classifier, encoder.to_dict())
+    assert _route(service, 'GET', '/health') == ('200 OK', {'status': 'ok'})
+    assert _route(service, 'GET', '/predict')[0] == '404 Not Found'
+
+
+def test_bad_request(survey):
+    classifier, encoder, responses, _ = survey
+    service = ScoringService(classifier, encoder.to_dict())
+    status, payload = _route(service, 'POST', '/predict', dict(responses[0], gender='?'))
+    assert status == '400 Bad Request' and "'gender'" in payload['error']
+    assert _route(service, 'POST', '/predict', None)[0] == '400 Bad Request'
+
+
+def test_unexpected_error_is_a_server_error(survey, monkeypatch):
+    classifier, encoder, responses, _ = survey
+    service = ScoringService(classifier, encoder.to_dict())
+
+    def broken(X):
+        raise RuntimeError('model file is corrupt')
+
+    monkeypatch.setattr(classifier.model, 'predict_proba', broken)
+    status, payload = _route(service, 'POST', '/predict', responses[0])
+    assert status == '500 Internal Server Error'
+    assert payload == {'error': 'model file is corrupt'}
+
+
+def test_http_round_trip_from_registry(survey, tmp_path):
+    classifier, encoder, responses, X = survey
+    registry = ModelRegistry(str(tmp_path))
+    registry.save('svc', classifier, encoder_mappings=encoder.to_dict())
+
+    async def run():
+        service = ScoringService.from_registry('svc', registry)
+        server = await service.start(port=0)
+        port = server.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection('127.0.0.1', port)
+        body = json.dumps(responses[1], ensure_ascii=False).encode('utf-8')
+        writer.write(f"POST /predict HTTP/1.1\r\nContent-Length: {len(body)}\r\nConnection: close\r\n\r\n"
+                     .encode('latin-1') + body)
+        await writer.drain()
+        response = await reader.read()
+        writer.close()
+        server.close()
+        service._batcher_task.cancel()
+        return response
+
+    head, _, body = asyncio.run(run()).partition(b'\r\n\r\n')
+    assert head.startswith(b'HTTP/1.1 200 OK')
+    np.testing.assert_allclose(json.loads(body)['probabilities'], classifier.predict_proba(X.iloc[1:2])[0])
+
+
+def test_registry_model_without_mappings_is_rejected(survey, tmp_path):
+    registry = ModelRegistry(str(tmp_path))
+    registry.save('svc', survey[0])
+    with pytest.raises(ValueError, match='without encoder mappings'):
+        ScoringService.from_registry('svc', registry)
@@ -0,0 +1,72 @@
+import os
+
+import pandas as pd
+import pytest
+
+from src.preprocess.pipeline import build_preprocess_pipeline
+from src.preprocess.step_cache import StepCache, cache_from_env, hash_frame
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), '..', 'data')
+
+
+@pytest.fixture(scope='module')
+def raw():
+    return pd.read_excel(os.path.join(DATA_DIR, 'raw_data.xlsx'))
+
+
+def test_cached_run_skips_the_source_and_returns_the_same_outputs(raw, tmp_path):
+    outputs = ['processed_data', 'final_processed_data']
+    cold = build_preprocess_pipeline(cache=StepCache(str(tmp_path)))
+    expected = cold.run(outputs, source=raw.copy(), source_key='raw-v1')
+
+    loads = []
+    warm = build_preprocess_pipeline(cache=StepCache(str(tmp_path)))
+    result = warm.run(outputs, source=lambda: loads.append(1) or raw.copy(), source_key='raw-v1')
+    assert loads == []
+    for name in outputs:
+        pd.testing.assert_frame_equal(result[name], expected[name])
+    assert warm.reports['encode'] == cold.reports['encode']
+
+
+def test_keys_depend_on_source_and_params(raw, tmp_path):
+    pipeline = build_preprocess_pipeline(cache=StepCache(str(tmp_path)))
+    plan = pipeline.plan(['final_processed_data'])
+    keys = pipeline.keys(plan, 'raw-v1')
+    assert len(set(keys.values())) == len(plan)
+    assert pipeline.keys(plan, 'raw-v2')['renamed'] != keys['renamed']
+
+    imputing = build_preprocess_pipeline(missing_strategy='mode')
+    other = imputing.keys(plan, 'raw-v1')
+    assert other['checked'] == keys['checked']
+    assert other['processed_data'] != keys['processed_data']
+    assert other['final_processed_data'] != keys['final_processed_data']
+
+
+def test_frame_hash_is_content_based(raw):
+    assert hash_frame(raw) == hash_frame(raw.copy())
+    changed = raw.copy()
+    changed.iloc[0, 1] = 'x'
+    assert hash_frame(changed) != hash_frame(raw)
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    cache = StepCache(str(tmp_path), max_bytes=10**9)
+    for key in ('a', 'b', 'c'):
+        cache.put(key, b'x' * 1000)
+    os.utime(tmp_path / 'a.pkl', (1, 1))
+    os.utime(tmp_path / 'b.pkl', (2, 2))
+    assert cache.get('a')[0]  # refreshes 'a'
+    cache.max_bytes = 2500
+    cache.evict()
+    assert [cache.get(key)[0] for key in ('a', 'b', 'c')] == [True, False, True]
+    assert cache.get('missing') == (False, None)
+
+
+def test_cache_from_env(tmp_path, monkeypatch):
+    monkeypatch.setenv('PREPROCESS_CACHE', '0')
+    assert cache_from_env() is None
+    monkeypatch.setenv('PREPROCESS_CACHE', '1')
+    monkeypatch.setenv('PREPROCESS_CACHE_DIR', str(tmp_path / 'cache'))
+    monkeypatch.setenv('PREPROCESS_CACHE_MAX_MB', '1')
+    cache = cache_from_env()
+    assert cache.cache_dir == str(tmp_path / 'cache') and cache.max_bytes == 1024 * 1024
@@ -0,0 +1,44 @@
+import os
+
+import pandas as pd
+import pytest
+
+from src.preprocess.pipeline import build_preprocess_pipeline
+from src.preprocess.streaming import iter_raw_chunks, stream_preprocess
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), '..', 'data')
+RAW_PATH = os.path.join(DATA_DIR, 'raw_data.xlsx')
+
+
+def _csv(path):
+    with open(path, encoding='utf-8') as f:
+        return f.read()
+
+
+def test_workbook_chunks_match_read_excel():
+    chunks = list(iter_raw_chunks(RAW_PATH, chunksize=50))
+    assert max(len(chunk) for chunk in chunks) == 50
+    pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), pd.read_excel(RAW_PATH),
+                                  check_dtype=False)
+
+
+@pytest.mark.parametrize('chunksize', [37, 10000])
+def test_streaming_matches_the_batch_pipeline(tmp_path, chunksize):
+    processed, final = str(tmp_path / 'processed.csv'), str(tmp_path / 'final.csv')
+    state = stream_preprocess(RAW_PATH, processed, final, chunksize=chunksize)
+
+    assert _csv(processed) == _csv(os.path.join(DATA_DIR, 'processed_data.csv'))
+    assert _csv(final) == _csv(os.path.join(DATA_DIR, 'final_processed_data.csv'))
+
+    pipeline = build_preprocess_pipeline()
+    pipeline.run(['final_processed_data'], source=pd.read_excel(RAW_PATH))
+    assert state['mcar'] == pytest.approx(pipeline.reports['mcar'])
+    assert state['gender_mapping'] == pipeline.reports['encode']['gender_mapping']
+    assert state['major_mapping'] == pipeline.reports['encode']['major_mapping']
+
+
+def test_csv_exports_are_chunked_too(tmp_path):
+    path = str(tmp_path / 'raw.csv')
+    pd.read_excel(RAW_PATH).to_csv(path, index=False)
+    chunks = list(iter_raw_chunks(path, chunksize=40))
+    assert sum(len(chunk) for chunk in chunks) == len(pd.read_excel(RAW_PATH))
@@ -0,0 +1,56 @@
+import itertools
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.preprocess.student_ranking import CONDUCT_BUCKETS, GPA_BUCKETS, StudentRankingEngine
+
+
+def reference_ranking(gpa, conduct):
+    """The row-by-row rules GeneralChecker.classify_student_ranking used before the engine."""
+    if gpa == '9-10' and conduct == '90-100':
+        return 'Xuất sắc'
+    if (gpa == '8-9' and conduct in ['80-89', '90-100']) or (gpa == '9-10' and conduct == '80-89'):
+        return 'Giỏi'
+    if (gpa == '7-8' and conduct in ['65-79', '80-89', '90-100']) or \
+            (gpa == '8-9' and conduct == '65-79') or \
+            (gpa == '9-10' and conduct == '65-79') or \
+            (gpa == '6-7' and conduct == '80-89'):
+        return 'Khá'
+    return 'Trung bình'
+
+
+def test_engine_matches_row_rules_on_every_bucket_pair():
+    pairs = list(itertools.product(GPA_BUCKETS + ['10', None], CONDUCT_BUCKETS + ['100', None]))
+    gpa, conduct = pd.Series([p[0] for p in pairs]), pd.Series([p[1] for p in pairs])
+    engine = StudentRankingEngine()
+    expected = [reference_ranking(g, c) for g, c in pairs]
+    assert list(engine.rank(gpa, conduct)) == expected
+    assert [engine.rank_one(g, c) for g, c in pairs] == expected
+
+
+def test_rank_codes_index_labels():
+    engine = StudentRankingEngine()
+    codes = engine.rank_codes(pd.Series(['9-10', '<5']), pd.Series(['90-100', '<50']))
+    assert codes.dtype == np.int8
+    assert list(engine.labels[codes]) == ['Xuất sắc', 'Trung bình']
+
+
+def test_custom_rules_and_unknown_buckets():
+    engine = StudentRankingEngine(rules={('<5', '<50'): 'Yếu'}, default='Khá')
+    assert list(engine.rank(pd.Series(['<5', '5-6']), pd.Series(['<50', '<50']))) == ['Yếu', 'Khá']
+    with pytest.raises(ValueError, match='Unknown bucket'):
+        StudentRankingEngine(rules={('11', '<50'): 'Giỏi'})
+
+
+def test_general_checker_ranks_normalized_survey_answers():
+    from src.preprocess.general_checking import GeneralChecker
+
+    df = pd.DataFrame({'last_semester_GPA': [' 9 đến cận 10', '7 - 8', '5 - 6'],
+                       'conduct_score': ['90 - 100 ', '65 - 79', '80 - 89'],
+                       'last_semester_student_ranking': ['', '', '']})
+    checker = GeneralChecker(df)
+    checker.classify_student_ranking()
+    assert list(checker.df['last_semester_student_ranking']) == ['Xuất sắc', 'Khá', 'Trung bình']
+    assert list(df['conduct_score']) == ['90 - 100 ', '65 - 79', '80 - 89']
@@ -0,0 +1,68 @@
+import matplotlib
+matplotlib.use('Agg')
+import numpy as np
+import pytest
+from sklearn.metrics import f1_score, log_loss, recall_score
+from sklearn.tree import DecisionTreeClassifier
+
+from threshold_sweep import DEFAULT_THRESHOLDS, sweep_thresholds
+from visualization import plot_log_loss_vs_threshold_multiclass_all_in_one
+
+
+def _probas(n=400, n_classes=4, seed=0):
+    rng = np.random.default_rng(seed)
+    probas = rng.dirichlet(np.ones(n_classes) * 0.7, n)
+    probas[:5] = np.eye(n_classes)[rng.integers(0, n_classes, 5)]  # saturated rows hit the clipping
+    return probas, rng.integers(0, n_classes, n)
+
+
+def reference_sweep(probas, y, thresholds):
+    """The per-(class, threshold) loop the log-loss plot used to run."""
+    n_classes = probas.shape[1]
+    surfaces = {name: np.empty((n_classes, len(thresholds))) for name in ('log_loss', 'recall', 'f1')}
+    for c in range(n_classes):
+        for j, t in enumerate(thresholds):
+            adjusted = probas.copy()
+            adjusted[:, c] /= t
+            adjusted /= adjusted.sum(axis=1, keepdims=True)
+            preds = np.argmax(adjusted, axis=1)
+            clipped = np.clip(adjusted, 1e-15, 1 - 1e-15)
+            surfaces['log_loss'][c, j] = -np.log(clipped[np.arange(len(y)), y]).mean()
+            surfaces['recall'][c, j] = recall_score(y, preds, average='weighted', zero_division=0)
+            surfaces['f1'][c, j] = f1_score(y, preds, average='weighted', zero_division=0)
+    return surfaces
+
+
+@pytest.mark.parametrize('max_elements', [2 ** 22, 1000])
+def test_sweep_matches_per_threshold_loop(max_elements):
+    probas, y = _probas()
+    thresholds = np.linspace(0.01, 1.0, 23)
+    surfaces = sweep_thresholds(probas, y, thresholds, max_elements=max_elements)
+    expected = reference_sweep(probas, y, thresholds)
+    for name in ('log_loss', 'recall', 'f1'):
+        np.testing.assert_allclose(surfaces[name], expected[name], rtol=1e-10, atol=1e-12)
+
+
+def test_log_loss_at_threshold_one_is_sklearn_log_loss():
+    probas, y = _probas(seed=1)
+    surface = sweep_thresholds(probas, y, [1.0], metrics=('log_loss',))
+    assert set(surface) == {'log_loss'}
+    clipped = np.clip(probas, 1e-15, 1 - 1e-15)
+    expected = log_loss(y, clipped / clipped.sum(axis=1, keepdims=True), labels=range(4))
+    np.testing.assert_allclose(surface['log_loss'][:, 0], expected, rtol=1e-6)
+
+
+def test_unknown_metric_is_rejected():
+    probas, y = _probas()
+    with pytest.raises(ValueError, match='Unknown sweep metrics'):
+        sweep_thresholds(probas, y, metrics=('accuracy',))
+
+
+def test_plot_draws_one_line_per_class():
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(200, 3))
+    y = (X[:, 0] > 0).astype(int) + (X[:, 1] > 0).astype(int)
+    model = DecisionTreeClassifier(max_depth=3, random_state=0).fit(X, y)
+    fig = plot_log_loss_vs_threshold_multiclass_all_in_one(model, X, y, metric='f1', show=False)
+    lines = fig.axes[0].get_lines()
+    assert len(lines) == 3 and len(lines[0].get_xdata()) == len(DEFAULT_THRESHOLDS)
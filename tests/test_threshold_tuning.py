@@ -0,0 +1,73 @@
+import numpy as np
+import optuna
+import pytest
+from sklearn.metrics import confusion_matrix, f1_score, recall_score
+
+import threshold_tuning
+from batched_metrics import batched_confusion, threshold_predictions, weighted_recall_f1
+from threshold_tuning import optimize_svm_threshold_recall, optimize_thresholds
+
+
+def _probas(n=300, n_classes=3, seed=0):
+    rng = np.random.default_rng(seed)
+    probas = rng.dirichlet(np.ones(n_classes), n)
+    y = rng.integers(0, n_classes, n)
+    return probas, y
+
+
+def test_batched_metrics_match_sklearn():
+    probas, y = _probas()
+    thresholds = np.random.default_rng(1).uniform(0.1, 1.0, (20, 3))
+    preds = threshold_predictions(probas, thresholds)
+    confusion = batched_confusion(y, preds, 3)
+    recall, f1 = weighted_recall_f1(confusion)
+    for i, pred in enumerate(preds):
+        np.testing.assert_array_equal(pred, np.argmax(probas / thresholds[i], axis=1))
+        np.testing.assert_array_equal(confusion[i], confusion_matrix(y, pred, labels=[0, 1, 2]))
+        assert recall[i] == pytest.approx(recall_score(y, pred, average='weighted', zero_division=0))
+        assert f1[i] == pytest.approx(f1_score(y, pred, average='weighted', zero_division=0))
+
+
+def test_optimize_thresholds_matches_per_vector_loop():
+    probas, y = _probas()
+    thresholds, recall, f1 = optimize_thresholds(probas, y, n_samples=200, batch_size=37, random_state=0)
+
+    rng = np.random.default_rng(0)
+    candidates = np.vstack([np.ones((1, 3)), rng.uniform(0.1, 1.0, size=(200, 3))])
+    scores = [(recall_score(y, pred, average='weighted', zero_division=0),
+               f1_score(y, pred, average='weighted', zero_division=0))
+              for pred in np.argmax(probas[None] / candidates[:, None], axis=2)]
+    assert (recall, f1) == pytest.approx(max(scores))
+    np.testing.assert_array_equal(thresholds, candidates[scores.index(max(scores))])
+
+
+def _dataset(n=120, seed=0):
+    rng = np.random.default_rng(seed)
+    X = rng.normal(size=(n, 4))
+    y = (X[:, 0] > 0).astype(int) + (X[:, 1] > 1).astype(int)
+    return X[:80], y[:80], X[80:], y[80:]
+
+
+def test_resumed_study_refits_the_same_model():
+    X_train, y_train, X_dev, y_dev = _dataset()
+    storage = optuna.storages.InMemoryStorage()
+    kwargs = dict(n_trials=2, pruner='none', n_threshold_samples=50, storage=storage, study_name='svc')
+    first, first_thresholds, first_recall = optimize_svm_threshold_recall(X_train, y_train, X_dev, y_dev, **kwargs)
+    # Every trial already ran: the best model is refitted from the stored parameters
+    resumed, thresholds, recall = optimize_svm_threshold_recall(X_train, y_train, X_dev, y_dev, **kwargs)
+
+    assert len(optuna.load_study(study_name='svc', storage=storage).trials) == 2
+    assert resumed is not first
+    assert recall == first_recall
+    np.testing.assert_array_equal(thresholds, first_thresholds)
+    np.testing.assert_array_equal(resumed.predict_proba(X_dev), first.predict_proba(X_dev))
+
+
+def test_study_without_completed_trials_raises(monkeypatch):
+    def prune(*args, **kwargs):
+        raise optuna.TrialPruned()
+
+    monkeypatch.setattr(threshold_tuning, 'fit_with_subset_halving', prune)
+    X_train, y_train, X_dev, y_dev = _dataset()
+    with pytest.raises(RuntimeError, match='all pruned or failed'):
+        optimize_svm_threshold_recall(X_train, y_train, X_dev, y_dev, n_trials=2, pruner='none')
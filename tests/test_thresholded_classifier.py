@@ -0,0 +1,43 @@
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.tree import DecisionTreeClassifier
+
+from thresholded_classifier import ThresholdedClassifier
+
+
+def _fitted(n=500, seed=0):
+    rng = np.random.default_rng(seed)
+    X = pd.DataFrame(rng.normal(size=(n, 3)), columns=['a', 'b', 'c'])
+    y = np.array([3, 5, 7])[(X['a'] > 0).astype(int) + (X['b'] > 0.5).astype(int)]
+    model = DecisionTreeClassifier(max_depth=4, random_state=0).fit(X, y)
+    return ThresholdedClassifier(model, [0.9, 0.4, 0.7], chunk_size=64), X
+
+
+def test_chunked_outputs_match_one_pass():
+    classifier, X = _fitted()
+    probas = classifier.model.predict_proba(X) / classifier.thresholds
+    probas /= probas.sum(axis=1, keepdims=True)
+    np.testing.assert_allclose(classifier.predict_proba(X), probas)
+    np.testing.assert_array_equal(classifier.predict(X), classifier.classes_[np.argmax(probas, axis=1)])
+    np.testing.assert_array_equal(classifier.predict(X.to_numpy()), classifier.predict(X))
+
+
+def test_empty_input():
+    classifier, X = _fitted()
+    assert classifier.predict_proba(X.iloc[:0]).shape == (0, 3)
+    predictions = classifier.predict(X.iloc[:0])
+    assert predictions.shape == (0,) and predictions.dtype == classifier.classes_.dtype
+
+
+def test_threshold_shape_is_checked():
+    classifier, _ = _fitted()
+    with pytest.raises(ValueError, match='Expected 3 thresholds'):
+        ThresholdedClassifier(classifier.model, [1.0, 1.0])
+
+
+def test_save_and_load(tmp_path):
+    classifier, X = _fitted()
+    classifier.save(str(tmp_path / 'model.joblib'))
+    loaded = ThresholdedClassifier.load(str(tmp_path / 'model.joblib'))
+    np.testing.assert_array_equal(loaded.predict(X), classifier.predict(X))
@@ -0,0 +1,46 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from tuning_orchestrator import MODEL_FAMILIES, tune_all_models
+from tuning_models import build_model
+
+
+def _data(n=300, seed=0):
+    rng = np.random.default_rng(seed)
+    X = pd.DataFrame(rng.normal(size=(n, 4)), columns=list('abcd'))
+    y = (X['a'] > 0).astype(int).to_numpy() + (X['b'] > 0.5).astype(int).to_numpy()
+    return X.iloc[:200], y[:200], X.iloc[200:], y[200:]
+
+
+def test_workers_share_one_study_per_family(tmp_path):
+    X_train, y_train, X_dev, y_dev = _data()
+    best_models, leaderboard = tune_all_models(X_train, y_train, X_dev, y_dev, families=['tree', 'knn'],
+                                               n_trials=4, workers_per_study=2, cpu_budget=2,
+                                               storage_dir=str(tmp_path), pruner='none')
+    assert set(best_models) == {'tree', 'knn'}
+    assert sorted(leaderboard['family']) == ['knn', 'tree']
+    assert (leaderboard['n_trials'] == 4).all()
+    assert leaderboard['best_f1'].is_monotonic_decreasing
+    for _, row in leaderboard.iterrows():
+        model = best_models[row['family']]
+        params = model.get_params()
+        assert all(params[name] == value for name, value in row['best_params'].items())
+
+
+def test_resumed_studies_add_trials(tmp_path):
+    X_train, y_train, X_dev, y_dev = _data()
+    kwargs = dict(families=['tree'], n_trials=2, cpu_budget=1, storage_dir=str(tmp_path), pruner='none')
+    tune_all_models(X_train, y_train, X_dev, y_dev, **kwargs)
+    _, leaderboard = tune_all_models(X_train, y_train, X_dev, y_dev, **kwargs)
+    assert leaderboard.loc[0, 'n_trials'] == 4
+
+
+@pytest.mark.parametrize('family', list(MODEL_FAMILIES))
+def test_build_model_knows_every_family(family):
+    assert hasattr(build_model(family, {}, n_threads=1), 'fit')
+
+
+def test_build_model_rejects_unknown_family():
+    with pytest.raises(ValueError, match='Unknown model family'):
+        build_model('xgboost', {})
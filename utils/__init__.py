@@ -1 +1,2 @@
-from .retrieve_and_save_data import retrieve_data, save_data
\ No newline at end of file
+from .retrieve_and_save_data import retrieve_data, save_data
+from .report_renderer import ReportRenderer
\ No newline at end of file
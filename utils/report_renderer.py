@@ -0,0 +1,190 @@
+import base64
+import glob
+import inspect
+import io
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import joblib
+
+from src.preprocess.step_cache import hash_bytes, hash_file
+
+MANIFEST_NAME = 'manifest.json'
+# Keyword arguments that only speed a plot up (shared caches, parallelism) and do not change it
+NON_INPUT_KWARGS = ('context', 'n_jobs')
+
+_package_hashes = {}
+
+
+def package_hash(source: str) -> str:
+    """
+    Hash of every Python file next to `source`. Plot functions call helpers of
+    their own package (threshold sweeps, learning-curve service, EDA aggregation),
+    so an edit to any of them must change the figures' fingerprints.
+    """
+    directory = os.path.dirname(os.path.abspath(source))
+    if directory not in _package_hashes:
+        files = sorted(glob.glob(os.path.join(directory, '*.py')))
+        _package_hashes[directory] = hash_bytes(*[hash_file(path) for path in files])
+    return _package_hashes[directory]
+
+
+class FigureJob:
+    """One figure of a report: `func(*args, show=False, **kwargs)` must return it."""
+
+    def __init__(self, name, func, args, kwargs, formats):
+        self.name = name
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.formats = tuple(formats)
+
+    def key(self) -> str:
+        """Fingerprint of the plotting code (with its package) and every input that shapes the figure."""
+        source = inspect.getsourcefile(self.func)
+        inputs = {name: value for name, value in self.kwargs.items() if name not in NON_INPUT_KWARGS}
+        return joblib.hash((self.func.__module__, self.func.__qualname__, package_hash(source),
+                            self.args, inputs, self.formats))
+
+
+def _save_matplotlib(fig, base, formats):
+    files = []
+    png = io.BytesIO()
+    fig.savefig(png, format='png', dpi=120, bbox_inches='tight')
+    if 'png' in formats:
+        with open(f"{base}.png", 'wb') as f:
+            f.write(png.getvalue())
+        files.append(f"{base}.png")
+    if 'html' in formats:
+        encoded = base64.b64encode(png.getvalue()).decode('ascii')
+        with open(f"{base}.html", 'w', encoding='utf-8') as f:
+            f.write(f'<!DOCTYPE html>\n<html><body><img src="data:image/png;base64,{encoded}"></body></html>\n')
+        files.append(f"{base}.html")
+    return files
+
+
+def _save_plotly(fig, base, formats):
+    files = []
+    if 'html' in formats:
+        fig.write_html(f"{base}.html", include_plotlyjs='cdn')
+        files.append(f"{base}.html")
+    if 'png' in formats:
+        try:
+            fig.write_image(f"{base}.png")
+            files.append(f"{base}.png")
+        except (ImportError, ValueError, RuntimeError) as e:
+            # Static export needs the optional kaleido package
+            print(f"⚠️ PNG export skipped for '{os.path.basename(base)}': {e}")
+    return files
+
+
+def _render(job, output_dir):
+    """Worker: draw one figure with the Agg backend and write its artifacts."""
+    import matplotlib
+    matplotlib.use('Agg', force=True)
+    import matplotlib.pyplot as plt
+
+    start = time.perf_counter()
+    fig = job.func(*job.args, show=False, **job.kwargs)
+    base = os.path.join(output_dir, job.name)
+    if hasattr(fig, 'write_html'):
+        files = _save_plotly(fig, base, job.formats)
+    else:
+        files = _save_matplotlib(fig, base, job.formats)
+    plt.close('all')
+    return [os.path.basename(path) for path in files], time.perf_counter() - start
+
+
+class ReportRenderer:
+    """
+    Headless, parallel renderer for evaluation and EDA figures.
+
+    Figures are declared with `add` and drawn by `render` on a process pool with
+    the non-interactive Agg backend; plot functions are called with `show=False`
+    and must return their figure (matplotlib or plotly). Matplotlib figures are
+    written as PNG (and an HTML page embedding it), plotly figures as HTML (and
+    PNG when kaleido is installed).
+
+    `<output_dir>/manifest.json` records a fingerprint of each figure's plotting
+    code (every module of its package) and inputs; figures whose fingerprint and
+    files are unchanged since the last render are skipped. Figures that start
+    their own processes should be limited to `jobs_per_figure` of them.
+    """
+
+    def __init__(self, output_dir='./reports', max_workers=None):
+        self.output_dir = output_dir
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.jobs = []
+
+    @property
+    def jobs_per_figure(self) -> int:
+        """Processes a figure may start itself (e.g. plot_learning_curve's `n_jobs`) without oversubscribing."""
+        return max(1, (os.cpu_count() or 1) // self.max_workers)
+
+    def add(self, name, func, *args, formats=('png', 'html'), **kwargs):
+        self.jobs.append(FigureJob(name, func, args, kwargs, formats))
+        return self
+
+    def _load_manifest(self):
+        path = os.path.join(self.output_dir, MANIFEST_NAME)
+        if not os.path.exists(path):
+            return {}
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+
+    def _save_manifest(self, manifest):
+        path = os.path.join(self.output_dir, MANIFEST_NAME)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(tmp_path, path)
+
+    def _is_current(self, entry, key):
+        return (entry is not None and entry['key'] == key
+                and all(os.path.exists(os.path.join(self.output_dir, name)) for name in entry['files']))
+
+    def render(self, force=False):
+        """
+        Render every figure whose inputs changed (all of them with `force`).
+
+        Returns {name: {'status': 'rendered' | 'skipped' | 'failed', 'files': [...]}}.
+        """
+        os.makedirs(self.output_dir, exist_ok=True)
+        manifest = self._load_manifest()
+        results, pending = {}, []
+        for job in self.jobs:
+            key = job.key()
+            if not force and self._is_current(manifest.get(job.name), key):
+                results[job.name] = {'status': 'skipped', 'files': manifest[job.name]['files']}
+            else:
+                pending.append((job, key))
+
+        def record(job, key, outcome):
+            try:
+                files, seconds = outcome()
+            except Exception as e:
+                print(f"⚠️ Could not render '{job.name}': {e}")
+                results[job.name] = {'status': 'failed', 'files': []}
+                return
+            manifest[job.name] = {'key': key, 'files': files}
+            results[job.name] = {'status': 'rendered', 'files': files}
+            print(f"🖼️ Rendered {job.name} in {seconds:.2f}s")
+
+        workers = min(self.max_workers, len(pending))
+        if workers <= 1:
+            for job, key in pending:
+                record(job, key, lambda: _render(job, self.output_dir))
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = [(job, key, pool.submit(_render, job, self.output_dir)) for job, key in pending]
+                for job, key, future in futures:
+                    record(job, key, future.result)
+
+        self._save_manifest(manifest)
+        counts = {status: sum(result['status'] == status for result in results.values())
+                  for status in ('rendered', 'skipped', 'failed')}
+        print(f"📁 Report in {self.output_dir}: {counts['rendered']} rendered, {counts['skipped']} unchanged, "
+              f"{counts['failed']} failed")
+        return results
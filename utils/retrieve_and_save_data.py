@@ -1,6 +1,7 @@
 from dotenv import load_dotenv
 import os
 import pandas as pd
+from src.preprocess.raw_loader import load_raw_data, is_local_workbook
 
 load_dotenv()
 file_id = os.getenv("FILE_ID")
@@ -11,8 +12,11 @@ def retrieve_data(file_id = file_id):
 
     Parameters:
     url (str): The URL of the Google Sheets document in CSV format.
+    Local workbooks are read through the Parquet cache of `load_raw_data`.
     """
     try:
+        if is_local_workbook(file_id):
+            return load_raw_data(file_id)
         df = pd.read_excel(file_id, header=0)
         return df
     except Exception as e: